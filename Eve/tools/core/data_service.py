@@ -0,0 +1,118 @@
+"""
+Non-blocking data access for Eve Qt tools.
+
+DataService runs EveData queries and file system operations in a QThreadPool, so the UI does not freeze on big
+projects or network project roots. Each call returns concurrent.futures.Future, results are delivered to callbacks
+on the thread DataService lives in (UI thread):
+
+    data_service = DataService(eve_data)
+    data_service.submit('fetch_project_assets', project.id, callback=model_assets.append_items)
+
+Any object with EveData methods can be used as data source, so the service runs headless with a stub database.
+"""
+
+
+import traceback
+from concurrent.futures import Future
+from PySide6 import QtCore
+from .database import connection
+
+
+class Task(QtCore.QRunnable):
+    """
+    Run one function in a pool thread and report result to DataService
+    """
+
+    def __init__(self, data_service, task_id, function, args, kwargs, future):
+        super(Task, self).__init__()
+
+        self.data_service = data_service
+        self.task_id = task_id
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+
+    def run(self):
+
+        # Task was cancelled before start
+        if not self.future.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        except Exception as exception:
+            traceback.print_exc()
+            self.future.set_exception(exception)
+            self.data_service.failed.emit(self.task_id, exception)
+        else:
+            self.future.set_result(result)
+            self.data_service.finished.emit(self.task_id, result)
+        finally:
+            # Pool thread gets new thread state (and new connection) for the next task, close this one
+            connection.close_thread_connections()
+
+
+class DataService(QtCore.QObject):
+    # Emitted from pool threads, delivered to slots in the DataService thread
+    finished = QtCore.Signal(int, object)
+    failed = QtCore.Signal(int, object)
+
+    def __init__(self, data, max_threads=4, parent=None):
+        super(DataService, self).__init__(parent)
+
+        self.data = data  # EveData instance or stub with the same methods
+        self.thread_pool = QtCore.QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_threads)
+
+        self.task_id = 0
+        self.callbacks = {}  # {task_id: (callback, error_callback)}
+
+        self.finished.connect(self.on_finished)
+        self.failed.connect(self.on_failed)
+
+    def submit(self, function, *args, callback=None, error_callback=None, **kwargs):
+        """
+        Run function in a pool thread
+
+        :param function: callable or string, name of data source method ('fetch_project_assets')
+        :param callback: called with function result in DataService thread
+        :param error_callback: called with exception in DataService thread
+        :return: concurrent.futures.Future
+        """
+
+        if isinstance(function, str):
+            function = getattr(self.data, function)
+
+        self.task_id += 1
+        future = Future()
+        if callback or error_callback:
+            self.callbacks[self.task_id] = (callback, error_callback)
+
+        self.thread_pool.start(Task(self, self.task_id, function, args, kwargs, future))
+
+        return future
+
+    def on_finished(self, task_id, result):
+
+        callback, error_callback = self.callbacks.pop(task_id, (None, None))
+        if callback:
+            callback(result)
+
+    def on_failed(self, task_id, exception):
+
+        callback, error_callback = self.callbacks.pop(task_id, (None, None))
+        if error_callback:
+            error_callback(exception)
+        else:
+            print('>> ERROR! Data request failed: {}'.format(exception))
+
+    def wait(self, timeout=-1):
+        """
+        Block until all tasks are done (tests, application exit)
+
+        :param timeout: integer, milliseconds, -1 to wait forever
+        :return: True if all tasks are done
+        """
+
+        return self.thread_pool.waitForDone(timeout)
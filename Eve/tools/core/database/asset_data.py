@@ -17,14 +17,15 @@ Asset configuration:
 
 # TODO: design asset configuration
 
-import sqlite3
 from . import entities
+from . import connection
 
 
 class AssetData:
     def __init__(self, SQL_FILE_PATH, asset_id):
         # Load database
         self.SQL_FILE_PATH = SQL_FILE_PATH
+        self.database = connection.get_manager(SQL_FILE_PATH)
         self.asset_id = asset_id
 
         # Data attributes
@@ -40,15 +41,12 @@ class AssetData:
         self.asset_type = self.asset.get_type()
 
     def get_asset(self, asset_id):
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM assets WHERE id=:id",
                        {'id': asset_id})
 
         asset_tuple = cursor.fetchone()
 
-        connection.close()
-
         if asset_tuple:
             return entities.Converter.convert_to_asset([asset_tuple])[0]
@@ -0,0 +1,130 @@
+"""
+Identity map for database entities.
+
+Keep one entity object per (table, id) so repeated lookups of the same project, sequence, shot or asset don't hit the
+database. Entries are evicted in LRU order, CRUD methods invalidate them on write and the whole map is cleared when
+another connection (Houdini session, other Project Manager) commits to the database ("PRAGMA data_version" changes).
+
+One map is shared by all EveData instances of the database file, as connections are (connection.get_manager):
+
+    identity_map = cache.get_identity_map(SQL_FILE_PATH)
+"""
+
+
+import threading
+from collections import OrderedDict
+
+
+class IdentityMap:
+    def __init__(self, size=10000):
+
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+
+        self._entities = OrderedDict()  # {(table, id): entity}
+        self._data_version = None  # data_version of ConnectionManager version connection at the last check
+        self._lock = threading.RLock()
+
+    def get(self, table, entity_id):
+        """
+        Get cached entity, return None on miss
+        """
+
+        key = (table, entity_id)
+
+        with self._lock:
+            entity = self._entities.get(key)
+            if entity is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entities.move_to_end(key)
+
+        return entity
+
+    def add(self, table, entity):
+        """
+        Record entity object, replace existing one with the same id
+        """
+
+        key = (table, entity.id)
+
+        with self._lock:
+            self._entities[key] = entity
+            self._entities.move_to_end(key)
+            while len(self._entities) > self.size:
+                self._entities.popitem(last=False)
+
+    def merge(self, table, entities):
+        """
+        Replace loaded entities with cached objects of the same id and cache the rest.
+
+        :param entities: list of entity objects loaded from database
+        :return: list of entity objects, one object per id
+        """
+
+        merged = []
+
+        with self._lock:
+            for entity in entities:
+                key = (table, entity.id)
+                cached = self._entities.get(key)
+                if cached is None:
+                    self._entities[key] = entity
+                    merged.append(entity)
+                else:
+                    self._entities.move_to_end(key)
+                    merged.append(cached)
+
+            while len(self._entities) > self.size:
+                self._entities.popitem(last=False)
+
+        return merged
+
+    def invalidate(self, table, entity_id):
+
+        with self._lock:
+            self._entities.pop((table, entity_id), None)
+
+    def clear(self):
+
+        with self._lock:
+            self._entities.clear()
+
+    def sync(self, data_version):
+        """
+        Clear cache if database was modified by other connection since the last check.
+
+        :param data_version: integer, ConnectionManager.get_data_version(), always read from the same connection
+        """
+
+        with self._lock:
+            if self._data_version != data_version:
+                self._data_version = data_version
+                self._entities.clear()
+
+    def get_stats(self):
+
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'size': len(self._entities)}
+
+
+_identity_maps = {}
+_identity_maps_lock = threading.Lock()
+
+
+def get_identity_map(SQL_FILE_PATH):
+    """
+    Get shared IdentityMap for the database file
+    """
+
+    with _identity_maps_lock:
+        identity_map = _identity_maps.get(SQL_FILE_PATH)
+        if identity_map is None:
+            identity_map = IdentityMap()
+            _identity_maps[SQL_FILE_PATH] = identity_map
+
+    return identity_map
@@ -0,0 +1,179 @@
+"""
+Long-lived SQLite connections for Eve database files.
+
+Opening a connection per query means a file open, schema parse and fsync for every CRUD call.
+ConnectionManager keeps one connection per thread for each database file, tunes it once with pragmas
+and provides explicit transaction scopes:
+
+    database = connection.get_manager(SQL_FILE_PATH)
+    cursor = database.cursor()                    # Read
+    with database.transaction() as cursor:        # Write, committed on exit, rolled back on error
+        cursor.execute(...)
+"""
+
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+# Applied once to every new connection
+PRAGMAS = (
+    'PRAGMA journal_mode=WAL',      # Readers don't block the writer (Project Manager + Houdini sessions)
+    'PRAGMA synchronous=NORMAL',    # Safe with WAL, no fsync on every commit
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-16000',     # 16 MB page cache
+    'PRAGMA busy_timeout=5000')     # Wait for other writers instead of failing with "database is locked"
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+class ConnectionManager:
+    """
+    One SQLite connection per thread for a single database file.
+    Connections live until close() or close_all() is called. Connection left open by a finished thread is closed when
+    a new connection is opened in a thread with the same id (pool threads get new thread state for every task).
+    """
+
+    def __init__(self, SQL_FILE_PATH):
+
+        self.SQL_FILE_PATH = SQL_FILE_PATH
+
+        self._local = threading.local()
+        self._connections = {}  # {thread id: connection}
+        self._lock = threading.Lock()
+        self._version_connection = None  # Long-lived connection used only to read data_version
+
+    def open_connection(self):
+        """
+        Open new tuned connection in autocommit mode: transactions are opened explicitly in transaction()
+        """
+
+        connection = sqlite3.connect(self.SQL_FILE_PATH, isolation_level=None, check_same_thread=False)
+        for pragma in PRAGMAS:
+            connection.execute(pragma)
+
+        return connection
+
+    def connect(self):
+        """
+        Get connection of the current thread, open it on first use
+        """
+
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self.open_connection()
+
+            self._local.connection = connection
+            self._local.depth = 0
+            with self._lock:
+                orphan = self._connections.pop(threading.get_ident(), None)
+                self._connections[threading.get_ident()] = connection
+
+            if orphan is not None:
+                orphan.close()
+
+        return connection
+
+    def cursor(self):
+
+        return self.connect().cursor()
+
+    @contextmanager
+    def transaction(self, mode='DEFERRED'):
+        """
+        Transaction scope. Nested scopes join the outer one, commit happens when the outermost scope exits.
+
+        :param mode: string, 'DEFERRED', 'IMMEDIATE' or 'EXCLUSIVE' (SQLite BEGIN mode)
+        """
+
+        connection = self.connect()
+        outer = self._local.depth == 0
+        if outer:
+            connection.execute('BEGIN {0}'.format(mode))
+        self._local.depth += 1
+
+        try:
+            yield connection.cursor()
+        except BaseException:
+            self._local.depth -= 1
+            if outer:
+                connection.execute('ROLLBACK')
+            raise
+        else:
+            self._local.depth -= 1
+            if outer:
+                connection.execute('COMMIT')
+
+    def get_data_version(self):
+        """
+        Get "PRAGMA data_version" of one long-lived connection which never writes.
+        Value changes when any other connection (thread of this process or other process) commits to the database,
+        values of different connections are not comparable.
+        """
+
+        with self._lock:
+            if self._version_connection is None:
+                self._version_connection = self.open_connection()
+
+            return self._version_connection.execute('PRAGMA data_version').fetchone()[0]
+
+    def close(self):
+        """
+        Close connection of the current thread
+        """
+
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            return
+
+        with self._lock:
+            if self._connections.get(threading.get_ident()) is connection:
+                del self._connections[threading.get_ident()]
+        connection.close()
+        self._local.connection = None
+
+    def close_all(self):
+        """
+        Close connections of all threads
+        """
+
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections = {}
+            if self._version_connection is not None:
+                connections.append(self._version_connection)
+                self._version_connection = None
+
+        for connection in connections:
+            connection.close()
+
+        # Threads open a new connection on next use
+        self._local = threading.local()
+
+
+def get_manager(SQL_FILE_PATH):
+    """
+    Get shared ConnectionManager for the database file, so EveData and AssetData instances reuse connections
+    """
+
+    with _managers_lock:
+        manager = _managers.get(SQL_FILE_PATH)
+        if manager is None:
+            manager = ConnectionManager(SQL_FILE_PATH)
+            _managers[SQL_FILE_PATH] = manager
+
+    return manager
+
+
+def close_thread_connections():
+    """
+    Close connections of the current thread to all database files (end of DataService task)
+    """
+
+    with _managers_lock:
+        managers = list(_managers.values())
+
+    for manager in managers:
+        manager.close()
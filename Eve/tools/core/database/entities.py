@@ -1,9 +1,17 @@
 """
 Database entities classes for all tables
+
+Entities loaded from database are created in big numbers (all shots of a project), so main entity classes use
+__slots__ and Converter fills them directly from database tuples.
 """
 
 
+from typing import NamedTuple
+
+
 class Project:
+    __slots__ = ('id', 'name', 'houdini_build', 'width', 'height', 'description')
+
     def __init__(self, project_name):
         self.id = None
         self.name = project_name
@@ -12,8 +20,21 @@ class Project:
         self.height = None
         self.description = ''
 
+    @classmethod
+    def from_tuple(cls, project_tuple):
+        """
+        Create project from database tuple (id, name, houdini_build, width, height, description)
+        """
+
+        project = cls.__new__(cls)
+        project.id, project.name, project.houdini_build, project.width, project.height, project.description = project_tuple
+
+        return project
+
 
 class Asset:
+    __slots__ = ('id', 'name', 'project', 'type', 'description')
+
     asset_types = {
         'character':
             {'id': 1,
@@ -47,6 +68,17 @@ class Asset:
         self.type = None
         self.description = ''
 
+    @classmethod
+    def from_tuple(cls, asset_tuple):
+        """
+        Create asset from database tuple (id, name, project, type, description)
+        """
+
+        asset = cls.__new__(cls)
+        asset.id, asset.name, asset.project, asset.type, asset.description = asset_tuple
+
+        return asset
+
     def get_type(self):
 
         # Detect asset type, return type string ('character')
@@ -56,14 +88,29 @@ class Asset:
 
 
 class Sequence:
+    __slots__ = ('id', 'name', 'project', 'description')
+
     def __init__(self, sequence_name, project_id):
         self.id = None
         self.name = sequence_name
         self.project = project_id
         self.description = ''
 
+    @classmethod
+    def from_tuple(cls, sequence_tuple):
+        """
+        Create sequence from database tuple (id, name, project, description)
+        """
+
+        sequence = cls.__new__(cls)
+        sequence.id, sequence.name, sequence.project, sequence.description = sequence_tuple
+
+        return sequence
+
 
 class Shot:
+    __slots__ = ('id', 'name', 'sequence', 'start_frame', 'end_frame', 'width', 'height', 'description')
+
     def __init__(self, shot_name, sequence_id):
         self.id = None
         self.name = shot_name
@@ -74,8 +121,22 @@ class Shot:
         self.height = ''
         self.description = ''
 
+    @classmethod
+    def from_tuple(cls, shot_tuple):
+        """
+        Create shot from database tuple (id, name, sequence, start_frame, end_frame, width, height, description)
+        """
+
+        shot = cls.__new__(cls)
+        (shot.id, shot.name, shot.sequence, shot.start_frame, shot.end_frame,
+         shot.width, shot.height, shot.description) = shot_tuple
+
+        return shot
+
 
 class AssetType:
+    __slots__ = ('id', 'name', 'description')
+
     def __init__(self, id, name, description):
         self.id = id
         self.name = name
@@ -143,6 +204,23 @@ class Variation:
         self.description = ''
 
 
+# Project tree, loaded with EveData.get_project_tree()
+class ShotNode(NamedTuple):
+    shot: Shot
+    assets: list  # Assets linked to the shot
+
+
+class SequenceNode(NamedTuple):
+    sequence: Sequence
+    shots: list  # ShotNode list
+
+
+class ProjectTree(NamedTuple):
+    project: Project
+    assets: list  # All project assets
+    sequences: list  # SequenceNode list
+
+
 class Converter:
     """
     Convert data from DB to Athena objects
@@ -157,17 +235,7 @@ class Converter:
         :return:
         """
 
-        projects = []
-        for project_tuple in project_tuples:
-            project = Project(project_tuple[1])
-            project.id = project_tuple[0]
-            project.houdini_build = project_tuple[2]
-            project.width = project_tuple[3]
-            project.height = project_tuple[4]
-            project.description = project_tuple[5]
-            projects.append(project)
-
-        return projects
+        return list(map(Project.from_tuple, project_tuples))
 
     @staticmethod
     def convert_to_asset(asset_tuples):
@@ -177,16 +245,7 @@ class Converter:
         :return:
         """
 
-        assets = []
-
-        for asset_tuple in asset_tuples:
-            asset = Asset(asset_tuple[1], asset_tuple[2])
-            asset.id = asset_tuple[0]
-            asset.type = asset_tuple[3]
-            asset.description = asset_tuple[4]
-            assets.append(asset)
-
-        return assets
+        return list(map(Asset.from_tuple, asset_tuples))
 
     @staticmethod
     def convert_to_sequence(sequence_tuples):
@@ -196,15 +255,7 @@ class Converter:
         :return:
         """
 
-        sequences = []
-
-        for sequence_tuple in sequence_tuples:
-            sequence = Sequence(sequence_tuple[1], sequence_tuple[2])
-            sequence.id = sequence_tuple[0]
-            sequence.description = sequence_tuple[3]
-            sequences.append(sequence)
-
-        return sequences
+        return list(map(Sequence.from_tuple, sequence_tuples))
 
     @staticmethod
     def convert_to_shot(shot_tuples):
@@ -214,19 +265,7 @@ class Converter:
         :return:
         """
 
-        shots = []
-
-        for shot_tuple in shot_tuples:
-            shot = Shot(shot_tuple[1], shot_tuple[2])
-            shot.id = shot_tuple[0]
-            shot.start_frame = shot_tuple[3]
-            shot.end_frame = shot_tuple[4]
-            shot.width = shot_tuple[5]
-            shot.height = shot_tuple[6]
-            shot.description = shot_tuple[7]
-            shots.append(shot)
-
-        return shots
+        return list(map(Shot.from_tuple, shot_tuples))
 
     @staticmethod
     def convert_to_asset_types(asset_types_tuples):
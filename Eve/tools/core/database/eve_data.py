@@ -3,14 +3,33 @@ Project Manager entities CRUD: materials, projects, assets, shots
 """
 
 
-import sqlite3
+import re
+import json
 from . import entities
+from . import connection
+from . import cache
+from . import migrations
+
+
+# Tables available for paged loading: {table: (parent column, converter)}
+PAGED_TABLES = {
+    'assets': ('project', entities.Converter.convert_to_asset),
+    'sequences': ('project', entities.Converter.convert_to_sequence),
+    'shots': ('sequence', entities.Converter.convert_to_shot)}
+
+# Entities in full text index: {table: (rowid remainder, converter)}, rowid = entity id * 2 + remainder
+SEARCH_TABLES = {
+    'assets': (0, entities.Converter.convert_to_asset),
+    'shots': (1, entities.Converter.convert_to_shot)}
 
 
 class EveData:
     def __init__(self, SQL_FILE_PATH):
         # Load database
         self.SQL_FILE_PATH = SQL_FILE_PATH
+        self.database = connection.get_manager(SQL_FILE_PATH)
+        migrations.upgrade(self.database)
+        self.cache = cache.get_identity_map(SQL_FILE_PATH)
 
         # Data attributes
         # INTERNAL SET
@@ -33,32 +52,55 @@ class EveData:
         self.get_projects()
         self.get_asset_types()
 
+    # Cache
+    def get_cached(self, table, entity_id):
+        """
+        Get entity from identity map, return None if entity was not loaded or database was changed by other connection
+        """
+
+        self.cache.sync(self.database.get_data_version())
+
+        return self.cache.get(table, entity_id)
+
+    def cache_entities(self, table, entity_objects):
+        """
+        Record loaded entities in identity map
+        :return: list of entity objects with already cached objects reused
+        """
+
+        self.cache.sync(self.database.get_data_version())
+
+        return self.cache.merge(table, entity_objects)
+
+    def get_cache_stats(self):
+
+        return self.cache.get_stats()
+
     # CRUD
     # Project
     def add_project(self, project):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
-
-        # Add project to DB
-        cursor.execute("INSERT INTO projects VALUES ("
-                       ":id,"
-                       ":name,"
-                       ":houdini_build,"
-                       ":width,"
-                       ":height,"
-                       ":description)",
-
-                       {'id': cursor.lastrowid,
-                        'name': project.name,
-                        'houdini_build': project.houdini_build,
-                        'width': project.width,
-                        'height': project.height,
-                        'description': project.description})
-
-        connection.commit()
-        project.id = cursor.lastrowid  # Add database ID to the project object
-        connection.close()
+        with self.database.transaction() as cursor:
+
+            # Add project to DB
+            cursor.execute("INSERT INTO projects VALUES ("
+                           ":id,"
+                           ":name,"
+                           ":houdini_build,"
+                           ":width,"
+                           ":height,"
+                           ":description)",
+
+                           {'id': None,
+                            'name': project.name,
+                            'houdini_build': project.houdini_build,
+                            'width': project.width,
+                            'height': project.height,
+                            'description': project.description})
+
+            project.id = cursor.lastrowid  # Add database ID to the project object
+
+        self.cache.add('projects', project)
 
         # Add project to data instance
         self.projects.append(project)
@@ -66,102 +108,252 @@ class EveData:
     def get_project(self, project_id):
         """ Get project by id """
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        project = self.get_cached('projects', project_id)
+        if project:
+            return project
+
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM projects WHERE id=:id",
                        {'id': project_id})
         project_tuple = cursor.fetchone()
-        project_object = entities.Converter.convert_to_project([project_tuple])[0]
 
-        connection.close()
+        if project_tuple:
+            project = entities.Converter.convert_to_project([project_tuple])[0]
+            self.cache.add('projects', project)
 
-        if project_object:
-            return project_object
+            return project
 
     def get_project_by_name(self, project_name):
         """ Get project by id """
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM projects WHERE name=:name",
                        {'name': project_name})
         project_tuple = cursor.fetchone()
-        project_object = entities.Converter.convert_to_project([project_tuple])[0]
-
-        connection.close()
 
-        if project_object:
-            return project_object
+        if project_tuple:
+            return self.cache_entities('projects', entities.Converter.convert_to_project([project_tuple]))[0]
 
     def get_projects(self):
         """ Get all project items from projects table in db """
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM projects")
         project_tuples = cursor.fetchall()
-        project_objects = entities.Converter.convert_to_project(project_tuples)
-
-        connection.close()
+        project_objects = self.cache_entities('projects', entities.Converter.convert_to_project(project_tuples))
 
         self.projects.extend(project_objects)
 
-    def get_project_assets(self, project):
-        """ Get all project assets from assets table in db """
+    def fetch_project_assets(self, project_id):
+        """
+        Return list of project assets without touching INTERNAL SET lists (safe to call from worker threads)
+        """
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM assets WHERE project=:project",
-                       {'project': project.id})
+                       {'project': project_id})
 
         asset_tuples = cursor.fetchall()
-        asset_objects = entities.Converter.convert_to_asset(asset_tuples)
 
-        connection.close()
+        return self.cache_entities('assets', entities.Converter.convert_to_asset(asset_tuples))
+
+    def fetch_page(self, table, parent_id, after=None, limit=200, name_filter='', descending=False):
+        """
+        Return one page of entities ordered by name (lazy list models)
+
+        :param table: string, 'assets', 'sequences' or 'shots'
+        :param parent_id: integer, project id for assets and sequences, sequence id for shots
+        :param after: tuple (name, id) of the last entity of the previous page, None for the first page
+        :param limit: integer, page size
+        :param name_filter: string, return only entities which names contain this string
+        :param descending: bool, sort names Z-A
+        :return: list of entity objects
+        """
+
+        parent_column, converter = PAGED_TABLES[table]
+        order = 'DESC' if descending else 'ASC'
+        conditions = ['{0}=:parent_id'.format(parent_column)]
+        parameters = {'parent_id': parent_id, 'limit': limit}
+
+        if name_filter:
+            conditions.append("name LIKE :name_filter ESCAPE '\\'")
+            name_filter = name_filter.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            parameters['name_filter'] = '%{0}%'.format(name_filter)
+
+        # Keyset pagination: continue after the last loaded row instead of OFFSET scanning
+        if after:
+            conditions.append('(name, id) {0} (:after_name, :after_id)'.format('<' if descending else '>'))
+            parameters['after_name'], parameters['after_id'] = after
+
+        cursor = self.database.cursor()
+        cursor.execute("SELECT * FROM {0} WHERE {1} ORDER BY name {2}, id {2} LIMIT :limit".format(
+                       table, ' AND '.join(conditions), order),
+                       parameters)
+
+        return self.cache_entities(table, converter(cursor.fetchall()))
+
+    def search(self, query, kinds=('assets', 'shots'), project_id=None, limit=50):
+        """
+        Find assets and shots by words in names and descriptions, each word is matched as prefix ("char" finds
+        "character_hero"). Results are ranked with bm25, name matches rank above description matches.
+
+        :param query: string, words typed by user
+        :param kinds: list of tables to search, 'assets' and/or 'shots'
+        :param project_id: integer, search only in this project, None to search all projects
+        :param limit: integer, maximum number of results
+        :return: list of tuples [(table, entity object)], best match first
+        """
+
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        conditions = ['entity_search MATCH :match']
+        parameters = {'match': match, 'limit': limit}
+
+        if project_id is not None:
+            conditions.append('project=:project')
+            parameters['project'] = project_id
+
+        remainders = [SEARCH_TABLES[kind][0] for kind in kinds]
+        if len(remainders) == 1:
+            conditions.append('rowid % 2 = :remainder')
+            parameters['remainder'] = remainders[0]
+
+        cursor = self.database.cursor()
+        cursor.execute("SELECT rowid FROM entity_search WHERE {0} "
+                       "ORDER BY bm25(entity_search, 10.0, 1.0) LIMIT :limit".format(' AND '.join(conditions)),
+                       parameters)
+
+        rowids = [row[0] for row in cursor.fetchall()]
+
+        # Load found entities with one query per table
+        found = {}
+        for kind in kinds:
+            remainder, converter = SEARCH_TABLES[kind]
+            entity_ids = [rowid // 2 for rowid in rowids if rowid % 2 == remainder]
+            if not entity_ids:
+                continue
+
+            cursor.execute("SELECT * FROM {0} WHERE id IN (SELECT value FROM json_each(:ids))".format(kind),
+                           {'ids': json.dumps(entity_ids)})
+
+            for entity in self.cache_entities(kind, converter(cursor.fetchall())):
+                found[entity.id * 2 + remainder] = (kind, entity)
+
+        return [found[rowid] for rowid in rowids if rowid in found]
+
+    def get_project_tree(self, project):
+        """
+        Load project assets, sequences, shots and shot asset links in two queries (folder structure, breakdowns).
+        INTERNAL SET lists are not modified (safe to call from worker threads).
+
+        :param project: Project object
+        :return: entities.ProjectTree, sequences and shots ordered by name, shot assets in link order
+        """
+
+        assets = self.fetch_project_assets(project.id)
+        assets_by_id = {asset.id: asset for asset in assets}
+
+        cursor = self.database.cursor()
+
+        # One row per shot asset link, sequences without shots and shots without assets are kept by LEFT JOIN
+        cursor.execute("SELECT sequences.id, sequences.name, sequences.project, sequences.description, "
+                       "shots.id, shots.name, shots.sequence, shots.start_frame, shots.end_frame, "
+                       "shots.width, shots.height, shots.description, "
+                       "shot_assets.asset_id "
+                       "FROM sequences "
+                       "LEFT JOIN shots ON shots.sequence = sequences.id "
+                       "LEFT JOIN shot_assets ON shot_assets.shot_id = shots.id "
+                       "WHERE sequences.project=:project "
+                       "ORDER BY sequences.name, sequences.id, shots.name, shots.id, shot_assets.id",
+                       {'project': project.id})
+
+        sequence_tuples = {}
+        shot_tuples = {}
+        links = []
+        for row in cursor.fetchall():
+            sequence_tuples.setdefault(row[0], row[:4])
+            if row[4] is not None:
+                shot_tuples.setdefault(row[4], row[4:12])
+                if row[12] is not None:
+                    links.append((row[4], row[12]))
+
+        sequences = self.cache_entities('sequences', entities.Converter.convert_to_sequence(sequence_tuples.values()))
+        shots = self.cache_entities('shots', entities.Converter.convert_to_shot(shot_tuples.values()))
+
+        # Build tree
+        sequence_nodes = {sequence.id: entities.SequenceNode(sequence, []) for sequence in sequences}
+        shot_nodes = {}
+        for shot in shots:
+            shot_nodes[shot.id] = entities.ShotNode(shot, [])
+            sequence_nodes[shot.sequence].shots.append(shot_nodes[shot.id])
+
+        for shot_id, asset_id in links:
+            asset = assets_by_id.get(asset_id)
+            if asset:
+                shot_nodes[shot_id].assets.append(asset)
+
+        return entities.ProjectTree(project, assets, list(sequence_nodes.values()))
+
+    def get_project_assets(self, project):
+        """ Get all project assets from assets table in db """
+
+        asset_objects = self.fetch_project_assets(project.id)
 
         # Clear list and append assets
         del self.project_assets[:]
         for asset in asset_objects:
             self.project_assets.append(asset)
 
-    def get_project_sequences(self, project):
-        """ Get all project sequences from sequences table in db """
+    def fetch_project_sequences(self, project_id):
+        """
+        Return list of project sequences without touching INTERNAL SET lists (safe to call from worker threads)
+        """
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM sequences WHERE project=:project",
-                       {'project': project.id})
+                       {'project': project_id})
 
         sequence_tuples = cursor.fetchall()
-        sequence_objects = entities.Converter.convert_to_sequence(sequence_tuples)
 
-        connection.close()
+        return self.cache_entities('sequences', entities.Converter.convert_to_sequence(sequence_tuples))
+
+    def get_project_sequences(self, project):
+        """ Get all project sequences from sequences table in db """
+
+        sequence_objects = self.fetch_project_sequences(project.id)
 
         # Clear list and append assets
         del self.project_sequences[:]
         for sequence in sequence_objects:
             self.project_sequences.append(sequence)
 
-    def get_sequence_shots(self, sequence_id):
+    def fetch_sequence_shots(self, sequence_id):
         """
-        Get all sequence shots from shots table in db
+        Return list of sequence shots without touching INTERNAL SET lists (safe to call from worker threads)
         """
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM shots WHERE sequence=:sequence",
                        {'sequence': sequence_id})
 
         shot_tuples = cursor.fetchall()
-        shot_objects = entities.Converter.convert_to_shot(shot_tuples)
 
-        connection.close()
+        return self.cache_entities('shots', entities.Converter.convert_to_shot(shot_tuples))
+
+    def get_sequence_shots(self, sequence_id):
+        """
+        Get all sequence shots from shots table in db
+        """
+
+        shot_objects = self.fetch_sequence_shots(sequence_id)
 
         # Clear list and append assets
         del self.sequence_shots[:]
@@ -170,38 +362,32 @@ class EveData:
 
     def update_project(self, project):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        with self.database.transaction() as cursor:
+            cursor.execute("UPDATE projects SET "
+                           "houdini_build=:houdini_build,"
+                           "width=:width,"
+                           "height=:height,"
+                           "description=:description "
 
-        cursor.execute("UPDATE projects SET "
-                       "houdini_build=:houdini_build,"
-                       "width=:width,"
-                       "height=:height,"
-                       "description=:description "
+                           "WHERE id=:id",
 
-                       "WHERE id=:id",
+                           {'id': project.id,
+                            'houdini_build': project.houdini_build,
+                            'width': project.width,
+                            'height': project.height,
+                            'description': project.description})
 
-                       {'id': project.id,
-                        'houdini_build': project.houdini_build,
-                        'width': project.width,
-                        'height': project.height,
-                        'description': project.description})
-
-        connection.commit()
-        connection.close()
+        self.cache.add('projects', project)
 
         return project
 
     def del_project(self, project_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
-
-        cursor.execute("DELETE FROM projects WHERE id=:id",
-                       {'id': project_id})
+        with self.database.transaction() as cursor:
+            cursor.execute("DELETE FROM projects WHERE id=:id",
+                           {'id': project_id})
 
-        connection.commit()
-        connection.close()
+        self.cache.invalidate('projects', project_id)
 
         for project in self.projects:
             if project.id == project_id:
@@ -210,47 +396,48 @@ class EveData:
     # Assets
     def add_asset(self, asset, project_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        with self.database.transaction() as cursor:
+            cursor.execute("INSERT INTO assets VALUES ("
+                           ":id,"
+                           ":name,"
+                           ":project,"
+                           ":type,"
+                           ":description)",
 
-        cursor.execute("INSERT INTO assets VALUES ("
-                       ":id,"
-                       ":name,"
-                       ":project,"
-                       ":type,"
-                       ":description)",
+                           {'id': None,
+                            'name': asset.name,
+                            'project': project_id,
+                            'type': asset.type,
+                            'description': asset.description})
 
-                       {'id': cursor.lastrowid,
-                        'name': asset.name,
-                        'project': project_id,
-                        'type': asset.type,
-                        'description': asset.description})
+            asset.id = cursor.lastrowid  # Add database ID to the asset object
 
-        connection.commit()
-        asset.id = cursor.lastrowid  # Add database ID to the asset object
-        connection.close()
+        self.cache.add('assets', asset)
 
         self.project_assets.append(asset)
 
     def get_asset(self, asset_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        asset = self.get_cached('assets', asset_id)
+        if asset:
+            return asset
+
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM assets WHERE id=:id",
                        {'id': asset_id})
 
         asset_tuple = cursor.fetchone()
 
-        connection.close()
-
         if asset_tuple:
-            return entities.Converter.convert_to_asset([asset_tuple])[0]
+            asset = entities.Converter.convert_to_asset([asset_tuple])[0]
+            self.cache.add('assets', asset)
+
+            return asset
 
     def get_asset_by_name(self, project_id, asset_name):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM assets WHERE "
                        "name=:name "
@@ -261,22 +448,17 @@ class EveData:
 
         asset_tuple = cursor.fetchone()
 
-        connection.close()
-
         if asset_tuple:
-            return entities.Converter.convert_to_asset([asset_tuple])[0]
+            return self.cache_entities('assets', entities.Converter.convert_to_asset([asset_tuple]))[0]
 
     def get_asset_types(self):
 
-        # connection = sqlite3.connect(self.SQL_FILE_PATH)
-        # cursor = connection.cursor()
+        # cursor = self.database.cursor()
         #
         # cursor.execute("SELECT * FROM asset_types")
         # asset_types_tuples = cursor.fetchall()
         # asset_types_objects = entities.Converter.convert_to_asset_types(asset_types_tuples)
         #
-        # connection.close()
-        #
         # self.asset_types.extend(asset_types_objects)
 
         for asset_type_name, asset_type_data in entities.Asset.asset_types.items():
@@ -299,42 +481,37 @@ class EveData:
 
     def update_asset(self, asset):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
-
-        cursor.execute("UPDATE assets SET "
-                       "project=:project,"
-                       "type=:type,"
-                       "description=:description "
+        with self.database.transaction() as cursor:
+            cursor.execute("UPDATE assets SET "
+                           "project=:project,"
+                           "type=:type,"
+                           "description=:description "
 
-                       "WHERE id=:id",
+                           "WHERE id=:id",
 
-                       {'id': asset.id,
-                        'project': asset.project,
-                        'type': asset.type,
-                        'description': asset.description})
+                           {'id': asset.id,
+                            'project': asset.project,
+                            'type': asset.type,
+                            'description': asset.description})
 
-        connection.commit()
-        connection.close()
+        self.cache.add('assets', asset)
 
         return asset
 
     def del_asset(self, asset_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        with self.database.transaction() as cursor:
 
-        # Delete ASSET
-        cursor.execute("DELETE FROM assets WHERE id=:id",
-                       {'id': asset_id})
+            # Delete ASSET
+            cursor.execute("DELETE FROM assets WHERE id=:id",
+                           {'id': asset_id})
 
-        # Delete asset LINK
-        cursor.execute("DELETE FROM shot_assets WHERE asset_id=:asset_id",
+            # Delete asset LINK
+            cursor.execute("DELETE FROM shot_assets WHERE asset_id=:asset_id",
 
-                       {'asset_id': asset_id})
+                           {'asset_id': asset_id})
 
-        connection.commit()
-        connection.close()
+        self.cache.invalidate('assets', asset_id)
 
         for asset in self.project_assets:
             if asset.id == asset_id:
@@ -343,69 +520,65 @@ class EveData:
     # Sequence
     def add_sequence(self, sequence, project_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        with self.database.transaction() as cursor:
+            cursor.execute("INSERT INTO sequences VALUES ("
+                           ":id,"
+                           ":name,"
+                           ":project,"
+                           ":description)",
 
-        cursor.execute("INSERT INTO sequences VALUES ("
-                       ":id,"
-                       ":name,"
-                       ":project,"
-                       ":description)",
+                           {'id': None,
+                            'name': sequence.name,
+                            'project': project_id,
+                            'description': sequence.description})
 
-                       {'id': cursor.lastrowid,
-                        'name': sequence.name,
-                        'project': project_id,
-                        'description': sequence.description})
+            sequence.id = cursor.lastrowid  # Add database ID to the sequence object
 
-        connection.commit()
-        sequence.id = cursor.lastrowid  # Add database ID to the sequence object
-        connection.close()
+        self.cache.add('sequences', sequence)
 
         self.project_sequences.append(sequence)
 
     def get_sequence(self, sequence_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        sequence = self.get_cached('sequences', sequence_id)
+        if sequence:
+            return sequence
+
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM sequences WHERE id=:id",
                        {'id': sequence_id})
 
         sequence_tuple = cursor.fetchone()
 
-        connection.close()
-
         if sequence_tuple:
-            return entities.Converter.convert_to_sequence([sequence_tuple])[0]
+            sequence = entities.Converter.convert_to_sequence([sequence_tuple])[0]
+            self.cache.add('sequences', sequence)
 
-    def update_sequence(self, sequence):
+            return sequence
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+    def update_sequence(self, sequence):
 
-        cursor.execute("UPDATE sequences SET "
-                       "description=:description "
+        with self.database.transaction() as cursor:
+            cursor.execute("UPDATE sequences SET "
+                           "description=:description "
 
-                       "WHERE id=:id",
+                           "WHERE id=:id",
 
-                       {'id': sequence.id,
-                        'description': sequence.description})
+                           {'id': sequence.id,
+                            'description': sequence.description})
 
-        connection.commit()
-        connection.close()
+        self.cache.add('sequences', sequence)
 
         return sequence
 
     def del_sequence(self, sequence_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
-
-        cursor.execute("DELETE FROM sequences WHERE id=:id",
-                       {'id': sequence_id})
+        with self.database.transaction() as cursor:
+            cursor.execute("DELETE FROM sequences WHERE id=:id",
+                           {'id': sequence_id})
 
-        connection.commit()
-        connection.close()
+        self.cache.invalidate('sequences', sequence_id)
 
         for sequence in self.project_sequences:
             if sequence.id == sequence_id:
@@ -414,107 +587,138 @@ class EveData:
     # Shot
     def add_shot(self, shot, sequence_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
-
-        cursor.execute("INSERT INTO shots VALUES ("
-                       ":id,"
-                       ":name,"
-                       ":sequence,"
-                       ":start_frame,"
-                       ":end_frame,"
-                       ":width,"
-                       ":height,"
-                       ":description)",
-
-                       {'id': cursor.lastrowid,
-                        'name': shot.name,
-                        'sequence': sequence_id,
-                        'start_frame': shot.start_frame,
-                        'end_frame': shot.end_frame,
-                        'width': shot.width,
-                        'height': shot.height,
-                        'description': shot.description})
-
-        connection.commit()
-        shot.id = cursor.lastrowid  # Add database ID to the shot object
-        connection.close()
+        with self.database.transaction() as cursor:
+            cursor.execute("INSERT INTO shots VALUES ("
+                           ":id,"
+                           ":name,"
+                           ":sequence,"
+                           ":start_frame,"
+                           ":end_frame,"
+                           ":width,"
+                           ":height,"
+                           ":description)",
+
+                           {'id': None,
+                            'name': shot.name,
+                            'sequence': sequence_id,
+                            'start_frame': shot.start_frame,
+                            'end_frame': shot.end_frame,
+                            'width': shot.width,
+                            'height': shot.height,
+                            'description': shot.description})
+
+            shot.id = cursor.lastrowid  # Add database ID to the shot object
+
+        self.cache.add('shots', shot)
 
         self.sequence_shots.append(shot)
 
     def get_shot(self, shot_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        shot = self.get_cached('shots', shot_id)
+        if shot:
+            return shot
+
+        cursor = self.database.cursor()
 
         cursor.execute("SELECT * FROM shots WHERE id=:id",
                        {'id': shot_id})
 
         shot_tuple = cursor.fetchone()
 
-        connection.close()
-
         if shot_tuple:
-            return entities.Converter.convert_to_shot([shot_tuple])[0]
+            shot = entities.Converter.convert_to_shot([shot_tuple])[0]
+            self.cache.add('shots', shot)
+
+            return shot
+
+    def fetch_shot_assets(self, shot_id):
+        """
+        Return list of assets linked to the shot without touching INTERNAL SET lists (safe to call from worker threads)
+        """
+
+        cursor = self.database.cursor()
+
+        # Resolve links and assets in one query
+        cursor.execute("SELECT assets.* FROM shot_assets "
+                       "JOIN assets ON assets.id = shot_assets.asset_id "
+                       "WHERE shot_assets.shot_id=:shot_id "
+                       "ORDER BY shot_assets.id",
+                       {'shot_id': shot_id})
+
+        asset_tuples = cursor.fetchall()
+
+        return self.cache_entities('assets', entities.Converter.convert_to_asset(asset_tuples))
 
     def get_shot_assets(self, shot_id):
 
         # Clear shot_assets list
         del self.shot_assets[:]
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        self.shot_assets.extend(self.fetch_shot_assets(shot_id))
 
-        cursor.execute("SELECT * FROM shot_assets WHERE shot_id=:shot_id",
-                       {'shot_id': shot_id})
+    def get_assets_for_shots(self, shot_ids):
+        """
+        Get linked assets for multiple shots (whole sequence breakdown) in one round trip
 
-        link_tuples = cursor.fetchall()
+        :param shot_ids: list of shot ids
+        :return: dictionary {shot_id: [Asset, ...]}, shots without links have an empty list
+        """
 
-        connection.close()
+        shot_ids = list(shot_ids)
+        shot_assets = {shot_id: [] for shot_id in shot_ids}
+        if not shot_ids:
+            return shot_assets
 
-        if link_tuples:
-            # Append assets
-            for link_tuple in link_tuples:
-                self.shot_assets.append(self.get_asset(link_tuple[2]))
+        cursor = self.database.cursor()
 
-    def update_shot(self, shot):
+        # Pass ids as one JSON parameter to avoid the SQLite host parameters limit
+        cursor.execute("SELECT shot_assets.shot_id, assets.* FROM shot_assets "
+                       "JOIN assets ON assets.id = shot_assets.asset_id "
+                       "WHERE shot_assets.shot_id IN (SELECT value FROM json_each(:shot_ids)) "
+                       "ORDER BY shot_assets.id",
+                       {'shot_ids': json.dumps(shot_ids)})
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        link_tuples = cursor.fetchall()
+        asset_objects = self.cache_entities('assets',
+                                            entities.Converter.convert_to_asset([link_tuple[1:] for link_tuple in link_tuples]))
+        for link_tuple, asset in zip(link_tuples, asset_objects):
+            shot_assets[link_tuple[0]].append(asset)
+
+        return shot_assets
 
-        cursor.execute("UPDATE shots SET "
-                       "sequence=:sequence,"
-                       "start_frame=:start_frame,"
-                       "end_frame=:end_frame,"
-                       "width=:width,"
-                       "height=:height,"
-                       "description=:description "
+    def update_shot(self, shot):
 
-                       "WHERE id=:id",
+        with self.database.transaction() as cursor:
+            cursor.execute("UPDATE shots SET "
+                           "sequence=:sequence,"
+                           "start_frame=:start_frame,"
+                           "end_frame=:end_frame,"
+                           "width=:width,"
+                           "height=:height,"
+                           "description=:description "
 
-                       {'id': shot.id,
-                        'sequence': shot.sequence,
-                        'start_frame': shot.start_frame,
-                        'end_frame': shot.end_frame,
-                        'width': shot.width,
-                        'height': shot.height,
-                        'description': shot.description})
+                           "WHERE id=:id",
 
-        connection.commit()
-        connection.close()
+                           {'id': shot.id,
+                            'sequence': shot.sequence,
+                            'start_frame': shot.start_frame,
+                            'end_frame': shot.end_frame,
+                            'width': shot.width,
+                            'height': shot.height,
+                            'description': shot.description})
+
+        self.cache.add('shots', shot)
 
         return shot
 
     def del_shot(self, shot_id):
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
-
-        cursor.execute("DELETE FROM shots WHERE id=:id",
-                       {'id': shot_id})
+        with self.database.transaction() as cursor:
+            cursor.execute("DELETE FROM shots WHERE id=:id",
+                           {'id': shot_id})
 
-        connection.commit()
-        connection.close()
+        self.cache.invalidate('shots', shot_id)
 
         for shot in self.sequence_shots:
             if shot.id == shot_id:
@@ -525,43 +729,175 @@ class EveData:
         Link asset to the shot
         """
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+        with self.database.transaction() as cursor:
 
-        # Check if the asset link exists:
-        cursor.execute("SELECT * FROM shot_assets WHERE asset_id=:asset_id AND shot_id=:shot_id",
+            # Existing link is skipped by UNIQUE(shot_id, asset_id)
+            cursor.execute("INSERT OR IGNORE INTO shot_assets VALUES ("
+                           ":id,"
+                           ":shot_id,"
+                           ":asset_id)",
 
-                       {'asset_id': asset_id, 'shot_id': shot_id})
+                           {'id': None,
+                            'shot_id': shot_id,
+                            'asset_id': asset_id})
 
-        if cursor.fetchone():
-            connection.close()
-            return
+        if cursor.rowcount == 1:
+            return True
 
-        cursor.execute("INSERT INTO shot_assets VALUES ("
-                       ":id,"
-                       ":shot_id,"
-                       ":asset_id)",
+    def unlink_asset(self, asset_id, shot_id):
 
-                       {'id': cursor.lastrowid,
-                        'shot_id': shot_id,
-                        'asset_id': asset_id})
+        with self.database.transaction() as cursor:
+            cursor.execute("DELETE FROM shot_assets WHERE asset_id=:asset_id AND shot_id=:shot_id",
 
-        connection.commit()
-        connection.close()
-        return True
+                           {'asset_id': asset_id, 'shot_id': shot_id})
 
-    def unlink_asset(self, asset_id, shot_id):
+        for asset in self.shot_assets:
+            if asset.id == asset_id:
+                self.shot_assets.remove(asset)
 
-        connection = sqlite3.connect(self.SQL_FILE_PATH)
-        cursor = connection.cursor()
+    def link_assets(self, asset_ids, shot_id):
+        """
+        Link many assets to the shot in one transaction
 
-        cursor.execute("DELETE FROM shot_assets WHERE asset_id=:asset_id AND shot_id=:shot_id",
+        :param asset_ids: list of asset ids
+        :param shot_id: integer, shot database ID
+        :return: list of asset ids which were linked, already linked assets are skipped
+        """
 
-                       {'asset_id': asset_id, 'shot_id': shot_id})
+        asset_ids = list(dict.fromkeys(asset_ids))
 
-        connection.commit()
-        connection.close()
+        with self.database.transaction('IMMEDIATE') as cursor:
+            cursor.execute("SELECT asset_id FROM shot_assets "
+                           "WHERE shot_id=:shot_id "
+                           "AND asset_id IN (SELECT value FROM json_each(:asset_ids))",
+                           {'shot_id': shot_id, 'asset_ids': json.dumps(asset_ids)})
 
-        for asset in self.shot_assets:
-            if asset.id == asset_id:
-                self.shot_assets.remove(asset)
\ No newline at end of file
+            linked_ids = {row[0] for row in cursor.fetchall()}
+            new_ids = [asset_id for asset_id in asset_ids if asset_id not in linked_ids]
+
+            cursor.executemany("INSERT INTO shot_assets (shot_id, asset_id) VALUES (?, ?)",
+                               [(shot_id, asset_id) for asset_id in new_ids])
+
+        return new_ids
+
+    def unlink_assets(self, asset_ids, shot_id):
+        """
+        Break links of many assets with the shot in one transaction.
+        INTERNAL SET list shot_assets is not modified, the model which displays shot assets is updated by the caller.
+
+        :param asset_ids: list of asset ids
+        :param shot_id: integer, shot database ID
+        """
+
+        with self.database.transaction() as cursor:
+            cursor.execute("DELETE FROM shot_assets "
+                           "WHERE shot_id=:shot_id "
+                           "AND asset_id IN (SELECT value FROM json_each(:asset_ids))",
+                           {'shot_id': shot_id, 'asset_ids': json.dumps(list(asset_ids))})
+
+    # Bulk
+    def bulk_add_assets(self, assets, project_id):
+        """
+        Add many assets in one transaction (import from editorial, CSV, JSON)
+
+        :param assets: list of Asset objects, database IDs are recorded to the objects
+        :param project_id: integer, project database ID
+        """
+
+        with self.database.transaction('IMMEDIATE') as cursor:
+            first_id = reserve_ids(cursor, 'assets')
+            cursor.executemany("INSERT INTO assets VALUES (?, ?, ?, ?, ?)",
+                               [(first_id + index, asset.name, project_id, asset.type, asset.description)
+                                for index, asset in enumerate(assets)])
+
+        for index, asset in enumerate(assets):
+            asset.id = first_id + index
+            asset.project = project_id
+
+        self.project_assets.extend(assets)
+
+    def bulk_add_sequences(self, sequences, project_id):
+        """
+        Add many sequences in one transaction
+
+        :param sequences: list of Sequence objects, database IDs are recorded to the objects
+        :param project_id: integer, project database ID
+        """
+
+        with self.database.transaction('IMMEDIATE') as cursor:
+            first_id = reserve_ids(cursor, 'sequences')
+            cursor.executemany("INSERT INTO sequences VALUES (?, ?, ?, ?)",
+                               [(first_id + index, sequence.name, project_id, sequence.description)
+                                for index, sequence in enumerate(sequences)])
+
+        for index, sequence in enumerate(sequences):
+            sequence.id = first_id + index
+            sequence.project = project_id
+
+        self.project_sequences.extend(sequences)
+
+    def bulk_add_shots(self, shots, sequence_id=None):
+        """
+        Add many shots in one transaction
+
+        :param shots: list of Shot objects, database IDs are recorded to the objects
+        :param sequence_id: integer, sequence database ID. If None, each Shot.sequence is used
+        """
+
+        if sequence_id is not None:
+            for shot in shots:
+                shot.sequence = sequence_id
+
+        with self.database.transaction('IMMEDIATE') as cursor:
+            first_id = reserve_ids(cursor, 'shots')
+            cursor.executemany("INSERT INTO shots VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                               [(first_id + index,
+                                 shot.name,
+                                 shot.sequence,
+                                 shot.start_frame,
+                                 shot.end_frame,
+                                 shot.width,
+                                 shot.height,
+                                 shot.description) for index, shot in enumerate(shots)])
+
+        for index, shot in enumerate(shots):
+            shot.id = first_id + index
+
+        self.sequence_shots.extend(shots)
+
+    def bulk_link_assets(self, links):
+        """
+        Link many assets to shots in one transaction, existing links are skipped
+
+        :param links: list of tuples [(asset_id, shot_id)]
+        :return: integer, number of new links
+        """
+
+        with self.database.transaction() as cursor:
+            cursor.executemany("INSERT OR IGNORE INTO shot_assets (shot_id, asset_id) VALUES (?, ?)",
+                               [(shot_id, asset_id) for asset_id, shot_id in links])
+
+        return cursor.rowcount
+
+
+def build_match_query(query):
+    """
+    Convert user input to FTS5 MATCH expression: every word is quoted (no FTS syntax errors on user input)
+    and matched as prefix, all words must be found.
+    """
+
+    return ' '.join('"{0}"*'.format(word) for word in re.findall(r'\w+', query))
+
+
+def reserve_ids(cursor, table):
+    """
+    Get first free AUTOINCREMENT id of the table, so bulk inserts can record IDs without a query per row.
+    Call inside IMMEDIATE transaction so no other connection can take the IDs.
+    """
+
+    cursor.execute("SELECT MAX("
+                   "IFNULL((SELECT seq FROM sqlite_sequence WHERE name=:table), 0), "
+                   "IFNULL((SELECT MAX(id) FROM {0}), 0))".format(table),
+                   {'table': table})
+
+    return cursor.fetchone()[0] + 1
@@ -0,0 +1,336 @@
+"""
+Index of Eve files on disk: every file which follows Eve naming convention (<prefix>_<base>_<version>.<extension>)
+under project root is recorded with parsed name components, size and modification time in SQLite database
+next to eve.db, so tools query files instead of walking folders:
+
+    file_index = FileIndex(settings.FILE_INDEX_PATH.format(eve_root))
+    file_index.refresh(project_root)
+    file_index.get_latest_versions(project_root, prefix='ast')  # Last version of every asset scene, one query
+
+Refresh is incremental: every folder is checked with one stat, only folders with changed modification time are listed
+again. Folder modification time changes when files are created, deleted or renamed in it, files overwritten in place
+are picked up with refresh(full=True).
+
+File sequences (renders, caches) are recorded as one row per sequence: 'RND_SH010_001.%04d.exr' with frame ranges,
+without size and modification time of each frame.
+
+Run from Eve/tools folder:
+    python -m core.database.file_index refresh C:/projects/Avatar
+    python -m core.database.file_index latest C:/projects/Avatar --prefix ast
+"""
+
+
+import os
+import time
+import argparse
+from typing import NamedTuple
+
+from . import connection
+from . import migrations
+from .. import settings
+from .. import file_path
+from .. import frame_sequence
+
+
+MIGRATIONS = [
+    (1, 'Folders and files tables', [
+        "CREATE TABLE IF NOT EXISTS folders ("
+        "id integer primary key autoincrement, "
+        "path text UNIQUE, "
+        "parent integer, "
+        "mtime_ns integer)",
+        "CREATE INDEX IF NOT EXISTS folders_parent ON folders(parent)",
+
+        "CREATE TABLE IF NOT EXISTS files ("
+        "id integer primary key autoincrement, "
+        "folder integer, "
+        "name text, "
+        "prefix text, "
+        "base text, "
+        "code text, "
+        "version integer, "
+        "folder_version text, "
+        "extension text, "
+        "frames text, "
+        "size integer, "
+        "mtime_ns integer, "
+        "FOREIGN KEY(folder) REFERENCES folders(id))",
+        "CREATE INDEX IF NOT EXISTS files_folder ON files(folder)",
+        "CREATE INDEX IF NOT EXISTS files_code ON files(code, extension, version)",
+        "CREATE INDEX IF NOT EXISTS files_base ON files(base)"]),
+]
+
+# Folders modified less than 2 seconds before listing are listed again on next refresh (coarse NAS mtime)
+RACY_WINDOW = 2000000000
+
+
+class IndexedFile(NamedTuple):
+    path: str
+    prefix: str
+    base: str
+    code: str
+    version: int
+    folder_version: str
+    extension: str
+    frames: str  # Frame ranges for sequences ('1-100,102-240'), None for single files
+    size: int
+    mtime_ns: int
+
+
+def scan_folder(folder_path):
+    """
+    List one folder
+
+    :param folder_path: string, folder path
+    :return: tuple (list of subfolder paths, list of file rows (name, prefix, base, code, version, folder_version,
+             extension, frames, size, mtime_ns))
+    """
+
+    subfolders = []
+    files = []
+    sequences = {}  # {(code, file_version, extension, padding): (eve_path, [frames])}
+
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subfolders.append('{0}/{1}'.format(folder_path, entry.name))
+                continue
+
+            eve_path = file_path.parse_eve_path(entry.name)
+            if not eve_path or eve_path.type == 'location' or not eve_path.file_version.isdigit():
+                continue
+
+            if eve_path.type == 'sequence':
+                # <file_code>_<file_version>.<frame>.<extension>
+                frame = entry.name[len(eve_path.code) + len(eve_path.file_version) + 2:-len(eve_path.extension) - 1]
+                if frame_sequence.FRAME_PATTERN.fullmatch(frame):
+                    key = (eve_path.code, eve_path.file_version, eve_path.extension, len(frame))
+                    sequences.setdefault(key, (eve_path, []))[1].append(int(frame))
+                continue
+
+            stat = entry.stat()
+            files.append((entry.name, eve_path.prefix, eve_path.base, eve_path.code, int(eve_path.file_version),
+                          get_folder_version(folder_path), eve_path.extension, None, stat.st_size, stat.st_mtime_ns))
+
+    for (code, file_version, extension, padding), (eve_path, frames) in sequences.items():
+        name = '{0}_{1}.%0{2}d.{3}'.format(code, file_version, padding, extension)
+        files.append((name, eve_path.prefix, eve_path.base, code, int(file_version), get_folder_version(folder_path),
+                      extension, frame_sequence.collapse_frames(frames), None, None))
+
+    return subfolders, files
+
+
+def get_folder_version(folder_path):
+    """
+    Get FOLDER VERSION if folder is a version folder: S:/location/001
+    """
+
+    folder_name = folder_path[folder_path.rfind('/') + 1:]
+    if len(folder_name) == 3 and folder_name.isdigit():
+        return folder_name
+
+
+class FileIndex:
+    def __init__(self, SQL_FILE_PATH):
+
+        self.SQL_FILE_PATH = SQL_FILE_PATH
+        self.database = connection.get_manager(SQL_FILE_PATH)
+        migrations.upgrade(self.database, MIGRATIONS)
+
+    def refresh(self, root, full=False):
+        """
+        Update index of all files under root folder
+
+        :param root: string, project root folder
+        :param full: bool, list all folders even if their modification time is not changed
+        :return: dictionary {'folders': visited folders, 'listed': listed folders, 'removed': removed folders}
+        """
+
+        root = normalize_path(root)
+        cursor = self.database.cursor()
+
+        # Load known folders under root: {path: (id, mtime_ns)} and {parent id: [path]}
+        cursor.execute("SELECT id, path, parent, mtime_ns FROM folders WHERE {0}".format(ROOT_CONDITION),
+                       get_root_parameters(root))
+
+        known_folders = {}
+        known_children = {}
+        for folder_id, path, parent, mtime_ns in cursor.fetchall():
+            known_folders[path] = (folder_id, mtime_ns)
+            known_children.setdefault(parent, []).append(path)
+
+        # Walk folders without holding a write lock, collect changed folders in walk order (parents first)
+        visited = set()
+        changed = []  # [(folder path, parent folder path, mtime_ns, file rows)]
+        stack = [(root, None)]  # (folder path, parent folder path)
+
+        while stack:
+            folder_path, parent_path = stack.pop()
+
+            try:
+                mtime_ns = os.stat(folder_path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+
+            visited.add(folder_path)
+            folder_id, known_mtime_ns = known_folders.get(folder_path, (None, None))
+
+            # Folder content is not changed, check known subfolders
+            if folder_id and known_mtime_ns == mtime_ns and not full:
+                stack.extend((path, folder_path) for path in known_children.get(folder_id, []))
+                continue
+
+            subfolders, files = scan_folder(folder_path)
+
+            # Listing taken in the same mtime tick as the last modification can miss files, list it next time
+            if time.time_ns() - mtime_ns < RACY_WINDOW:
+                mtime_ns = None
+
+            changed.append((folder_path, parent_path, mtime_ns, files))
+            stack.extend((path, folder_path) for path in subfolders)
+
+        removed_ids = [folder_id for path, (folder_id, mtime_ns) in known_folders.items() if path not in visited]
+
+        # Write all changes in one short transaction
+        folder_ids = {path: folder_id for path, (folder_id, mtime_ns) in known_folders.items()}
+        with self.database.transaction('IMMEDIATE') as cursor:
+            for folder_path, parent_path, mtime_ns, files in changed:
+                # Folder could be added by concurrent refresh after known folders were loaded
+                cursor.execute("INSERT INTO folders (path, parent, mtime_ns) VALUES (:path, :parent, :mtime_ns) "
+                               "ON CONFLICT(path) DO UPDATE SET parent=excluded.parent, mtime_ns=excluded.mtime_ns",
+                               {'path': folder_path, 'parent': folder_ids.get(parent_path), 'mtime_ns': mtime_ns})
+                cursor.execute("SELECT id FROM folders WHERE path=:path", {'path': folder_path})
+                folder_id = folder_ids[folder_path] = cursor.fetchone()[0]
+
+                cursor.execute("DELETE FROM files WHERE folder=:folder", {'folder': folder_id})
+                cursor.executemany("INSERT INTO files (folder, name, prefix, base, code, version, folder_version, "
+                                   "extension, frames, size, mtime_ns) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   [(folder_id,) + file_row for file_row in files])
+
+            # Remove deleted folders
+            cursor.executemany("DELETE FROM files WHERE folder=?", [(folder_id,) for folder_id in removed_ids])
+            cursor.executemany("DELETE FROM folders WHERE id=?", [(folder_id,) for folder_id in removed_ids])
+
+        return {'folders': len(visited), 'listed': len(changed), 'removed': len(removed_ids)}
+
+    def find_files(self, root=None, prefix=None, base=None, code=None, extension=None):
+        """
+        Get indexed files, filtered by any combination of name components
+
+        :param root: string, return only files under this folder
+        :param prefix: string, file type prefix ('ast', 'rnd')
+        :param base: string, asset or shot name
+        :param code: string, <prefix>_<base>
+        :param extension: string, file extension
+        :return: list of IndexedFile, ordered by code and version
+        """
+
+        conditions, parameters = get_filter(root, prefix, base, code, extension)
+
+        cursor = self.database.cursor()
+        cursor.execute("SELECT folders.path || '/' || files.name, files.prefix, files.base, files.code, files.version, "
+                       "files.folder_version, files.extension, files.frames, files.size, files.mtime_ns "
+                       "FROM files JOIN folders ON folders.id = files.folder "
+                       "WHERE {0} "
+                       "ORDER BY files.code, files.extension, files.version".format(conditions),
+                       parameters)
+
+        return list(map(IndexedFile._make, cursor.fetchall()))
+
+    def get_latest_versions(self, root=None, prefix=None, base=None, extension=None):
+        """
+        Get the last version of every file code (every asset scene, shot render etc.) in one query
+
+        :return: list of IndexedFile, one file per (code, extension), ordered by code
+        """
+
+        conditions, parameters = get_filter(root, prefix, base, None, extension)
+
+        # SQLite returns bare columns from the row with MAX() value
+        cursor = self.database.cursor()
+        cursor.execute("SELECT folders.path || '/' || files.name, files.prefix, files.base, files.code, "
+                       "MAX(files.version), files.folder_version, files.extension, files.frames, files.size, "
+                       "files.mtime_ns "
+                       "FROM files JOIN folders ON folders.id = files.folder "
+                       "WHERE {0} "
+                       "GROUP BY files.code, files.extension "
+                       "ORDER BY files.code, files.extension".format(conditions),
+                       parameters)
+
+        return list(map(IndexedFile._make, cursor.fetchall()))
+
+
+# Folder path is the root or starts with "<root>/", range comparison uses folders.path UNIQUE index
+ROOT_CONDITION = "(folders.path = :root OR (folders.path >= :root_start AND folders.path < :root_end))"
+
+
+def normalize_path(path):
+
+    return path.replace('\\', '/').rstrip('/')
+
+
+def get_root_parameters(root):
+
+    return {'root': root,
+            'root_start': root + '/',
+            'root_end': root + chr(ord('/') + 1)}
+
+
+def get_filter(root, prefix, base, code, extension):
+    """
+    Build WHERE conditions and parameters for files queries
+    """
+
+    conditions = []
+    parameters = {}
+
+    if root:
+        conditions.append(ROOT_CONDITION)
+        parameters.update(get_root_parameters(normalize_path(root)))
+
+    for column, value in (('prefix', prefix), ('base', base), ('code', code), ('extension', extension)):
+        if value is not None:
+            conditions.append('files.{0}=:{0}'.format(column))
+            parameters[column] = value
+
+    return ' AND '.join(conditions) or '1', parameters
+
+
+def main(arguments=None):
+
+    eve_root = os.environ.get('EVE_ROOT',
+                              os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+    parser = argparse.ArgumentParser(description='Index Eve files of the project')
+    parser.add_argument('--database', default=settings.FILE_INDEX_PATH.format(eve_root.replace('\\', '/')),
+                        help='Path to file_index.db')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    refresh_command = commands.add_parser('refresh', help='Update index of project files')
+    refresh_command.add_argument('root', help='Project root folder')
+    refresh_command.add_argument('--full', action='store_true', help='List all folders, not only changed ones')
+
+    latest_command = commands.add_parser('latest', help='Print the last version of every file')
+    latest_command.add_argument('root', help='Project root folder')
+    latest_command.add_argument('--prefix', help='File type prefix')
+    latest_command.add_argument('--extension', help='File extension')
+
+    arguments = parser.parse_args(arguments)
+
+    start = time.perf_counter()
+    file_index = FileIndex(arguments.database)
+
+    if arguments.command == 'refresh':
+        stats = file_index.refresh(arguments.root, arguments.full)
+        print('>> Indexed {0} folders, {1} listed, {2} removed'.format(stats['folders'], stats['listed'],
+                                                                    stats['removed']))
+    else:
+        for indexed_file in file_index.get_latest_versions(arguments.root, arguments.prefix,
+                                                           extension=arguments.extension):
+            print(indexed_file.path)
+
+    print('>> Done in {0:.2f} sec'.format(time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
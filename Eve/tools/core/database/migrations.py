@@ -0,0 +1,101 @@
+"""
+Eve database schema migrations.
+
+Schema version is stored in SQLite "PRAGMA user_version". Existing eve.db files are upgraded in place when EveData
+is created: every migration with a version above the stored one is applied in order, inside one transaction.
+
+To change the schema append a new (version, description, statements) entry to MIGRATIONS, never edit applied ones.
+"""
+
+
+MIGRATIONS = [
+    (1, 'Indexes for lookup columns and unique shot/asset links', [
+        # Remove duplicated links before adding UNIQUE constraint
+        "DELETE FROM shot_assets WHERE id NOT IN "
+        "(SELECT MIN(id) FROM shot_assets GROUP BY shot_id, asset_id)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS shot_assets_shot_asset ON shot_assets(shot_id, asset_id)",
+        "CREATE INDEX IF NOT EXISTS shot_assets_asset ON shot_assets(asset_id)",
+        "CREATE INDEX IF NOT EXISTS projects_name ON projects(name)",
+        "CREATE INDEX IF NOT EXISTS assets_project_name ON assets(project, name)",
+        "CREATE INDEX IF NOT EXISTS sequences_project ON sequences(project)",
+        "CREATE INDEX IF NOT EXISTS shots_sequence ON shots(sequence)"]),
+
+    (2, 'Name ordered indexes for paged entity lists', [
+        "CREATE INDEX IF NOT EXISTS sequences_project_name ON sequences(project, name)",
+        "CREATE INDEX IF NOT EXISTS shots_sequence_name ON shots(sequence, name)",
+        "DROP INDEX IF EXISTS sequences_project",
+        "DROP INDEX IF EXISTS shots_sequence"]),
+
+    # Full text index of asset and shot names and descriptions, used by EveData.search().
+    # Rowid encodes entity: asset id * 2 for assets, shot id * 2 + 1 for shots, so triggers update rows by rowid.
+    (3, 'Full text search index for assets and shots', [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS entity_search USING fts5("
+        "name, description, project UNINDEXED, tokenize='unicode61', prefix='2 3')",
+
+        "INSERT INTO entity_search (rowid, name, description, project) "
+        "SELECT id * 2, name, IFNULL(description, ''), project FROM assets",
+        "INSERT INTO entity_search (rowid, name, description, project) "
+        "SELECT shots.id * 2 + 1, shots.name, IFNULL(shots.description, ''), sequences.project "
+        "FROM shots LEFT JOIN sequences ON sequences.id = shots.sequence",
+
+        "CREATE TRIGGER IF NOT EXISTS assets_search_insert AFTER INSERT ON assets BEGIN "
+        "INSERT INTO entity_search (rowid, name, description, project) "
+        "VALUES (new.id * 2, new.name, IFNULL(new.description, ''), new.project); END",
+        "CREATE TRIGGER IF NOT EXISTS assets_search_update AFTER UPDATE OF name, description, project ON assets BEGIN "
+        "UPDATE entity_search SET name=new.name, description=IFNULL(new.description, ''), project=new.project "
+        "WHERE rowid = old.id * 2; END",
+        "CREATE TRIGGER IF NOT EXISTS assets_search_delete AFTER DELETE ON assets BEGIN "
+        "DELETE FROM entity_search WHERE rowid = old.id * 2; END",
+
+        "CREATE TRIGGER IF NOT EXISTS shots_search_insert AFTER INSERT ON shots BEGIN "
+        "INSERT INTO entity_search (rowid, name, description, project) "
+        "VALUES (new.id * 2 + 1, new.name, IFNULL(new.description, ''), "
+        "(SELECT project FROM sequences WHERE id = new.sequence)); END",
+        "CREATE TRIGGER IF NOT EXISTS shots_search_update AFTER UPDATE OF name, description, sequence ON shots BEGIN "
+        "UPDATE entity_search SET name=new.name, description=IFNULL(new.description, ''), "
+        "project=(SELECT project FROM sequences WHERE id = new.sequence) "
+        "WHERE rowid = old.id * 2 + 1; END",
+        "CREATE TRIGGER IF NOT EXISTS shots_search_delete AFTER DELETE ON shots BEGIN "
+        "DELETE FROM entity_search WHERE rowid = old.id * 2 + 1; END"]),
+]
+
+
+def get_version(cursor):
+
+    cursor.execute("PRAGMA user_version")
+
+    return cursor.fetchone()[0]
+
+
+def upgrade(database, schema=MIGRATIONS):
+    """
+    Apply pending migrations to the database
+
+    :param database: connection.ConnectionManager
+    :param schema: list of migrations, MIGRATIONS of eve.db by default (other databases have their own lists)
+    :return: integer, schema version after upgrade
+    """
+
+    latest_version = schema[-1][0]
+
+    # Most of the time database is up to date, check it without taking a write lock
+    if get_version(database.cursor()) >= latest_version:
+        return latest_version
+
+    with database.transaction('IMMEDIATE') as cursor:
+        # Another process could upgrade database while we were waiting for the lock
+        version = get_version(cursor)
+
+        for migration_version, description, statements in schema:
+            if migration_version <= version:
+                continue
+
+            print('>> Upgrading Eve database to version {0}: {1}'.format(migration_version, description))
+            for statement in statements:
+                cursor.execute(statement)
+
+            version = migration_version
+
+        cursor.execute("PRAGMA user_version={0:d}".format(version))
+
+    return version
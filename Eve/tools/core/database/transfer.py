@@ -0,0 +1,310 @@
+"""
+Import and export whole Eve projects (assets, sequences, shots and asset links) as JSON or CSV.
+
+Run from Eve/tools folder:
+    python -m core.database.transfer export eve_example C:/temp/eve_example.json
+    python -m core.database.transfer import C:/temp/editorial.csv --project Avatar
+
+JSON layout:
+    {"project": {"name", "houdini_build", "width", "height", "description"},
+     "assets": [{"name", "type", "description"}],
+     "sequences": [{"name", "description", "shots": [{"name", "start_frame", ..., "assets": ["roma"]}]}]}
+
+CSV layout, one row per entity, "sequence" is a parent of the shot, linked "assets" are separated with ";":
+    entity,sequence,name,type,houdini_build,start_frame,end_frame,width,height,description,assets
+"""
+
+
+import os
+import csv
+import json
+import time
+import argparse
+
+from . import entities
+from .eve_data import EveData
+from .. import settings
+
+
+CSV_COLUMNS = ['entity', 'sequence', 'name', 'type', 'houdini_build', 'start_frame', 'end_frame', 'width', 'height',
+               'description', 'assets']
+
+
+# Project data
+def export_project(eve_data, project_name):
+    """
+    Collect project data from database
+
+    :param eve_data: EveData instance
+    :param project_name: string, project name
+    :return: dictionary, project data in JSON layout
+    """
+
+    project = eve_data.get_project_by_name(project_name)
+    if not project:
+        raise ValueError('Project "{}" does not exist!'.format(project_name))
+
+    project_tree = eve_data.get_project_tree(project)
+
+    project_data = {
+        'project': {'name': project.name,
+                    'houdini_build': project.houdini_build,
+                    'width': project.width,
+                    'height': project.height,
+                    'description': project.description},
+        'assets': [{'name': asset.name,
+                    'type': asset.get_type(),
+                    'description': asset.description} for asset in project_tree.assets],
+        'sequences': []}
+
+    for sequence_node in project_tree.sequences:
+        shots = []
+        for shot, shot_assets in sequence_node.shots:
+            shots.append({'name': shot.name,
+                          'start_frame': shot.start_frame,
+                          'end_frame': shot.end_frame,
+                          'width': shot.width,
+                          'height': shot.height,
+                          'description': shot.description,
+                          'assets': [asset.name for asset in shot_assets]})
+
+        project_data['sequences'].append({'name': sequence_node.sequence.name,
+                                          'description': sequence_node.sequence.description,
+                                          'shots': shots})
+
+    return project_data
+
+
+def import_project(eve_data, project_data, project_name=None):
+    """
+    Add project data to database in one transaction.
+    Existing project, assets, sequences and shots (matched by name) are reused, new ones are added.
+
+    :param eve_data: EveData instance
+    :param project_data: dictionary, project data in JSON layout
+    :param project_name: string, import to this project instead of the one recorded in data
+    :return: Project object
+    """
+
+    project_properties = project_data.get('project', {})
+    project_name = project_name or project_properties['name']
+
+    with eve_data.database.transaction('IMMEDIATE'):
+
+        # Project
+        project = eve_data.get_project_by_name(project_name)
+        if not project:
+            project = entities.Project(project_name)
+            project.houdini_build = project_properties.get('houdini_build') or settings.default_build
+            project.width = project_properties.get('width')
+            project.height = project_properties.get('height')
+            project.description = project_properties.get('description', '')
+            eve_data.add_project(project)
+
+        # Assets
+        eve_data.get_project_assets(project)
+        project_assets = {asset.name: asset for asset in eve_data.project_assets}
+
+        new_assets = []
+        for asset_properties in project_data.get('assets', []):
+            if asset_properties['name'] in project_assets:
+                continue
+
+            asset = entities.Asset(asset_properties['name'], project.id)
+            asset_type = entities.Asset.asset_types.get(asset_properties.get('type'))
+            asset.type = asset_type['id'] if asset_type else None
+            asset.description = asset_properties.get('description', '')
+            project_assets[asset.name] = asset
+            new_assets.append(asset)
+
+        eve_data.bulk_add_assets(new_assets, project.id)
+
+        # Sequences
+        eve_data.get_project_sequences(project)
+        project_sequences = {sequence.name: sequence for sequence in eve_data.project_sequences}
+
+        new_sequences = []
+        for sequence_properties in project_data.get('sequences', []):
+            if sequence_properties['name'] in project_sequences:
+                continue
+
+            sequence = entities.Sequence(sequence_properties['name'], project.id)
+            sequence.description = sequence_properties.get('description', '')
+            project_sequences[sequence.name] = sequence
+            new_sequences.append(sequence)
+
+        eve_data.bulk_add_sequences(new_sequences, project.id)
+
+        # Shots
+        new_shots = []
+        shot_links = []  # [(Shot, [asset names])]
+        for sequence_properties in project_data.get('sequences', []):
+            sequence = project_sequences[sequence_properties['name']]
+            eve_data.get_sequence_shots(sequence.id)
+            sequence_shots = {shot.name: shot for shot in eve_data.sequence_shots}
+
+            for shot_properties in sequence_properties.get('shots', []):
+                shot = sequence_shots.get(shot_properties['name'])
+                if not shot:
+                    shot = entities.Shot(shot_properties['name'], sequence.id)
+                    shot.start_frame = shot_properties.get('start_frame', '')
+                    shot.end_frame = shot_properties.get('end_frame', '')
+                    shot.width = shot_properties.get('width', '')
+                    shot.height = shot_properties.get('height', '')
+                    shot.description = shot_properties.get('description', '')
+                    sequence_shots[shot.name] = shot
+                    new_shots.append(shot)
+
+                shot_links.append((shot, shot_properties.get('assets', [])))
+
+        eve_data.bulk_add_shots(new_shots)
+
+        # Links
+        links = []
+        for shot, asset_names in shot_links:
+            for asset_name in asset_names:
+                if asset_name not in project_assets:
+                    print('>> Asset "{0}" linked to shot "{1}" does not exist, skipped'.format(asset_name, shot.name))
+                    continue
+                links.append((project_assets[asset_name].id, shot.id))
+
+        eve_data.bulk_link_assets(links)
+
+    return project
+
+
+# Files
+def write_csv(project_data, file_path):
+
+    with open(file_path, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+
+        project_properties = project_data['project']
+        writer.writerow({'entity': 'project',
+                         'name': project_properties['name'],
+                         'houdini_build': project_properties['houdini_build'],
+                         'width': project_properties['width'],
+                         'height': project_properties['height'],
+                         'description': project_properties['description']})
+
+        for asset_properties in project_data['assets']:
+            writer.writerow({'entity': 'asset',
+                             'name': asset_properties['name'],
+                             'type': asset_properties['type'],
+                             'description': asset_properties['description']})
+
+        for sequence_properties in project_data['sequences']:
+            writer.writerow({'entity': 'sequence',
+                             'name': sequence_properties['name'],
+                             'description': sequence_properties['description']})
+
+            for shot_properties in sequence_properties['shots']:
+                row = dict(shot_properties)
+                row['entity'] = 'shot'
+                row['sequence'] = sequence_properties['name']
+                row['assets'] = ';'.join(shot_properties['assets'])
+                writer.writerow(row)
+
+
+def read_csv(file_path):
+
+    project_data = {'project': {}, 'assets': [], 'sequences': []}
+    sequences = {}
+
+    def get_sequence(sequence_name):
+        if sequence_name not in sequences:
+            sequences[sequence_name] = {'name': sequence_name, 'description': '', 'shots': []}
+            project_data['sequences'].append(sequences[sequence_name])
+
+        return sequences[sequence_name]
+
+    with open(file_path, newline='', encoding='utf-8') as csv_file:
+        for row in csv.DictReader(csv_file):
+            entity = row['entity']
+
+            if entity == 'project':
+                project_data['project'] = {'name': row['name'],
+                                           'houdini_build': row['houdini_build'],
+                                           'width': row['width'],
+                                           'height': row['height'],
+                                           'description': row['description']}
+
+            elif entity == 'asset':
+                project_data['assets'].append({'name': row['name'],
+                                               'type': row['type'],
+                                               'description': row['description']})
+
+            elif entity == 'sequence':
+                get_sequence(row['name'])['description'] = row['description']
+
+            elif entity == 'shot':
+                get_sequence(row['sequence'])['shots'].append({
+                    'name': row['name'],
+                    'start_frame': row['start_frame'],
+                    'end_frame': row['end_frame'],
+                    'width': row['width'],
+                    'height': row['height'],
+                    'description': row['description'],
+                    'assets': [name for name in row['assets'].split(';') if name]})
+
+            else:
+                print('>> Unknown entity "{0}" in {1}, row skipped'.format(entity, file_path))
+
+    return project_data
+
+
+def write_project(project_data, file_path):
+
+    if file_path.lower().endswith('.csv'):
+        write_csv(project_data, file_path)
+    else:
+        with open(file_path, 'w', encoding='utf-8') as json_file:
+            json.dump(project_data, json_file, indent=4)
+
+
+def read_project(file_path):
+
+    if file_path.lower().endswith('.csv'):
+        return read_csv(file_path)
+
+    with open(file_path, encoding='utf-8') as json_file:
+        return json.load(json_file)
+
+
+# Command line
+def main(arguments=None):
+
+    eve_root = os.environ.get('EVE_ROOT',
+                              os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+    parser = argparse.ArgumentParser(description='Import and export Eve projects as JSON or CSV')
+    parser.add_argument('--database', default=settings.SQL_FILE_PATH.format(eve_root.replace('\\', '/')),
+                        help='Path to eve.db')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_command = commands.add_parser('export', help='Export project to .json or .csv file')
+    export_command.add_argument('project', help='Project name')
+    export_command.add_argument('file', help='Output file path')
+
+    import_command = commands.add_parser('import', help='Import project from .json or .csv file')
+    import_command.add_argument('file', help='Input file path')
+    import_command.add_argument('--project', help='Import to this project instead of the one in the file')
+
+    arguments = parser.parse_args(arguments)
+
+    start = time.perf_counter()
+    eve_data = EveData(arguments.database)
+
+    if arguments.command == 'export':
+        write_project(export_project(eve_data, arguments.project), arguments.file)
+        print('>> Project "{0}" exported to {1}'.format(arguments.project, arguments.file))
+    else:
+        project = import_project(eve_data, read_project(arguments.file), arguments.project)
+        print('>> Project "{0}" imported from {1}'.format(project.name, arguments.file))
+
+    print('>> Done in {0:.2f} sec'.format(time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -29,11 +29,226 @@ Eve can generate/analyze 3 types of path:
 
 
 import os
-import glob
+import re
+import time
+import threading
+import functools
+import collections
+from typing import NamedTuple
 from PySide6 import QtCore, QtWidgets, QtGui
 from . import settings
 
 
+# Path parser
+# One regex for all path types, last path segment decides the type:
+#   <location>/<prefix>_<base>_<file_version>.<extension>            PATH
+#   <location>/<prefix>_<base>_<file_version>.<frame>.<extension>    SEQUENCE
+#   <location>/<folder_version>                                     LOCATION
+EVE_PATH_PATTERN = re.compile(r'''
+    (?:(?P<location>.*)/)?
+    (?:
+        (?P<name>
+            (?P<prefix>[^_./]*)(?:_(?P<base>[^./]*))?_(?P<file_version>[^_./]*)
+            (?:\.(?P<frame>[^./]*))?
+            \.(?P<extension>[^./]*))
+        |
+        (?P<folder>[^./]*))
+    ''', re.VERBOSE)
+
+
+class EvePath(NamedTuple):
+    """
+    Components of Eve file path, result of parse_eve_path()
+    """
+
+    type: str  # 'path', 'sequence' or 'location'
+    path: str
+    name: str
+    location: str
+    prefix: str
+    file_version: str
+    folder_version: str
+    code: str
+    base: str
+    extension: str
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_eve_path(file_path):
+    """
+    Disassemble string file path into components
+
+    :param file_path: string, 'S:/location/001/code_name_001.mb'
+    :return: EvePath, None if path does not follow Eve naming convention
+    """
+
+    match = EVE_PATH_PATTERN.fullmatch(file_path)
+    if not match:
+        return
+
+    location, name, prefix, base, file_version, frame, extension, folder = match.group(
+        'location', 'name', 'prefix', 'base', 'file_version', 'frame', 'extension', 'folder')
+
+    # Records are created with tuple.__new__, NamedTuple constructor is slow for millions of frame paths
+    if name is None:
+        return tuple.__new__(EvePath, ('location', file_path, None, location, None, None, folder, None, None, None))
+
+    # Location ends with FOLDER VERSION: S:/location/001
+    folder_version = None
+    if location:
+        folder_name = location[-3:]
+        if len(folder_name) == 3 and folder_name.isdigit() and location[-4:-3] in ('/', ''):
+            folder_version = folder_name
+
+    if base is None:
+        base = ''
+
+    return tuple.__new__(EvePath, ('path' if frame is None else 'sequence',
+                                   file_path,
+                                   name,
+                                   location,
+                                   prefix,
+                                   file_version,
+                                   folder_version,
+                                   prefix + '_' + base,
+                                   base,
+                                   extension))
+
+
+@functools.lru_cache(maxsize=None)
+def get_project_roots(project_root):
+    """
+    Build root folders of the project: (asset, shot, render 3D, render 2D, comp)
+    """
+
+    return ('{0}/PROD/3D/scenes/ASSETS'.format(project_root),
+            '{0}/PROD/3D/scenes/SHOTS'.format(project_root),
+            '{0}/PROD/3D/images'.format(project_root),
+            '{0}/PROD/2D/RENDER'.format(project_root),
+            '{0}/PROD/2D/COMP'.format(project_root))
+
+
+# Directory listing cache: {location: (mtime_ns, checked_ns, listing)}
+# Listing is read again when directory modification time changes (file created, deleted or renamed in it).
+# Least recently checked listings are dropped when cache is full.
+LISTING_CHECK_INTERVAL = 1000000000  # Trust listing without stat for 1 second (calls within one save or open)
+LISTING_RACY_WINDOW = 2000000000  # Re-read directories modified less than 2 seconds before listing (coarse mtime)
+LISTING_CACHE_SIZE = 1024
+_listings = collections.OrderedDict()
+_listings_lock = threading.Lock()
+
+
+def cache_listing(location, mtime, now, listing):
+    """
+    Store directory listing as the most recently checked, drop the oldest listings above LISTING_CACHE_SIZE
+    """
+
+    with _listings_lock:
+        _listings[location] = (mtime, now, listing)
+        _listings.move_to_end(location)
+
+        while len(_listings) > LISTING_CACHE_SIZE:
+            _listings.popitem(last=False)
+
+
+def list_directory(location):
+    """
+    Get entries of location from the process wide listing cache, one stat and one listing per directory change.
+
+    :param location: string, folder path
+    :return: dictionary {normcase(name): is_dir}, empty if location does not exist
+    """
+
+    now = time.time_ns()
+    cached = _listings.get(location)
+    if cached and now - cached[1] < LISTING_CHECK_INTERVAL:
+        return cached[2]
+
+    try:
+        mtime = os.stat(location).st_mtime_ns
+    except FileNotFoundError:
+        clear_listing_cache(location)
+        return {}
+
+    # Listing taken in the same mtime tick as the last modification can miss files, don't trust it
+    if cached and cached[0] == mtime and cached[1] - mtime > LISTING_RACY_WINDOW:
+        cache_listing(location, mtime, now, cached[2])
+        return cached[2]
+
+    with os.scandir(location) as entries:
+        listing = {os.path.normcase(entry.name): entry.is_dir() for entry in entries}
+
+    cache_listing(location, mtime, now, listing)
+
+    return listing
+
+
+def clear_listing_cache(location=None):
+    """
+    Drop cached listing of the location (all listings if location is None) after writing files to it
+    """
+
+    with _listings_lock:
+        if location is None:
+            _listings.clear()
+        else:
+            _listings.pop(location, None)
+
+
+def path_exists(path):
+    """
+    Check if file or folder exists using cached listing of its parent folder
+    """
+
+    location, name = os.path.split(path)
+
+    return os.path.normcase(name) in list_directory(location)
+
+
+# Version scanner
+# Windows file system is case insensitive, match names the same way
+NAME_FLAGS = re.IGNORECASE if os.name == 'nt' else 0
+FOLDER_VERSION_PATTERN = re.compile(r'(\d{3})')
+
+
+@functools.lru_cache(maxsize=256)
+def get_file_version_pattern(file_code, file_extension):
+    """
+    Compile regex for <file_code>_<file_version>.<file_extension> file names, version is captured by group 1
+    """
+
+    return re.compile(r'{0}_(\d+)\.{1}'.format(re.escape(file_code), re.escape(file_extension)), NAME_FLAGS)
+
+
+def scan_versions(location, file_code=None, file_extension=None):
+    """
+    Get existing versions in location from cached directory listing, no EveFilePath objects are created.
+    If file_code is provided <file_code>_<version>.<file_extension> files are scanned, version folders (001) otherwise.
+
+    :param location: string, folder path
+    :param file_code: string, <file_prefix>_<file_base>
+    :param file_extension: string
+    :return: sorted list of integer versions, empty if location does not exist
+    """
+
+    if file_code:
+        pattern = get_file_version_pattern(file_code, file_extension)
+        scan_folders = False
+    else:
+        pattern = FOLDER_VERSION_PATTERN
+        scan_folders = True
+
+    versions = []
+    for name, is_dir in list_directory(location).items():
+        match = pattern.fullmatch(name)
+        if match and is_dir == scan_folders:
+            versions.append(int(match.group(1)))
+
+    versions.sort()
+
+    return versions
+
+
 class SNV(QtWidgets.QDialog):
     def __init__(self, file_name, parent=None):
         super(SNV, self).__init__(parent=parent)
@@ -86,19 +301,20 @@ class EveFilePath:
              'name': 'sequence',
              'description': ' S:/location/001/code_name_001.001.mb'}}
 
+    # DEFINE STRINGS
+    file_name_template = '{0}_{1}_{2}.{3}'
+    file_name_sequence_template = '{0}_{1}_{2}.{3}.{4}'
+    sequence_token = '%03d'
+
     def __init__(self, file_path=None):
 
         # Environment set
         self.project_root = os.environ['EVE_PROJECT']  # Z:/projects/Avatar
-        # DEFINE STRINGS
-        self.file_name_template = '{0}_{1}_{2}.{3}'
-        self.file_name_sequence_template = '{0}_{1}_{2}.{3}.{4}'
-        self.sequence_token = '%03d'
-        self.asset_root = '{0}/PROD/3D/scenes/ASSETS'.format(self.project_root)
-        self.shot_root = '{0}/PROD/3D/scenes/SHOTS'.format(self.project_root)
-        self.render_3d_root = '{0}/PROD/3D/images'.format(self.project_root)
-        self.render_2d_root = '{0}/PROD/2D/RENDER'.format(self.project_root)
-        self.comp_root = '{0}/PROD/2D/COMP'.format(self.project_root)
+        (self.asset_root,
+         self.shot_root,
+         self.render_3d_root,
+         self.render_2d_root,
+         self.comp_root) = get_project_roots(self.project_root)
 
         # EVE FILE PATH OBJECT ATTRIBUTES
         self.type = None  # String path type ('path', 'sequence' or 'location')
@@ -145,14 +361,10 @@ class EveFilePath:
         :return:
         """
 
-        part_length = len(self.path.split('/')[-1].split('.'))  # ['code_name_001', '001', 'mb']
+        eve_path = parse_eve_path(self.path)
 
-        if part_length == 1:
-            self.type = 'location'
-        elif part_length == 2:
-            self.type = 'path'
-        elif part_length == 3:
-            self.type = 'sequence'
+        if eve_path:
+            self.type = eve_path.type
         else:
             print('>> ERROR! Can`t detect the file type of the path = {}'.format(self.path))
 
@@ -175,19 +387,6 @@ class EveFilePath:
         if self.type == 'location':
             self.path = '{0}/{1}'.format(self.location, self.folder_version)
 
-    def build_file_base(self, parts):
-        ''' Calculate <file_base> part of the file name '''
-
-        file_base = ''
-
-        for i in range(len(parts) - 2):
-            if i == 0:
-                file_base += '{}'.format(parts[i + 1])
-            else:
-                file_base += '_{}'.format(parts[i + 1])
-
-        return file_base
-
     def analyze_file_name(self):
         '''
         Disassemble <file_name> string
@@ -196,24 +395,13 @@ class EveFilePath:
 
         '''
 
-        file_name = self.name
-
-        file_extension = file_name.split('.')[-1]
-        file_code_version = file_name.split('.')[0]
-        parts = file_code_version.split('_')
-
-        file_prefix = parts[0]
-        file_version = parts[-1]
-        file_base = self.build_file_base(parts)
-        file_code = '{0}_{1}'.format(file_prefix, file_base)
+        eve_path = parse_eve_path(self.name)
 
-        self.prefix = file_prefix
-        self.file_version = file_version
-        self.code = file_code
-        self.base = file_base
-        self.extension = file_extension
-
-        # self.print_file_path()
+        self.prefix = eve_path.prefix
+        self.file_version = eve_path.file_version
+        self.code = eve_path.code
+        self.base = eve_path.base
+        self.extension = eve_path.extension
 
     def analyze_file_path(self):
         '''
@@ -221,38 +409,29 @@ class EveFilePath:
 
         '''
 
-        file_path = self.path
+        eve_path = parse_eve_path(self.path)
+
+        if not eve_path:
+            print('>> ERROR! Unknown path type for path = {}'.format(self.path))
+            return
 
         # Detect TYPE
         if not self.type:
-            self.detect_path_type()
+            self.type = eve_path.type
 
         if self.type == 'path' or self.type == 'sequence':
-            file_name = file_path.split('/')[-1]
-            file_location = file_path.replace('/{}'.format(file_name), '')
-
-            # Check if file path has a FOLDER VERSION
-            folder_version = None
-            folder_name = file_location.split('/')[-1]
-            if len(folder_name) == 3:
-                try:
-                    int(folder_name)
-                    folder_version = folder_name
-                except:
-                    pass
-
-            self.name = file_name
-            self.location = file_location
-            self.folder_version = folder_version
-
-            self.analyze_file_name()
+            self.name = eve_path.name
+            self.location = eve_path.location
+            self.folder_version = eve_path.folder_version
+            self.prefix = eve_path.prefix
+            self.file_version = eve_path.file_version
+            self.code = eve_path.code
+            self.base = eve_path.base
+            self.extension = eve_path.extension
 
         elif self.type == 'location':
-            self.location = self.path[:-4]
-            self.folder_version = self.path.split('/')[-1]
-
-        else:
-            print('>> ERROR! Unknown path type for path = {}'.format(self.path))
+            self.location = eve_path.location
+            self.folder_version = eve_path.folder_version
 
     def build_next_file_version(self):
         '''
@@ -270,46 +449,19 @@ class EveFilePath:
     def calculate_last_version(self):
         '''
         Get latest existing file version on HDD
-        :return: integer, maximum existing version
+        :return: integer, maximum existing version, 0 if there are no versions yet
         '''
 
-        # # Get list of existing versions of file
-        # list_existed = glob.glob('{0}{1}_*.{2}'.format(self.location, self.code, self.extension))
-        #
-        # list_versions = []
-        # for file_path in list_existed:
-        #     at_file = EveFilePath(file_path)
-        #     list_versions.append(int(at_file.file_version))
-        # last_version = max(list_versions)
-        #
-        # return last_version
-
         list_versions = []
         if self.type == 'path':
             # Get list of existing versions of FILES
-            list_existed = glob.glob('{0}/{1}_*.{2}'.format(self.location, self.code, self.extension))
-            list_existed = [name.replace('\\', '/') for name in list_existed]
-
-            for file_path in list_existed:
-                at_file = EveFilePath(file_path)
-                list_versions.append(int(at_file.file_version))
+            list_versions = scan_versions(self.location, self.code, self.extension)
 
         if self.type == 'location':
             # Get list of existing versions of FOLDERS
-            list_existed = glob.glob('{0}/*'.format(self.location))
-            # Filter non-version folder (by length) and fix slashes
-            list_existed = [name.replace('\\', '/') for name in list_existed if len(name.split('\\')[-1]) == 3]
-
-            for file_path in list_existed:
-                at_file = EveFilePath(file_path)
-                list_versions.append(int(at_file.folder_version))
+            list_versions = scan_versions(self.location)
 
-        last_version = max(list_versions)
-
-        if last_version:
-            return last_version
-        else:
-            print('>> ERROR! Calculating last version fails.')
+        return max(list_versions, default=0)
 
     def build_latest_file_version(self):
         '''
@@ -331,6 +483,10 @@ class EveFilePath:
         """
 
         latest_version = self.calculate_last_version()
+        if not latest_version:
+            print('>> ERROR! No versions of {} exist, version is not changed.'.format(self.name))
+            return
+
         self.file_version = '{0:03d}'.format(latest_version)
         if self.folder_version:
             self.folder_version = self.file_version
@@ -375,14 +531,20 @@ class EveFilePath:
         self.set_path(file_path)
 
     # File version solver
-    def version_control(self):
+    def version_control(self, interactive=True):
         """
         Check if provided FILE (FOLDER) path exists.
             If not - return the same path.
             If exists - ask user save next version or overwrite. Return new path based on user decision
+
+        :param interactive: bool, False to save the latest version without asking (batch hython, no UI)
         """
 
-        if not os.path.exists(self.path):
+        if not path_exists(self.path):
+            print('>> File saved to a new version: {}'.format(self.name))
+            return self.path
+        elif not interactive:
+            self.build_latest_file_version()
             print('>> File saved to a new version: {}'.format(self.name))
             return self.path
         else:
@@ -0,0 +1,139 @@
+"""
+Create project folder structure on disk.
+
+Folder template is a nested list: [['PROD', [['3D', [['scenes', []]]]]], ['EDIT', []]].
+The template is flattened to a set of unique paths, existing folders are checked and missing ones are created level by
+level (parents before children) with a bounded thread pool, so network shares are not hit with one request at a time:
+
+    folders = flatten_template(project_root, template)
+    get_missing_folders(folders)                # Diff: folders which are not on disk yet
+    create_folders(folders, dry_run=True)       # Report folders which would be created
+    create_folders(folders)                     # Create them
+"""
+
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def flatten_template(root, folders_template):
+    """
+    Convert nested folder template to the list of unique folder paths, parents first
+
+    :param root: string, root folder of the structure
+    :param folders_template: list of lists [[folder name, [children]]]
+    :return: list of folder paths, sorted by depth and name
+    """
+
+    folders = {root}
+    stack = [(root, folders_template)]
+
+    while stack:
+        parent, template = stack.pop()
+        for folder_name, children in template or []:
+            path = '{0}/{1}'.format(parent, folder_name)
+            folders.add(path)
+            if children:
+                stack.append((path, children))
+
+    return sorted(folders, key=lambda path: (path.count('/'), path))
+
+
+def group_by_depth(folders):
+    """
+    Split sorted folders list into levels: [[depth N paths], [depth N + 1 paths], ...]
+    """
+
+    levels = []
+    depth = None
+
+    for path in folders:
+        path_depth = path.count('/')
+        if path_depth != depth:
+            levels.append([])
+            depth = path_depth
+        levels[-1].append(path)
+
+    return levels
+
+
+def run_parallel(executor, function, paths, max_workers):
+    """
+    Call function for every path in thread pool, paths are sent to workers in chunks to keep pool overhead low
+    on fast local disks
+
+    :return: list of function results in paths order
+    """
+
+    chunk_size = max(1, -(-len(paths) // (max_workers * 4)))
+    chunks = [paths[index:index + chunk_size] for index in range(0, len(paths), chunk_size)]
+
+    results = []
+    for chunk_results in executor.map(lambda chunk: list(map(function, chunk)), chunks):
+        results.extend(chunk_results)
+
+    return results
+
+
+def get_missing_folders(folders, max_workers=8):
+    """
+    Get folders which do not exist on disk. Children of missing folders are not checked.
+
+    :param folders: list of folder paths, parents first (flatten_template result)
+    :param max_workers: integer, number of parallel file system requests
+    :return: list of missing folder paths, parents first
+    """
+
+    missing = []
+    missing_set = set()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for level in group_by_depth(folders):
+            # Parent is missing, so the folder is missing too, no need to ask file system
+            to_check = []
+            for path in level:
+                if os.path.dirname(path) in missing_set:
+                    missing.append(path)
+                    missing_set.add(path)
+                else:
+                    to_check.append(path)
+
+            for path, exists in zip(to_check, run_parallel(executor, os.path.isdir, to_check, max_workers)):
+                if not exists:
+                    missing.append(path)
+                    missing_set.add(path)
+
+    return sorted(missing, key=lambda path: (path.count('/'), path))
+
+
+def make_folder(path):
+
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        # Parent of the structure root does not exist
+        os.makedirs(path, exist_ok=True)
+
+
+def create_folders(folders, max_workers=8, dry_run=False):
+    """
+    Create missing folders, all folders of one level are created in parallel
+
+    :param folders: list of folder paths, parents first (flatten_template result)
+    :param max_workers: integer, number of parallel file system requests
+    :param dry_run: bool, don't create folders, only report them
+    :return: list of created (missing for dry run) folder paths
+    """
+
+    missing = get_missing_folders(folders, max_workers)
+    if dry_run:
+        return missing
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for level in group_by_depth(missing):
+            # Level is finished before its children are created
+            run_parallel(executor, make_folder, level, max_workers)
+
+    return missing
@@ -0,0 +1,128 @@
+"""
+Frame sequences of Eve files (renders, caches): 'S:/location/001/code_name_001.%03d.exr'
+
+    frames = list_frames(sequence_path)                           # [1, 2, 3, 5, 6]
+    collapse_frames(frames)                                       # '1-3,5-6'
+    expand_frames('1-3,5-6')                                      # [1, 2, 3, 5, 6]
+    find_missing_frames(frames, shot.start_frame, shot.end_frame)  # [4]
+
+Existing frames are found in one pass over cached listing of the sequence folder (file_path.list_directory):
+file names are matched with one regex over the joined listing, no path objects are created per frame.
+"""
+
+
+import os
+import re
+import operator
+import functools
+import itertools
+from . import file_path
+
+
+# Frame number in file name, may be negative (pre-roll): 'code_name_001.-001.exr'
+FRAME = r'-?\d+'
+FRAME_PATTERN = re.compile(FRAME)
+
+
+@functools.lru_cache(maxsize=256)
+def get_frame_pattern(file_code, file_version, file_extension):
+    """
+    Compile regex for <file_code>_<file_version>.<frame>.<extension> lines of joined folder listing
+    """
+
+    prefix = os.path.normcase('{0}_{1}.'.format(file_code, file_version))
+    suffix = os.path.normcase('.{0}'.format(file_extension))
+
+    return re.compile(r'^{0}({1}){2}$'.format(re.escape(prefix), FRAME, re.escape(suffix)),
+                      re.MULTILINE | file_path.NAME_FLAGS)
+
+
+def list_frames(sequence_path):
+    """
+    Get frame numbers of sequence files existing on disk
+
+    :param sequence_path: string, sequence path with any frame token: 'S:/location/001/code_name_001.%03d.exr'
+    :return: sorted list of integer frame numbers, empty if location does not exist
+    """
+
+    eve_path = file_path.parse_eve_path(sequence_path)
+    if not eve_path or eve_path.type != 'sequence':
+        print('>> ERROR! Path is not a file sequence: {}'.format(sequence_path))
+        return []
+
+    pattern = get_frame_pattern(eve_path.code, eve_path.file_version, eve_path.extension)
+
+    # Match all file names at once, folders are skipped
+    listing = file_path.list_directory(eve_path.location)
+    file_names = '\n'.join(itertools.compress(listing.keys(), map(operator.not_, listing.values())))
+
+    frames = list(map(int, pattern.findall(file_names)))
+    frames.sort()
+
+    return frames
+
+
+def collapse_frames(frames):
+    """
+    Convert frame numbers to compact ranges string
+
+    :param frames: list of integer frame numbers, [1, 2, 3, 5, 7, 8]
+    :return: string, '1-3,5,7-8'
+    """
+
+    ranges = []
+    frames = sorted(set(frames))
+
+    start = end = None
+    for frame in frames:
+        if end is not None and frame == end + 1:
+            end = frame
+            continue
+
+        if start is not None:
+            ranges.append((start, end))
+        start = end = frame
+
+    if start is not None:
+        ranges.append((start, end))
+
+    return ','.join(str(start) if start == end else '{0}-{1}'.format(start, end) for start, end in ranges)
+
+
+def expand_frames(frame_ranges):
+    """
+    Convert ranges string to frame numbers
+
+    :param frame_ranges: string, '1-3,5,7-8'
+    :return: sorted list of integer frame numbers, [1, 2, 3, 5, 7, 8]
+    """
+
+    frames = set()
+
+    for frame_range in frame_ranges.split(','):
+        frame_range = frame_range.strip()
+        if not frame_range:
+            continue
+
+        # Negative frames: '-5--1'
+        start, separator, end = frame_range[1:].partition('-')
+        start = frame_range[0] + start
+        if separator:
+            frames.update(range(int(start), int(end) + 1))
+        else:
+            frames.add(int(start))
+
+    return sorted(frames)
+
+
+def find_missing_frames(frames, start_frame, end_frame):
+    """
+    Get frames of the shot range which are not in the list
+
+    :param frames: list of integer frame numbers existing on disk
+    :param start_frame: integer, first frame of the shot
+    :param end_frame: integer, last frame of the shot
+    :return: sorted list of missing integer frame numbers
+    """
+
+    return sorted(set(range(start_frame, end_frame + 1)).difference(frames))
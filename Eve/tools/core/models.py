@@ -35,3 +35,161 @@ class ListModel(QtCore.QAbstractListModel):
             return data.id
         if role == QtCore.Qt.UserRole + 2:  # Return NAME
             return data.name
+
+    def index_of(self, item_id):
+        """
+        Get model index of the item by database ID, invalid index if item is not in the model
+        """
+
+        for row, item in enumerate(self._data):
+            if item.id == item_id:
+                return self.index(row, 0)
+
+        return QtCore.QModelIndex()
+
+    def get_items(self, model_indexes):
+        """
+        Get entity objects displayed in rows of model indexes (selected rows), without database queries
+        """
+
+        return [self._data[model_index.row()] for model_index in model_indexes if model_index.isValid()]
+
+    def append_items(self, items):
+        """
+        Add items to the end of the model (incremental fill from DataService results)
+        """
+
+        if not items:
+            return
+
+        first_row = len(self._data)
+        self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(items) - 1)
+        self._data.extend(items)
+        self.endInsertRows()
+
+    def merge_items(self, items):
+        """
+        Add items loaded in background (DataService results) which are not in the model yet (matched by database ID).
+        Rows added to the model while items were loading are kept, existing rows are not reset, so selection stays.
+        """
+
+        item_ids = set(item.id for item in self._data)
+
+        self.append_items([item for item in items if item.id not in item_ids])
+
+    def remove_items(self, items):
+        """
+        Remove items (matched by database ID) from the model, each run of adjacent rows is removed with one
+        beginRemoveRows call
+        """
+
+        item_ids = set(item.id for item in items)
+        rows = [row for row, item in enumerate(self._data) if item.id in item_ids]
+
+        # Remove from the end so row numbers of remaining runs stay valid
+        while rows:
+            last_row = rows.pop()
+            first_row = last_row
+            while rows and rows[-1] == first_row - 1:
+                first_row = rows.pop()
+
+            self.beginRemoveRows(QtCore.QModelIndex(), first_row, last_row)
+            del self._data[first_row:last_row + 1]
+            self.endRemoveRows()
+
+    def clear_items(self):
+        """
+        Remove all items from the model
+        """
+
+        self.beginResetModel()
+        del self._data[:]
+        self.endResetModel()
+
+
+class PagedListModel(ListModel):
+    """
+    Lazy list model: rows are loaded from database page by page when view scrolls (canFetchMore/fetchMore).
+    Filtering and sorting by name are done by database query, not in Python.
+
+    fetch_page is a function: fetch_page(after, limit, name_filter, descending) -> list of entities,
+    where "after" is (name, id) of the last loaded entity (EveData.fetch_page with bound table and parent).
+    """
+
+    def __init__(self, fetch_page, page_size=200, parent=None):
+        ListModel.__init__(self, [], parent)
+
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.name_filter = ''
+        self.descending = False
+        self.has_more = True
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+
+        if parent.isValid():
+            return 0
+
+        return len(self._data)
+
+    def canFetchMore(self, parent):
+
+        if parent.isValid():
+            return False
+
+        return self.has_more
+
+    def fetchMore(self, parent):
+
+        if parent.isValid() or not self.has_more:
+            return
+
+        after = None
+        if self._data:
+            after = (self._data[-1].name, self._data[-1].id)
+
+        items = self.fetch_page(after, self.page_size, self.name_filter, self.descending)
+        self.has_more = len(items) == self.page_size
+
+        if items:
+            first_row = len(self._data)
+            self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(items) - 1)
+            self._data.extend(items)
+            self.endInsertRows()
+
+    def index_of(self, item_id):
+        """
+        Get model index of the item by database ID, pages are loaded until item is found
+        """
+
+        model_index = ListModel.index_of(self, item_id)
+        while not model_index.isValid() and self.has_more:
+            first_row = len(self._data)
+            self.fetchMore(QtCore.QModelIndex())
+            for row in range(first_row, len(self._data)):
+                if self._data[row].id == item_id:
+                    return self.index(row, 0)
+
+        return model_index
+
+    def refresh(self):
+        """
+        Drop loaded rows and load first page again
+        """
+
+        self.beginResetModel()
+        del self._data[:]
+        self.has_more = True
+        self.endResetModel()
+
+        self.fetchMore(QtCore.QModelIndex())
+
+    def set_filter(self, name_filter):
+
+        self.name_filter = name_filter
+        self.refresh()
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+
+        self.descending = order == QtCore.Qt.DescendingOrder
+        self.refresh()
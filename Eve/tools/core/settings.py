@@ -4,11 +4,17 @@ Eve pipeline core settings
 
 # Path to Eve SQL database file
 SQL_FILE_PATH = '{0}/data/eve.db'
+# Path to project files index database
+FILE_INDEX_PATH = '{0}/data/file_index.db'
 # Folder with projects
 PROJECTS = 'C:/Users/kko8/OneDrive/projects'
 # Houdini bin
 default_build = '19.5.368'
 HOUDINI = 'E:/Programs/Houdini{0}/bin/houdini.exe'
+# Houdini batch (no UI) Python interpreter, used by launch farm
+HYTHON = 'E:/Programs/Houdini{0}/bin/hython.exe'
+# Launch farm job logs
+FARM_LOG_PATH = '{0}/data/farm_logs'
 # Unreal Engine bin
 UNREAL = 'E:/Programs/Epic Games/UE_5.5/Engine/Binaries/Win64/UnrealEditor.exe'
 # File formats
@@ -72,6 +72,7 @@ class AssetManager(QtWidgets.QDialog, ui_asset_manager.Ui_AssetManager):
             if not os.path.exists(asset_file_path.location):
                 os.makedirs(asset_file_path.location)
             hou.hipFile.save(scene_path)
+            file_path.clear_listing_cache(asset_file_path.location)
 
     def open_asset_scene(self):
 
@@ -18,7 +18,8 @@ asset_data = asset_data.AssetData(settings.SQL_FILE_PATH.format(eve_root), asset
 file_type = entities.EveFile.file_types['asset_hip']
 file_path_asset = file_path.EveFilePath()
 file_path_asset.build_path_asset_hip(file_type, asset_data.asset_type, asset_data.asset.name, '001')
-scene_path = file_path_asset.version_control()
+# Batch hython (Project Manager farm jobs) has no UI to ask about existing scene, next version is saved
+scene_path = file_path_asset.version_control(interactive=hou.isUIAvailable())
 
 # Save file
 if scene_path:
@@ -18,5 +18,6 @@ def save_next_version():
 
         if scene_path:
             hou.hipFile.save(scene_path)
+            file_path.clear_listing_cache(scene_file.location)
     else:
         print('>> Houdini file is not saved yet. Save scene first!')
@@ -81,7 +81,7 @@ class ShotManager(QtWidgets.QDialog, ui_shot_manager.Ui_ShotManager):
         shot = self.eve_data.get_shot(shot_id)
 
         if shot:
-            self.selected_shot = self.eve_data.get_shot(shot.id)
+            self.selected_shot = shot
 
     def run_create_render_scene(self):
 
@@ -100,6 +100,7 @@ class ShotManager(QtWidgets.QDialog, ui_shot_manager.Ui_ShotManager):
         # Save file
         if scene_path:
             hou.hipFile.save(scene_path)
+            file_path.clear_listing_cache(shot_file_path.location)
 
     def run_open_render_scene(self):
         """
@@ -1,7 +1,21 @@
 import os
+import time
+import types
+import functools
+import threading
 import subprocess
 
 
+# HDA folders scan cache: {hda root: {'checked': time, 'folders': {path: (mtime_ns, [subfolder paths])}, 'paths': [..]}}
+# Launch uses cached scan if it was checked less than HDA_SCAN_INTERVAL seconds ago and HDA root folder is not modified,
+# background refresher keeps it fresh.
+# Refreshers: {hda root: (stop event, thread)}, one per project, stopped when another project is selected.
+HDA_SCAN_INTERVAL = 30
+_hda_scans = {}
+_hda_scans_lock = threading.Lock()
+_hda_refreshers = {}
+
+
 def combine_paths(list_paths):
     """
     Combine paths string from list of paths
@@ -11,15 +25,133 @@ def combine_paths(list_paths):
     filter_folders = ['backup']
     path_HDA = ''
 
-    for folder in list_paths:
-        path = folder[0].replace('\\', '/')
+    for path in list_paths:
         # Filter unnecessary folders
         if not path.split('/')[-1] in filter_folders:
-            path_HDA += '{};'.format(folder[0].replace('\\', '/'))
+            path_HDA += '{};'.format(path)
 
     return path_HDA
 
 
+def scan_hda_folders(hda_root):
+    """
+    Get HDA root and all its subfolders, top-down. Scan is incremental: every known folder is checked with one stat,
+    only folders with changed modification time (subfolder added, removed or renamed) are listed.
+
+    :param hda_root: string, HDA library folder
+    :return: list of folder paths
+    """
+
+    with _hda_scans_lock:
+        known_folders = _hda_scans.get(hda_root, {}).get('folders', {})
+
+    folders = {}
+    paths = []
+    stack = [hda_root]
+
+    while stack:
+        path = stack.pop()
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+
+        known = known_folders.get(path)
+        if known and known[0] == mtime_ns:
+            subfolders = known[1]
+        else:
+            with os.scandir(path) as entries:
+                subfolders = sorted('{0}/{1}'.format(path, entry.name) for entry in entries if entry.is_dir())
+
+            # Listing taken in the same mtime tick as the last modification can miss folders, list it next time
+            if time.time_ns() - mtime_ns < 2000000000:
+                mtime_ns = None
+
+        folders[path] = (mtime_ns, subfolders)
+        paths.append(path)
+        stack.extend(reversed(subfolders))
+
+    with _hda_scans_lock:
+        _hda_scans[hda_root] = {'checked': time.time(), 'folders': folders, 'paths': paths}
+
+    return paths
+
+
+def get_hda_folders(hda_root):
+    """
+    Get HDA folders from cache, scan them if cache is older than HDA_SCAN_INTERVAL or HDA root folder was modified
+    (library folder published or removed) since the scan. Scan of changed cache lists only modified folders.
+    """
+
+    with _hda_scans_lock:
+        scan = _hda_scans.get(hda_root)
+
+    if scan and time.time() - scan['checked'] < HDA_SCAN_INTERVAL:
+        try:
+            mtime_ns = os.stat(hda_root).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        if hda_root in scan['folders'] and scan['folders'][hda_root][0] == mtime_ns:
+            return scan['paths']
+
+    return scan_hda_folders(hda_root)
+
+
+def start_hda_refresher(root_3d):
+    """
+    Keep HDA folders scan of the project up to date in background thread, so Houdini launch does not wait for it
+    :param root_3d: string, project 3D root (E:/projects/Avatar/PROD/3D)
+    """
+
+    hda_root = '{0}/hda'.format(root_3d)
+
+    with _hda_scans_lock:
+        if hda_root in _hda_refreshers:
+            return
+
+        stop_event = threading.Event()
+        refresher = threading.Thread(target=refresh_hda_folders, args=(hda_root, stop_event), daemon=True)
+        _hda_refreshers[hda_root] = (stop_event, refresher)
+
+    refresher.start()
+
+
+def stop_hda_refreshers(keep_root_3d=None):
+    """
+    Stop background HDA scans of projects which are not used anymore, threads finish after current scan
+    :param keep_root_3d: string, project 3D root which refresher keeps running, None to stop all
+    :return: list of stopped threads
+    """
+
+    keep_hda_root = '{0}/hda'.format(keep_root_3d)
+    stopped = []
+
+    with _hda_scans_lock:
+        for hda_root in list(_hda_refreshers):
+            if hda_root == keep_hda_root:
+                continue
+
+            stop_event, refresher = _hda_refreshers.pop(hda_root)
+            stop_event.set()
+            stopped.append(refresher)
+
+    return stopped
+
+
+def refresh_hda_folders(hda_root, stop_event):
+
+    while not stop_event.is_set():
+        try:
+            scan_hda_folders(hda_root)
+        except OSError as error:
+            print('>> ERROR! HDA folders scan failed: {}'.format(error))
+
+        # Refresh a bit earlier than cache expires
+        stop_event.wait(HDA_SCAN_INTERVAL * 0.8)
+
+
 def get_hda_path(root_3d):
     """
     Build HOUDINI_OTLSCAN_PATH env variable value:
@@ -28,18 +160,14 @@ def get_hda_path(root_3d):
     """
 
     # Get list of sub folders
-    list_paths_HDA = os.walk('{0}/hda'.format(root_3d))  # HDA
-    # list_paths_MTL = os.walk('{0}/lib/MATERIALS'.format(root3D))  # Material library
-    # list_paths_LIT = os.walk('{0}/lib/LIGHTS'.format(root3D))  # Light library
-
-    # Global HDA library path (WIP! TBD!)
-    list_paths_LIB = os.walk('')  # Global HDA (between projects)
+    list_paths_HDA = get_hda_folders('{0}/hda'.format(root_3d))  # HDA
+    # list_paths_MTL = get_hda_folders('{0}/lib/MATERIALS'.format(root3D))  # Material library
+    # list_paths_LIT = get_hda_folders('{0}/lib/LIGHTS'.format(root3D))  # Light library
 
     # Combine paths to a string
     path_HDA = combine_paths(list_paths_HDA)
     # combine_paths(list_paths_MTL)
     # combine_paths(list_paths_LIT)
-    # combine_paths(list_paths_LIB)
 
     # Add Houdini standard OTLs
     path_HDA = path_HDA + '&'
@@ -47,66 +175,104 @@ def get_hda_path(root_3d):
     return path_HDA
 
 
-def run_houdini(eve_root, projects_root, HOUDINI, project_name, script=None, id=None):
+def build_environment(eve_root, projects_root, project_name, build):
     """
-    Launch Houdini within project environment
+    Get environment of Houdini process for the project. This process environment (os.environ) is not changed,
+    result is passed to subprocess.Popen(env=...).
 
     :param eve_root: {E:/Eve/Eve}
     :param projects_root: (E:/256/PROJECTS)
-    :param HOUDINI: (C:/Program Files/Side Effects Software/Houdini 18.0.460/bin/houdinifx.exe)
     :param project_name: (Inception)
+    :param build: Houdini build (19.5.368)
+    :return: read-only dictionary {variable: value}
+    """
 
-    # Rebelway ML course
-    py3_libs = 'C:/Users/kko8/AppData/Local/Programs/Python/Python310/Lib/site-packages'
-    ubuntu_libs = "//wsl.localhost/Ubuntu/home/kiryha/miniconda3/envs/houdini/lib/python3.10/site-packages"
-    os.environ['PYTHONPATH'] = os.pathsep.join([os.environ['PYTHONPATH'], py3_libs])
+    root_3d = '{0}/{1}/PROD/3D'.format(projects_root, project_name)
 
-    # Icons
-    # os.environ['HOUDINI_UI_ICON_PATH'] = '{}/EVE/icons'.format(rootPipeline)
-    # Houdini current user pref folder in MyDocuments (win)
-    # os.environ['home'] = '{}/Documents/houdiniUserPrefs'.format(os.path.expanduser("~"))
+    # Houdini inherits current environment of the launcher process (PATH, SYSTEMROOT etc.), read on every launch
+    environment = dict(os.environ)
 
-    # Setup Redshift
-    # os.environ['HOUDINI_DSO_ERROR'] = '2'
-    # os.environ['PATH'] += ';' + 'C:/ProgramData/Redshift/bin;$PATH'
-    path = 'C:/ProgramData/Redshift/Plugins/Houdini/{0};{1}'.format(build, os.environ['HOUDINI_PATH']
-    # os.environ['HOUDINI_PATH'] = path)
+    # HDA folders are scanned separately, new HDA folder gives new project variables
+    environment.update(_build_project_variables(eve_root, projects_root, project_name, build, get_hda_path(root_3d)))
+
+    return types.MappingProxyType(environment)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_project_variables(eve_root, projects_root, project_name, build, hda_path):
+    """
+    Get Eve variables of the project, without launcher process environment
     """
 
-    # SETUP PROJECT ENVIRONMENT
     root_3d = '{0}/{1}/PROD/3D'.format(projects_root, project_name)
     project_root = '{0}/{1}'.format(projects_root, project_name)
+    environment = {}
 
     # Eve location ('E:/Eve')
-    os.environ['EVE_ROOT'] = '{0}'.format(eve_root)
+    environment['EVE_ROOT'] = '{0}'.format(eve_root)
     # Project Root folder ('E:/projects/<project_name>')
-    os.environ['EVE_PROJECT'] = project_root
+    environment['EVE_PROJECT'] = project_root
     # Project Name
-    os.environ['EVE_PROJECT_NAME'] = '{0}'.format(project_name)
+    environment['EVE_PROJECT_NAME'] = '{0}'.format(project_name)
+    # Houdini build of the project
+    environment['EVE_HOUDINI_BUILD'] = '{0}'.format(build)
     # Root of houdini project
-    os.environ['JOB'] = root_3d
+    environment['JOB'] = root_3d
     # Houdini digital assets folder including sub folders
-    os.environ['HOUDINI_OTLSCAN_PATH'] = get_hda_path(root_3d)
+    environment['HOUDINI_OTLSCAN_PATH'] = hda_path
     # Houdini path
-    os.environ['HOUDINI_PATH'] = '{0}/tools/houdini/settings;&'.format(eve_root)
+    environment['HOUDINI_PATH'] = '{0}/tools/houdini/settings;&'.format(eve_root)
     # Custom vex modules
-    os.environ['HOUDINI_VEX_PATH'] = '{0}/tools/houdini/vex;&'.format(eve_root)
+    environment['HOUDINI_VEX_PATH'] = '{0}/tools/houdini/vex;&'.format(eve_root)
     # Path to custom python tools
-    os.environ['PYTHONPATH'] = '{0}/tools'.format(eve_root)  # from houdini import create_asset
+    python_paths = ['{0}/tools'.format(eve_root)]  # from houdini import create_asset
     shape_grammar_module = f'{eve_root}/lib/python/shape_grammar/'
     # shape_grammar_module =  f'{project_root}/prod/3d/lib/python/'
-    os.environ['PYTHONPATH'] = os.pathsep.join([os.environ['PYTHONPATH'], shape_grammar_module])
+    python_paths.append(shape_grammar_module)
 
     # Add path to Neuron DATAGEN
-    neuron_module = 'C:/Users/kko8/OneDrive/dev/neuron'  
-    os.environ['PYTHONPATH'] = os.pathsep.join([os.environ['PYTHONPATH'], neuron_module])
+    neuron_module = 'C:/Users/kko8/OneDrive/dev/neuron'
+    python_paths.append(neuron_module)
+    environment['PYTHONPATH'] = os.pathsep.join(python_paths)
+
+    return types.MappingProxyType(environment)
+
+
+def run_houdini(eve_root, projects_root, HOUDINI, project_name, build, script=None, id=None):
+    """
+    Launch Houdini within project environment
+
+    :param eve_root: {E:/Eve/Eve}
+    :param projects_root: (E:/256/PROJECTS)
+    :param HOUDINI: (C:/Program Files/Side Effects Software/Houdini 18.0.460/bin/houdinifx.exe)
+    :param project_name: (Inception)
+    :param build: Houdini build (19.5.368)
+
+    # Rebelway ML course
+    py3_libs = 'C:/Users/kko8/AppData/Local/Programs/Python/Python310/Lib/site-packages'
+    ubuntu_libs = "//wsl.localhost/Ubuntu/home/kiryha/miniconda3/envs/houdini/lib/python3.10/site-packages"
+    os.environ['PYTHONPATH'] = os.pathsep.join([os.environ['PYTHONPATH'], py3_libs])
+
+    # Icons
+    # os.environ['HOUDINI_UI_ICON_PATH'] = '{}/EVE/icons'.format(rootPipeline)
+    # Houdini current user pref folder in MyDocuments (win)
+    # os.environ['home'] = '{}/Documents/houdiniUserPrefs'.format(os.path.expanduser("~"))
+
+    # Setup Redshift
+    # os.environ['HOUDINI_DSO_ERROR'] = '2'
+    # os.environ['PATH'] += ';' + 'C:/ProgramData/Redshift/bin;$PATH'
+    path = 'C:/ProgramData/Redshift/Plugins/Houdini/{0};{1}'.format(build, os.environ['HOUDINI_PATH']
+    # os.environ['HOUDINI_PATH'] = path)
+    """
+
+    environment = build_environment(eve_root, projects_root, project_name, build)
 
     if script:
         # command = ['C:/temp/asset.hipnc'], ['C:/temp/script.py'], 'AAA', 'BBB'
         # command = ['C:/temp/script.py'], 'AAA', 'BBB'
-        subprocess.Popen([HOUDINI, [script], str(id)])
+        subprocess.Popen([HOUDINI, script, str(id)], env=environment)
     else:
-        subprocess.Popen(HOUDINI)
+        subprocess.Popen(HOUDINI, env=environment)
 
     # Prevent closing CMD window
     # raw_input()
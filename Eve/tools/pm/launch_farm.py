@@ -0,0 +1,199 @@
+"""
+Run batch Houdini jobs: Python scripts (houdini/create_asset.py) executed by hython in a bounded pool of processes,
+each job writes its output to a log file, exit codes and timing are collected and reported:
+
+    jobs = build_script_jobs('{0}/tools/houdini/create_asset.py'.format(eve_root), asset_ids)
+    env = houdini_launcher.build_environment(eve_root, settings.PROJECTS, project_name, build)
+    results = run_jobs(settings.HYTHON.format(build), jobs, get_log_folder(eve_root), max_processes=4, env=env)
+    report(results)
+
+Jobs run with project environment (houdini_launcher.build_environment) passed to each process.
+Any executable accepting "<script> <arguments>" can be used instead of hython (python with a fake script in tests).
+
+Run from Eve/tools/pm folder:
+    python launch_farm.py create_asset 1 2 3 4 --project Avatar --processes 4
+"""
+
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Set environment to run this file without launcher
+eve_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).replace('\\', '/')
+if f'{eve_root}/tools' not in sys.path:
+    sys.path.append(f'{eve_root}/tools')
+
+from core import settings
+
+import houdini_launcher
+
+
+class Job(NamedTuple):
+    name: str  # Unique job name, used for log file name: 'create_asset_12'
+    script: str
+    arguments: tuple
+
+
+class JobResult(NamedTuple):
+    job: Job
+    return_code: int  # None if process did not start or was killed by timeout
+    log_path: str
+    start: float  # time.perf_counter() of process start
+    duration: float
+
+
+def build_script_jobs(script, ids):
+    """
+    Create one job per database ID for script which takes ID as the last argument (create_asset.py).
+    Repeated IDs get one job.
+
+    :param script: string, path to python script
+    :param ids: list of integer IDs
+    :return: list of Job
+    """
+
+    script_name = os.path.splitext(os.path.basename(script))[0]
+
+    return [Job('{0}_{1}'.format(script_name, id), script, (str(id),)) for id in dict.fromkeys(ids)]
+
+
+def get_log_folder(eve_root):
+    """
+    Build new log folder path for one farm run: E:/Eve/data/farm_logs/20240131_154512
+    """
+
+    return '{0}/{1}'.format(settings.FARM_LOG_PATH.format(eve_root), time.strftime('%Y%m%d_%H%M%S'))
+
+
+def run_job(executable, job, log_folder, env=None, timeout=None):
+    """
+    Run one job and wait for it to finish, stdout and stderr are written to <log_folder>/<job name>.log
+
+    :param executable: string, hython path
+    :param job: Job
+    :param log_folder: string, existing folder for log file
+    :param env: dictionary of environment variables, None to use environment of this process
+    :param timeout: seconds, process is killed if it runs longer
+    :return: JobResult
+    """
+
+    log_path = '{0}/{1}.log'.format(log_folder, job.name)
+    return_code = None
+    start = time.perf_counter()
+
+    with open(log_path, 'w') as log:
+        try:
+            process = subprocess.Popen([executable, job.script] + list(job.arguments),
+                                       stdout=log, stderr=subprocess.STDOUT, env=env)
+        except OSError as error:
+            log.write('>> ERROR! Job process failed to start: {}\n'.format(error))
+        else:
+            try:
+                return_code = process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                log.write('\n>> ERROR! Job killed after {} sec timeout\n'.format(timeout))
+
+    return JobResult(job, return_code, log_path, start, time.perf_counter() - start)
+
+
+def run_jobs(executable, jobs, log_folder, max_processes=4, env=None, timeout=None):
+    """
+    Run jobs, not more than max_processes at once
+
+    :param executable: string, hython path
+    :param jobs: list of Job
+    :param log_folder: string, folder for job logs, created if not exists
+    :param max_processes: integer, number of parallel processes
+    :param env: dictionary of environment variables, None to use environment of this process
+    :param timeout: seconds, job process is killed if it runs longer
+    :return: list of JobResult in jobs order
+    """
+
+    # Job name is the key of job result and log file
+    job_names = [job.name for job in jobs]
+    if len(set(job_names)) != len(job_names):
+        raise ValueError('Job names are not unique: {}'.format(
+            sorted(name for name in set(job_names) if job_names.count(name) > 1)))
+
+    os.makedirs(log_folder, exist_ok=True)
+    results = {}
+
+    # Each pool thread waits for one process at a time
+    with ThreadPoolExecutor(max_workers=max_processes) as executor:
+        futures = [executor.submit(run_job, executable, job, log_folder, env, timeout) for job in jobs]
+
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.job.name] = result
+
+            status = 'done' if result.return_code == 0 else 'FAILED ({})'.format(result.return_code)
+            print('>> [{0}/{1}] {2} {3} in {4:.2f} sec'.format(len(results), len(jobs), result.job.name, status,
+                                                              result.duration))
+
+    return [results[job.name] for job in jobs]
+
+
+def report(results):
+    """
+    Print farm run summary: failed jobs with log files, wall time, throughput and job timing
+
+    :param results: list of JobResult
+    :return: list of failed JobResult
+    """
+
+    if not results:
+        print('>> No jobs to run')
+        return []
+
+    failed = [result for result in results if result.return_code != 0]
+    for result in failed:
+        print('>> ERROR! Job {0} failed with exit code {1}, see {2}'.format(result.job.name, result.return_code,
+                                                                            result.log_path))
+
+    durations = sorted(result.duration for result in results)
+    wall_time = max(result.start + result.duration for result in results) - min(result.start for result in results)
+
+    print('>> {0} jobs: {1} done, {2} failed in {3:.2f} sec ({4:.2f} jobs/min)'.format(
+        len(results), len(results) - len(failed), len(failed), wall_time, len(results) * 60 / max(wall_time, 1e-6)))
+    print('>> Job time: min {0:.2f}, average {1:.2f}, max {2:.2f} sec'.format(
+        durations[0], sum(durations) / len(durations), durations[-1]))
+
+    return failed
+
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description='Run Houdini batch jobs for database IDs')
+    parser.add_argument('script', help='Script name in tools/houdini (create_asset) or path to python script')
+    parser.add_argument('ids', nargs='+', type=int, help='Database IDs, one job per ID')
+    parser.add_argument('--project', required=True, help='Project name')
+    parser.add_argument('--build', default=settings.default_build, help='Houdini build')
+    parser.add_argument('--hython', help='hython executable, overrides --build')
+    parser.add_argument('--processes', type=int, default=4, help='Number of parallel hython processes')
+    parser.add_argument('--timeout', type=float, help='Kill jobs running longer, seconds')
+    arguments = parser.parse_args(arguments)
+
+    script = arguments.script
+    if not script.endswith('.py'):
+        script = '{0}/tools/houdini/{1}.py'.format(eve_root, script)
+
+    results = run_jobs(arguments.hython or settings.HYTHON.format(arguments.build),
+                       build_script_jobs(script, arguments.ids),
+                       get_log_folder(eve_root),
+                       max_processes=arguments.processes,
+                       env=houdini_launcher.build_environment(eve_root, settings.PROJECTS, arguments.project,
+                                                              arguments.build),
+                       timeout=arguments.timeout)
+
+    return 1 if report(results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,7 @@
 import os
 import sys
 import sqlite3
+import functools
 import subprocess
 import webbrowser
 from PySide6 import QtCore, QtWidgets, QtGui
@@ -31,8 +32,11 @@ from core.database import entities
 from core.database import eve_data
 from core import settings
 from core import models
+from core import data_service
+from core import folder_structure
 
 import houdini_launcher
+import launch_farm
 
 # TODO: remove asset_types and file_types database tables, use Asset.asset_types and EveFile.file_types instead
 
@@ -66,7 +70,7 @@ class LinkAssets(QtWidgets.QDialog, ui_link_assets.Ui_LinkAssets):
         self.parent = parent
 
         self.shot = None
-        self.project_assets = None
+        self.project = None
         self.model_assets = None
 
         self.btnLinkAssets.clicked.connect(self.link_asset)
@@ -82,8 +86,9 @@ class LinkAssets(QtWidgets.QDialog, ui_link_assets.Ui_LinkAssets):
         # self.asset_ui.linAssetName.clear()
         # self.asset_ui.txtDescription.clear()
         #
-        # Add assets to ui
-        self.model_assets = models.ListModel(self.project_assets)
+        # Add assets to ui, loaded page by page
+        fetch_assets = functools.partial(self.parent.eve_data.fetch_page, 'assets', self.project.id)
+        self.model_assets = models.PagedListModel(fetch_assets)
         self.listAssets.setModel(self.model_assets)
 
     def link_asset(self):
@@ -91,8 +96,8 @@ class LinkAssets(QtWidgets.QDialog, ui_link_assets.Ui_LinkAssets):
         Link assets to the shots
         """
 
-        model_indexes = self.listAssets.selectedIndexes()
-        self.parent.link_assets(model_indexes, self.shot)
+        assets = self.model_assets.get_items(self.listAssets.selectedIndexes())
+        self.parent.link_assets(assets, self.shot)
 
 
 class ProjectUI(QtWidgets.QWidget, ui_project.Ui_Project):
@@ -387,11 +392,14 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
                 os.makedirs(os.path.dirname(self.SQL_FILE_PATH))
             self.create_database()
         self.eve_data = eve_data.EveData(self.SQL_FILE_PATH)
+        # Run queries and folder creation in background threads
+        self.data_service = data_service.DataService(self.eve_data, parent=self)
         self.model_projects = models.ListModel(self.eve_data.projects)
         self.model_assets = None
         self.model_sequences = None
         self.model_shots = None
         self.model_shot_assets = None
+        self.model_search = QtGui.QStandardItemModel(self)
 
         # Eve data
         self.selected_project = None
@@ -416,7 +424,14 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         self.listProjects.clicked.connect(self.init_project)
         self.btnAddProject.clicked.connect(self.AP.exec_)
         self.btnDelProject.clicked.connect(self.del_project)
+        # Search
+        self.search_completer = QtWidgets.QCompleter(self.model_search, self)
+        self.search_completer.setCompletionMode(QtWidgets.QCompleter.UnfilteredPopupCompletion)
+        self.linSearch.setCompleter(self.search_completer)
+        self.linSearch.textEdited.connect(self.search)
+        self.search_completer.activated[QtCore.QModelIndex].connect(self.open_search_result)
         # Asset section
+        self.linFilterAssets.textChanged.connect(self.filter_assets)
         self.listAssets.clicked.connect(self.init_asset)
         self.btnAddAsset.clicked.connect(self.run_add_asset)
         self.btnDelAsset.clicked.connect(self.del_asset)
@@ -713,14 +728,16 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         project_id = model_index.data(QtCore.Qt.UserRole + 1)
         project = self.eve_data.get_project(project_id)
         self.selected_project = project
-        self.eve_data.get_project_assets(project)
-        self.eve_data.get_project_sequences(project)
 
         # Clear SHOTS in UI
         self.listShots.setModel(models.ListModel([]))
 
         # Fill Project Properties widget
         project_root = build_project_root(project.name)
+        # Scan HDA folders of selected project only
+        root_3d = '{0}/PROD/3D'.format(project_root)
+        houdini_launcher.stop_hda_refreshers(keep_root_3d=root_3d)
+        houdini_launcher.start_hda_refresher(root_3d)
         self.project_properties_ui.project_ui.linProjectLocation.setText(project_root)
         self.project_properties_ui.project_ui.linProjectLocation.setEnabled(False)
         self.project_properties_ui.project_ui.linProjectName.setText(project.name)
@@ -730,12 +747,15 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         self.project_properties_ui.project_ui.linProjectHeight.setText(str(project.height))
         self.project_properties_ui.project_ui.txtDescription.setText(project.description)
 
-        # FILL ASSET and SEQUENCE WIDGETS
-        self.model_assets = models.ListModel(self.eve_data.project_assets)
+        # FILL ASSET and SEQUENCE WIDGETS, assets are loaded page by page, sequences in background
+        fetch_assets = functools.partial(self.eve_data.fetch_page, 'assets', project.id)
+        self.model_assets = models.PagedListModel(fetch_assets)
         self.listAssets.setModel(self.model_assets)
+        self.linFilterAssets.clear()
 
-        self.model_sequences = models.ListModel(self.eve_data.project_sequences)
+        self.model_sequences = models.ListModel([])
         self.listSequences.setModel(self.model_sequences)
+        self.load_model(self.model_sequences, 'fetch_project_sequences', project.id)
 
         # Enable/disable UI buttons depending on project existence
         if os.path.exists(project_root):
@@ -796,8 +816,8 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         sequence = self.eve_data.get_sequence(sequence_id)
         self.selected_sequence = sequence
         # and shot
-        self.eve_data.get_sequence_shots(sequence.id)
-        self.model_shots = models.ListModel(self.eve_data.sequence_shots)
+        fetch_shots = functools.partial(self.eve_data.fetch_page, 'shots', sequence.id)
+        self.model_shots = models.PagedListModel(fetch_shots)
         self.listShots.setModel(self.model_shots)
 
         # Fill SEQUENCE WIDGET
@@ -824,9 +844,9 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         self.selected_shot = shot
 
         # FILL SHOT ASSETS WIDGET
-        self.eve_data.get_shot_assets(shot_id)
-        self.model_shot_assets = models.ListModel(self.eve_data.shot_assets)
+        self.model_shot_assets = models.ListModel([])
         self.shot_properties_ui.shot_ui.listAssets.setModel(self.model_shot_assets)
+        self.load_model(self.model_shot_assets, 'fetch_shot_assets', shot_id)
 
         # Fill SHOT WIDGET
         self.shot_properties_ui.shot_ui.linShotName.setEnabled(False)
@@ -839,6 +859,80 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         self.shot_properties_ui.shot_ui.linHeight.setText(str(shot.height))
         self.shot_properties_ui.shot_ui.txtDescription.setText(shot.description)
 
+    def load_model(self, model, method_name, *args):
+        """
+        Run EveData fetch method in background and fill the model with results.
+        Items added to the model while loading are kept, items which are already in results are not duplicated.
+        """
+
+        def fill_model(items):
+            # Skip results for models which were replaced by another selection while loading
+            if model in (self.model_sequences, self.model_shot_assets):
+                model.merge_items(items)
+
+        self.data_service.submit(method_name, *args, callback=fill_model)
+
+    def search(self, query):
+        """
+        Find assets and shots in database full text index and show them in search popup
+        """
+
+        self.model_search.clear()
+
+        for kind, entity in self.eve_data.search(query):
+            item = QtGui.QStandardItem('{0} ({1})'.format(entity.name, kind[:-1]))
+            item.setData(entity.id, QtCore.Qt.UserRole + 1)
+            item.setData(kind, QtCore.Qt.UserRole + 3)
+            self.model_search.appendRow(item)
+
+    def open_search_result(self, model_index):
+        """
+        Select asset or shot picked in search popup (and its project and sequence)
+        """
+
+        entity_id = model_index.data(QtCore.Qt.UserRole + 1)
+        kind = model_index.data(QtCore.Qt.UserRole + 3)
+
+        if kind == 'assets':
+            asset = self.eve_data.get_asset(entity_id)
+            self.select_project(asset.project)
+            self.linFilterAssets.setText(asset.name)
+            self.listAssets.setCurrentIndex(self.model_assets.index_of(asset.id))
+            self.init_asset()
+        else:
+            shot = self.eve_data.get_shot(entity_id)
+            sequence = self.eve_data.get_sequence(shot.sequence)
+            self.select_project(sequence.project)
+            model_index = self.model_sequences.index_of(sequence.id)
+            if not model_index.isValid():
+                # Project sequences are still loading in background, load them now without waiting for other tasks
+                self.model_sequences.merge_items(self.eve_data.fetch_project_sequences(sequence.project))
+                model_index = self.model_sequences.index_of(sequence.id)
+
+            self.listSequences.setCurrentIndex(model_index)
+            self.init_sequence()
+            self.listShots.setCurrentIndex(self.model_shots.index_of(shot.id))
+            self.init_shot()
+
+    def select_project(self, project_id):
+        """
+        Select project in UI if it is not selected yet
+        """
+
+        if self.selected_project and self.selected_project.id == project_id:
+            return
+
+        self.listProjects.setCurrentIndex(self.model_projects.index_of(project_id))
+        self.init_project()
+
+    def filter_assets(self, name_filter):
+        """
+        Show only assets which names contain filter string
+        """
+
+        if self.model_assets:
+            self.model_assets.set_filter(name_filter)
+
     def add_project(self, project_name, houdini_build, project_width, project_height, project_description):
         """
         Add project to database and reload UI
@@ -867,9 +961,8 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         asset.description = asset_description
 
         # Add asset to DB and update UI
-        self.model_assets.layoutAboutToBeChanged.emit()
         self.eve_data.add_asset(asset, project.id)
-        self.model_assets.layoutChanged.emit()
+        self.model_assets.refresh()
 
     def add_sequence(self, project, sequence_name, sequence_description):
 
@@ -878,9 +971,8 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         sequence.description = sequence_description
 
         # Add asset to DB and update UI
-        self.model_sequences.layoutAboutToBeChanged.emit()
         self.eve_data.add_sequence(sequence, project.id)
-        self.model_sequences.layoutChanged.emit()
+        self.model_sequences.append_items([sequence])
 
     def add_shot(self, sequence, shot_name, shot_start_frame, shot_end_frame, shot_width, shot_height, shot_description):
 
@@ -893,9 +985,8 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         shot.description = shot_description
 
         # Add asset to DB and update UI
-        self.model_shots.layoutAboutToBeChanged.emit()
         self.eve_data.add_shot(shot, sequence.id)
-        self.model_shots.layoutChanged.emit()
+        self.model_shots.refresh()
 
     def del_project(self):
         """
@@ -922,27 +1013,24 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         # Notify user about delete
         warning = Warnings(self.selected_asset.name)
         if warning.exec_():
-            self.model_assets.layoutAboutToBeChanged.emit()
             self.eve_data.del_asset(self.selected_asset.id)
-            self.model_assets.layoutChanged.emit()
+            self.model_assets.refresh()
 
     def del_sequence(self):
 
         # Notify user about delete
         warning = Warnings(self.selected_sequence.name)
         if warning.exec_():
-            self.model_sequences.layoutAboutToBeChanged.emit()
             self.eve_data.del_sequence(self.selected_sequence.id)
-            self.model_sequences.layoutChanged.emit()
+            self.model_sequences.remove_items([self.selected_sequence])
 
     def del_shot(self):
 
         # Notify user about delete
         warning = Warnings(self.selected_shot.name)
         if warning.exec_():
-            self.model_shots.layoutAboutToBeChanged.emit()
             self.eve_data.del_shot(self.selected_shot.id)
-            self.model_shots.layoutChanged.emit()
+            self.model_shots.refresh()
 
     def update_project(self):
         """
@@ -962,10 +1050,10 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
 
         self.eve_data.update_project(project)
 
-        # Update folder structure on HDD
-        self.create_folder_structure(project)
-
-        print('>> Project {0} updated!'.format(project.name))
+        # Update folder structure on HDD in background
+        self.data_service.submit(self.create_folder_structure, project,
+                                 callback=lambda result: print('>> Project {0} updated, {1} folders created!'.format(
+                                     project.name, len(result))))
 
     def update_asset(self):
         """
@@ -1031,36 +1119,45 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
 
         print('>> Shot "{}" updated!'.format(shot.name))
 
-    def link_assets(self, model_indexes, shot):
+    def link_assets(self, list_assets, shot):
+
+        # Link all assets in one transaction
+        new_ids = set(self.eve_data.link_assets([asset.id for asset in list_assets], shot.id))
 
-        for model_index in model_indexes:
-            # Link asset
-            if self.eve_data.link_asset(model_index.data(QtCore.Qt.UserRole + 1), shot.id):
-                # Updated UI
-                self.model_shot_assets.layoutAboutToBeChanged.emit()
-                self.eve_data.get_shot_assets(shot.id)
-                self.model_shot_assets.layoutChanged.emit()
+        # Update UI once, if shot is still displayed, asset objects are taken from Link Assets list
+        if self.selected_shot and self.selected_shot.id == shot.id:
+            self.model_shot_assets.append_items([asset for asset in list_assets if asset.id in new_ids])
 
-                print('>> Asset {0} linked to shot {1}'.format(model_index.data(QtCore.Qt.UserRole + 2), shot.name))
+        for asset in list_assets:
+            if asset.id in new_ids:
+                print('>> Asset {0} linked to shot {1}'.format(asset.name, shot.name))
             else:
-                print('>> Asset {0} already linked to shot {1}'.format(model_index.data(QtCore.Qt.UserRole + 2), shot.name))
+                print('>> Asset {0} already linked to shot {1}'.format(asset.name, shot.name))
 
     def unlink_assets(self, list_assets, shot):
 
+        # Break all links in one transaction
+        self.eve_data.unlink_assets([asset.id for asset in list_assets], shot.id)
+
+        # Update UI once, if shot is still displayed
+        if self.selected_shot and self.selected_shot.id == shot.id:
+            self.model_shot_assets.remove_items(list_assets)
+
         for asset in list_assets:
-            self.eve_data.unlink_asset(asset.id, shot.id)
             print('>> Asset {0} unlinked from shot {1}'.format(asset.name, shot.name))
 
     # MAIN FUNCTIONS
     def launch_houdini(self, script=None, id=None):
 
-        HOUDINI = settings.HOUDINI.format(self.project_properties_ui.project_ui.linHoudini.text())
+        build = self.project_properties_ui.project_ui.linHoudini.text()
+        HOUDINI = settings.HOUDINI.format(build)
 
         # Run Maya
         houdini_launcher.run_houdini(self.eve_root,
                                      settings.PROJECTS,
                                      HOUDINI,
                                      self.selected_project.name,
+                                     build,
                                      script=script,
                                      id=id)
 
@@ -1148,74 +1245,55 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
 
         return ASSETS
 
-    def build_shot_folders(self, project):
+    def build_shot_folders(self, sequence_nodes):
         """
         Build sequences/shots folder structure list
+        :param sequence_nodes: list of entities.SequenceNode, EveData.get_project_tree() sequences
         :return:
         """
 
         SHOTS = []
 
-        # Get sequences
-        self.eve_data.get_project_sequences(project)
-
-        for sequence in self.eve_data.project_sequences:
-
-            # Get shots
-            self.eve_data.get_sequence_shots(sequence.id)
-            if self.eve_data.sequence_shots:
-                for shot in self.eve_data.sequence_shots:
-                    folder = [sequence.name, [[shot.name, []]]]
-                    SHOTS.append(folder)
-            else:
-                # If there is no shots in the sequence
-                SHOTS.append([sequence.name, []])
+        for sequence_node in sequence_nodes:
+            # Sequence folder with shot folders (empty if there is no shots in the sequence)
+            folder = [sequence_node.sequence.name, [[shot_node.shot.name, []] for shot_node in sequence_node.shots]]
+            SHOTS.append(folder)
 
         return SHOTS
 
-    def create_folder(self, path):
-        """
-        Create folder at input path
-        :param path: Path to create folder (C:/TEMP)
-        """
-
-        if not os.path.exists(path):
-            os.makedirs(path)
-
-    def create_folders(self, root, folders_template):
+    def create_folders(self, root, folders_template, dry_run=False):
         """
-        Recursively build folder structure based on template
+        Build folder structure based on template
         :param root: Root directory to create folder structure
         :param folders_template: List of lists, folder structure template
-        :return:
+        :param dry_run: bool, don't create folders, only return missing ones
+        :return: list of created (missing for dry run) folders
         """
 
-        if folders_template:
-            for folder in folders_template:
-                folder_name = folder[0]
-                path = '{}/{}'.format(root, folder_name)
-                self.create_folder(path)
-                self.create_folders(path, folder[1])
+        folders = folder_structure.flatten_template(root, folders_template)
+
+        return folder_structure.create_folders(folders, dry_run=dry_run)
 
-    def create_folder_structure(self, project):
+    def create_folder_structure(self, project, dry_run=False):
         """
         Create folder structure on HDD
         :param project: project object
-        :return:
+        :param dry_run: bool, don't create folders, only return missing ones (compare project with HDD)
+        :return: list of created (missing for dry run) folders
         """
 
         project_root = build_project_root(project.name)
-        self.eve_data.get_project_assets(project)
 
         # Build lists for assets and sequences/shots
-        asset_folders = self.build_asset_folders(self.eve_data.project_assets)
-        shot_folders = self.build_shot_folders(project)
+        project_tree = self.eve_data.get_project_tree(project)
+        asset_folders = self.build_asset_folders(project_tree.assets)
+        shot_folders = self.build_shot_folders(project_tree.sequences)
 
         # Build folders list
         folders = self.build_folder_structure(asset_folders, shot_folders)
 
         # Create folders on HDD
-        self.create_folders(project_root, folders)
+        return self.create_folders(project_root, folders, dry_run)
 
     def create_project(self, project_name):
         """
@@ -1227,11 +1305,12 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
         # Get project data from DB
         project = self.eve_data.get_project_by_name(project_name)
 
-        # Create folder structure on HDD
-        self.create_folder_structure(project)
+        def open_project_folder(result):
+            print('>> Project creation complete!')
+            subprocess.Popen('explorer "{}"'.format(build_project_root(project_name).replace('/', '\\')))
 
-        # Open project folder
-        subprocess.Popen('explorer "{}"'.format(build_project_root(project_name).replace('/', '\\')))
+        # Create folder structure on HDD in background and open project folder
+        self.data_service.submit(self.create_folder_structure, project, callback=open_project_folder)
 
     def run_create_project(self):
         """
@@ -1248,7 +1327,6 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
             print('>> Creating project...')
             # Create project
             self.create_project(project_name)
-            print('>> Project creation complete!')
 
     def run_add_asset(self):
         """
@@ -1288,25 +1366,32 @@ class ProjectManager(QtWidgets.QMainWindow,  ui_pm_main.Ui_ProjectManager):
     def run_link_assets(self):
 
         self.LA.shot = self.selected_shot
-        self.LA.project_assets = self.eve_data.project_assets
+        self.LA.project = self.selected_project
         self.LA.show()
 
     def run_unlink_assets(self):
 
         # Get selected assets from UI
         model_indexes = self.shot_properties_ui.shot_ui.listAssets.selectedIndexes()
-
-        list_assets = []
-        for model_index in model_indexes:
-            list_assets.append(self.eve_data.get_asset(model_index.data(QtCore.Qt.UserRole + 1)))
+        list_assets = self.model_shot_assets.get_items(model_indexes)
 
         # Break links
         self.unlink_assets(list_assets, self.selected_shot)
 
     def create_asset_file(self):
+        """
+        Create asset scene with hython in background, without launching Houdini UI
+        """
 
+        build = self.project_properties_ui.project_ui.linHoudini.text()
         script = '{0}/tools/houdini/create_asset.py'.format(self.eve_root)
-        self.launch_houdini(script, self.selected_asset.id)
+        jobs = launch_farm.build_script_jobs(script, [self.selected_asset.id])
+        environment = houdini_launcher.build_environment(self.eve_root, settings.PROJECTS,
+                                                         self.selected_project.name, build)
+
+        self.data_service.submit(launch_farm.run_jobs, settings.HYTHON.format(build), jobs,
+                                 launch_farm.get_log_folder(self.eve_root), env=environment,
+                                 callback=launch_farm.report)
 
 
 # Run Project Manager
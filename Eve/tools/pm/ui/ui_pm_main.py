@@ -16,10 +16,10 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
     QIcon, QImage, QKeySequence, QLinearGradient,
     QPainter, QPalette, QPixmap, QRadialGradient,
     QTransform)
-from PySide6.QtWidgets import (QApplication, QGroupBox, QHBoxLayout, QListView,
-    QMainWindow, QMenu, QMenuBar, QPushButton,
-    QSizePolicy, QSpacerItem, QSplitter, QStatusBar,
-    QVBoxLayout, QWidget)
+from PySide6.QtWidgets import (QApplication, QGroupBox, QHBoxLayout, QLineEdit,
+    QListView, QMainWindow, QMenu, QMenuBar,
+    QPushButton, QSizePolicy, QSpacerItem, QSplitter,
+    QStatusBar, QVBoxLayout, QWidget)
 
 class Ui_ProjectManager(object):
     def setupUi(self, ProjectManager):
@@ -60,6 +60,12 @@ class Ui_ProjectManager(object):
 
         self.verticalLayout.addWidget(self.splitter)
 
+        self.linSearch = QLineEdit(self.boxProjects)
+        self.linSearch.setObjectName(u"linSearch")
+        self.linSearch.setClearButtonEnabled(True)
+
+        self.verticalLayout.addWidget(self.linSearch)
+
 
         self.horizontalLayout.addWidget(self.boxProjects)
 
@@ -69,6 +75,12 @@ class Ui_ProjectManager(object):
         self.groupBox.setFlat(True)
         self.verticalLayout_4 = QVBoxLayout(self.groupBox)
         self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.linFilterAssets = QLineEdit(self.groupBox)
+        self.linFilterAssets.setObjectName(u"linFilterAssets")
+        self.linFilterAssets.setClearButtonEnabled(True)
+
+        self.verticalLayout_4.addWidget(self.linFilterAssets)
+
         self.listAssets = QListView(self.groupBox)
         self.listAssets.setObjectName(u"listAssets")
 
@@ -182,7 +194,9 @@ class Ui_ProjectManager(object):
         self.boxProjects.setTitle(QCoreApplication.translate("ProjectManager", u"Projects", None))
         self.btnAddProject.setText(QCoreApplication.translate("ProjectManager", u"+", None))
         self.btnDelProject.setText(QCoreApplication.translate("ProjectManager", u"-", None))
+        self.linSearch.setPlaceholderText(QCoreApplication.translate("ProjectManager", u"Search assets and shots", None))
         self.groupBox.setTitle(QCoreApplication.translate("ProjectManager", u"Assets", None))
+        self.linFilterAssets.setPlaceholderText(QCoreApplication.translate("ProjectManager", u"Filter assets", None))
         self.btnAddAsset.setText(QCoreApplication.translate("ProjectManager", u"+", None))
         self.btnDelAsset.setText(QCoreApplication.translate("ProjectManager", u"-", None))
         self.boxASS.setTitle(QCoreApplication.translate("ProjectManager", u"Sequences | Shots", None))
@@ -0,0 +1,160 @@
+"""
+Compare timing of shots CRUD with a new connection on every call (database_reference.py) and with EveData (shared
+connection, identity map). Run from Eve/tools folder:
+    python tests/benchmark_database.py
+    python tests/benchmark_database.py --size 20000
+"""
+
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+tools_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(tools_root)
+
+import database_reference
+from core.database import entities
+from core.database import eve_data
+
+
+def measure(function, *args):
+    """
+    Run function once, return time in seconds
+    """
+
+    start = time.perf_counter()
+    function(*args)
+
+    return time.perf_counter() - start
+
+
+def report(name, reference_time, eve_data_time):
+
+    print('>> {0:<28} {1:>10.3f} {2:>10.3f} {3:>7.1f}x'.format(name, reference_time, eve_data_time,
+                                                             reference_time / eve_data_time))
+
+
+def build_shots(sequence_id, size):
+
+    shots = []
+    for index in range(size):
+        shot = entities.Shot('SHOT_{:05d}'.format(index), sequence_id)
+        shot.start_frame = 1001
+        shot.end_frame = 1100
+        shot.width = 1920
+        shot.height = 1080
+        shots.append(shot)
+
+    return shots
+
+
+def open_database(folder, size):
+    """
+    Create eve.db upgraded by migrations with one sequence, return EveData and new shots for the sequence
+    """
+
+    sql_file_path = '{0}/eve.db'.format(folder)
+    database_reference.create_database(sql_file_path)
+
+    data = eve_data.EveData(sql_file_path)
+    sequence = entities.Sequence('SEQ010', data.projects[0].id)
+    data.add_sequence(sequence, data.projects[0].id)
+
+    return data, build_shots(sequence.id, size)
+
+
+# Each CRUD step runs over all shots, one call per shot
+def reference_add(sql_file_path, shots):
+
+    for shot in shots:
+        database_reference.add_shot(sql_file_path, shot, shot.sequence)
+
+
+def reference_get(sql_file_path, shots):
+
+    for shot in shots:
+        database_reference.get_shot(sql_file_path, shot.id)
+
+
+def reference_update(sql_file_path, shots):
+
+    for shot in shots:
+        shot.description = 'Updated'
+        database_reference.update_shot(sql_file_path, shot)
+
+
+def reference_delete(sql_file_path, shots):
+
+    for shot in shots:
+        database_reference.del_shot(sql_file_path, shot.id)
+
+
+def eve_data_add(data, shots):
+
+    for shot in shots:
+        data.add_shot(shot, shot.sequence)
+
+
+def eve_data_get(data, shots):
+
+    for shot in shots:
+        data.get_shot(shot.id)
+
+
+def eve_data_update(data, shots):
+
+    for shot in shots:
+        shot.description = 'Updated'
+        data.update_shot(shot)
+
+
+def eve_data_delete(data, shots):
+
+    for shot in shots:
+        data.del_shot(shot.id)
+
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description='Benchmark shots CRUD')
+    parser.add_argument('--size', type=int, default=10000, help='Number of shots')
+    arguments = parser.parse_args(arguments)
+
+    size = arguments.size
+
+    with tempfile.TemporaryDirectory() as reference_folder, tempfile.TemporaryDirectory() as eve_data_folder:
+        # Both databases are in WAL mode after migrations, reference runs without EveData calls
+        reference_data, reference_shots = open_database(reference_folder, size)
+        reference_data.database.close_all()
+        data, shots = open_database(eve_data_folder, size)
+
+        sql_file_path = reference_data.SQL_FILE_PATH
+        cases = [('add {} shots'.format(size), reference_add, eve_data_add),
+                 ('get {} shots'.format(size), reference_get, eve_data_get),
+                 ('get {} shots again'.format(size), reference_get, eve_data_get),
+                 ('update {} shots'.format(size), reference_update, eve_data_update)]
+
+        print('>> {0:<28} {1:>10} {2:>10} {3:>8}'.format('', 'connect, s', 'shared, s', 'speedup'))
+        for name, reference, function in cases:
+            report(name, measure(reference, sql_file_path, reference_shots), measure(function, data, shots))
+
+        # EveData.del_shot also removes shot from the INTERNAL SET list, keep only database time
+        del data.sequence_shots[:]
+        report('delete {} shots'.format(size),
+               measure(reference_delete, sql_file_path, reference_shots),
+               measure(eve_data_delete, data, shots))
+
+        # Bulk insert of the same shots in one transaction
+        bulk_shots = build_shots(shots[0].sequence, size)
+        report('bulk add {} shots'.format(size),
+               measure(reference_add, sql_file_path, build_shots(shots[0].sequence, size)),
+               measure(data.bulk_add_shots, bulk_shots))
+
+        data.database.close_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Compare time and memory of loading shots into entities with instance __dict__ (database_reference.py) and slotted
+entities (core/database/entities.py). Run from Eve/tools folder:
+    python tests/benchmark_entities.py
+    python tests/benchmark_entities.py --size 100000
+"""
+
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+tools_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(tools_root)
+
+import database_reference
+from core.database import entities
+from core.database import eve_data
+
+
+def measure(function, *args):
+    """
+    Run function once, return time in seconds
+    """
+
+    start = time.perf_counter()
+    function(*args)
+
+    return time.perf_counter() - start
+
+
+def measure_memory(function, *args):
+    """
+    Run function once, return size of its result in MB (memory allocated and not released)
+    """
+
+    tracemalloc.start()
+    result = function(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del result
+
+    return size / 1024 / 1024
+
+
+def report(name, dict_value, slots_value):
+
+    print('>> {0:<28} {1:>10.3f} {2:>10.3f} {3:>7.1f}x'.format(name, dict_value, slots_value, dict_value / slots_value))
+
+
+def load_shot_tuples(folder, size):
+    """
+    Create eve.db with size shots in one sequence, return shots table rows
+    """
+
+    sql_file_path = '{0}/eve.db'.format(folder)
+    database_reference.create_database(sql_file_path)
+
+    data = eve_data.EveData(sql_file_path)
+    sequence = entities.Sequence('SEQ010', data.projects[0].id)
+    data.add_sequence(sequence, data.projects[0].id)
+
+    shots = []
+    for index in range(size):
+        shot = entities.Shot('SHOT_{:05d}'.format(index), sequence.id)
+        shot.start_frame = 1001
+        shot.end_frame = 1100
+        shot.width = 1920
+        shot.height = 1080
+        shots.append(shot)
+    data.bulk_add_shots(shots)
+
+    shot_tuples = data.database.cursor().execute("SELECT * FROM shots").fetchall()
+    data.database.close_all()
+
+    return shot_tuples
+
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description='Benchmark entity classes')
+    parser.add_argument('--size', type=int, default=50000, help='Number of shots')
+    arguments = parser.parse_args(arguments)
+
+    size = arguments.size
+    with tempfile.TemporaryDirectory() as folder:
+        shot_tuples = load_shot_tuples(folder, size)
+
+    print('>> {0:<28} {1:>10} {2:>10} {3:>8}'.format('', '__dict__', '__slots__', 'ratio'))
+    report('convert {} shots, s'.format(size),
+           measure(database_reference.convert_to_shot, shot_tuples),
+           measure(entities.Converter.convert_to_shot, shot_tuples))
+    report('{} shots, MB'.format(size),
+           measure_memory(database_reference.convert_to_shot, shot_tuples),
+           measure_memory(entities.Converter.convert_to_shot, shot_tuples))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Compare timing of version scanning with glob and an EveFilePath for every match (the scanner before scan_versions)
+and with the cached directory listing (core/file_path.py) on 10k synthetic files. Run from Eve/tools folder:
+    python tests/benchmark_file_path.py
+    python tests/benchmark_file_path.py --size 20000
+"""
+
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+
+tools_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(tools_root)
+
+from core import file_path
+from core.database import entities
+
+
+def measure(function, *args):
+    """
+    Run function once, return time in seconds
+    """
+
+    start = time.perf_counter()
+    function(*args)
+
+    return time.perf_counter() - start
+
+
+def report(name, glob_time, scandir_time):
+
+    print('>> {0:<28} {1:>10.3f} {2:>10.3f} {3:>7.1f}x'.format(name, glob_time, scandir_time,
+                                                             glob_time / scandir_time))
+
+
+def glob_last_version(eve_file_path):
+    """
+    Last version of file with glob, each match is parsed by a new EveFilePath
+    """
+
+    # Parsed paths are cached, start from empty cache as a scanner without cache did
+    file_path.parse_eve_path.cache_clear()
+
+    list_versions = []
+    list_existed = glob.glob('{0}/{1}_*.{2}'.format(eve_file_path.location, eve_file_path.code, eve_file_path.extension))
+    list_existed = [name.replace('\\', '/') for name in list_existed]
+
+    for existing_path in list_existed:
+        at_file = file_path.EveFilePath(existing_path)
+        list_versions.append(int(at_file.file_version))
+
+    return max(list_versions)
+
+
+def scan_last_version(eve_file_path):
+    """
+    Last version of file with empty listing cache (first save in Houdini session)
+    """
+
+    file_path.clear_listing_cache()
+
+    return eve_file_path.calculate_last_version()
+
+
+def os_exists(paths):
+
+    for path in paths:
+        os.path.exists(path)
+
+
+def cached_exists(paths):
+
+    for path in paths:
+        file_path.path_exists(path)
+
+
+def create_versions(eve_file_path, size):
+    """
+    Create size empty versions of file, return list of file paths
+    """
+
+    paths = []
+    for version in range(1, size + 1):
+        name = eve_file_path.file_name_template.format(eve_file_path.prefix, eve_file_path.base,
+                                                       '{0:03d}'.format(version), eve_file_path.extension)
+        paths.append('{0}/{1}'.format(eve_file_path.location, name))
+        open(paths[-1], 'w').close()
+
+    return paths
+
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description='Benchmark version scanning')
+    parser.add_argument('--size', type=int, default=10000, help='Number of file versions in asset folder')
+    arguments = parser.parse_args(arguments)
+
+    size = arguments.size
+
+    with tempfile.TemporaryDirectory() as project_root:
+        os.environ['EVE_PROJECT'] = project_root.replace('\\', '/')
+
+        eve_file_path = file_path.EveFilePath()
+        eve_file_path.build_path_asset_hip(entities.EveFile.file_types['asset_hip'], 'prop', 'ROCK', '001')
+        os.makedirs(eve_file_path.location)
+        paths = create_versions(eve_file_path, size)
+
+        assert glob_last_version(eve_file_path) == scan_last_version(eve_file_path) == size
+
+        print('>> {0:<28} {1:>10} {2:>10} {3:>8}'.format('', 'glob, s', 'scandir, s', 'speedup'))
+        report('last of {} versions'.format(size),
+               measure(glob_last_version, eve_file_path),
+               measure(scan_last_version, eve_file_path))
+
+        # Listing is cached, calls within one save or open
+        report('last, cached listing',
+               measure(glob_last_version, eve_file_path),
+               measure(eve_file_path.calculate_last_version))
+        report('exists {} files'.format(size), measure(os_exists, paths), measure(cached_exists, paths))
+
+        file_path.clear_listing_cache()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Compare timing of project folder structure creation with a serial recursive walk (os.path.exists + os.makedirs for
+every folder, Project Manager before folder_structure.py) and with core/folder_structure.py (flattened template,
+thread pool). Folders are created in a temporary folder on tmpfs (/dev/shm) if available. Local file system calls
+return in microseconds, so checking existing folders is not faster with the pool there; the pool pays off on network
+shares where every call waits for the server. Run from Eve/tools folder:
+    python tests/benchmark_folder_structure.py
+    python tests/benchmark_folder_structure.py --shots 5000 --root Z:/temp
+"""
+
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+tools_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(tools_root)
+
+from core import folder_structure
+
+
+def measure(function, *args):
+    """
+    Run function once, return time in seconds
+    """
+
+    start = time.perf_counter()
+    function(*args)
+
+    return time.perf_counter() - start
+
+
+def report(name, serial_time, pool_time):
+
+    print('>> {0:<28} {1:>10.3f} {2:>10.3f} {3:>7.1f}x'.format(name, serial_time, pool_time, serial_time / pool_time))
+
+
+def build_template(shots, assets):
+    """
+    Project folder template shaped as ProjectManager.build_folder_structure, sequences of 100 shots
+    """
+
+    SHOTS = []
+    for sequence_index in range(0, shots, 100):
+        SHOTS.append(['SEQ_{:03d}'.format(sequence_index // 100),
+                      [['SHOT_{:05d}'.format(index), []] for index in range(sequence_index, min(sequence_index + 100, shots))]])
+
+    ASSETS = [['props', [['ASSET_{:05d}'.format(index), []] for index in range(assets)]]]
+    TYPES = [['ASSETS', ASSETS], ['SHOTS', SHOTS]]
+
+    return [['EDIT', [['OUT', []], ['PROJECT', []]]],
+            ['PROD', [['2D', [['COMP', SHOTS],
+                              ['RENDER', SHOTS]]],
+                      ['3D', [['fx', TYPES],
+                              ['caches', TYPES],
+                              ['hda', [['ASSETS', ASSETS], ['FX', TYPES]]],
+                              ['render', SHOTS],
+                              ['scenes', [['ASSETS', ASSETS],
+                                          ['SHOTS', [['ANIMATION', SHOTS], ['RENDER', SHOTS]]]]],
+                              ['textures', TYPES]]]]]]
+
+
+# Serial versions
+def create_folders_recursive(root, folders_template):
+
+    for folder_name, children in folders_template or []:
+        path = '{0}/{1}'.format(root, folder_name)
+        if not os.path.exists(path):
+            os.makedirs(path)
+        create_folders_recursive(path, children)
+
+
+def get_missing_recursive(root, folders_template, missing=None):
+
+    if missing is None:
+        missing = []
+
+    for folder_name, children in folders_template or []:
+        path = '{0}/{1}'.format(root, folder_name)
+        if not os.path.exists(path):
+            missing.append(path)
+        get_missing_recursive(path, children, missing)
+
+    return missing
+
+
+# Thread pool versions, template is flattened in the measured time
+def create_folders(root, folders_template):
+
+    folder_structure.create_folders(folder_structure.flatten_template(root, folders_template))
+
+
+def get_missing_folders(root, folders_template):
+
+    return folder_structure.create_folders(folder_structure.flatten_template(root, folders_template), dry_run=True)
+
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description='Benchmark project folder structure creation')
+    parser.add_argument('--shots', type=int, default=2000, help='Number of shots')
+    parser.add_argument('--assets', type=int, default=500, help='Number of assets')
+    parser.add_argument('--root', default='/dev/shm' if os.path.isdir('/dev/shm') else None,
+                        help='Folder for temporary project folders')
+    arguments = parser.parse_args(arguments)
+
+    template = build_template(arguments.shots, arguments.assets)
+    size = len(folder_structure.flatten_template('', template))
+
+    with tempfile.TemporaryDirectory(dir=arguments.root) as temp_folder:
+        serial_root = '{0}/serial'.format(temp_folder.replace('\\', '/'))
+        pool_root = '{0}/pool'.format(temp_folder.replace('\\', '/'))
+
+        print('>> {0:<28} {1:>10} {2:>10} {3:>8}'.format('', 'serial, s', 'pool, s', 'speedup'))
+        report('create {} folders'.format(size),
+               measure(create_folders_recursive, serial_root, template),
+               measure(create_folders, pool_root, template))
+
+        # Structure exists, nothing to create (Create Project for existing project, new shots added)
+        report('create again', measure(create_folders_recursive, serial_root, template),
+               measure(create_folders, pool_root, template))
+        report('dry run', measure(get_missing_recursive, serial_root, template),
+               measure(get_missing_folders, pool_root, template))
+
+
+if __name__ == '__main__':
+    main()
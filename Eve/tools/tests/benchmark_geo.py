@@ -0,0 +1,72 @@
+"""
+Compare timing of procedural shapes and extrusion built with array operations (usd/geo.py) and loop versions
+(geo_reference.py, plain lists without MeshData). Run from Eve/tools folder:
+    python tests/benchmark_geo.py
+    python tests/benchmark_geo.py --size 2000
+"""
+
+
+import os
+import sys
+import time
+import argparse
+
+tools_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append('{0}/usd'.format(tools_root))
+
+import geo
+import geo_reference
+
+
+def measure(function, *args):
+    """
+    Run function once, return time in seconds
+    """
+
+    start = time.perf_counter()
+    function(*args)
+
+    return time.perf_counter() - start
+
+
+def extrude(mesh_data, face_numbers, extrude_distance):
+
+    edit_mesh = geo.EditMesh(mesh_data)
+    edit_mesh.extrude_faces(face_numbers, extrude_distance)
+
+    return edit_mesh.modified_mesh
+
+
+def report(name, loop_time, array_time):
+
+    print('>> {0:<28} {1:>10.3f} {2:>10.3f} {3:>7.1f}x'.format(name, loop_time, array_time, loop_time / array_time))
+
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description='Benchmark procedural shapes and extrusion')
+    parser.add_argument('--size', type=int, default=1000, help='Plane points per side, sphere and torus resolution')
+    arguments = parser.parse_args(arguments)
+
+    size = arguments.size
+    grid = geo_reference.plane(size, size)
+    every_third_face = list(range(0, len(grid[1]), 3))
+
+    # (name, array function, loop function, arguments of both)
+    cases = [('plane {0}x{0}'.format(size), geo.plane, geo_reference.plane, (size, size)),
+             ('sphere {0}x{1}'.format(size, size // 2), geo.sphere, geo_reference.sphere, (size, size // 2)),
+             ('torus {0}x{0}'.format(size), geo.torus, geo_reference.torus, (size, size, 2, 0.5)),
+             ('cone {}'.format(size * 100), geo.cone, geo_reference.cone, (size * 100,))]
+
+    print('>> {0:<28} {1:>10} {2:>10} {3:>8}'.format('', 'loop, s', 'array, s', 'speedup'))
+    for name, function, reference, args in cases:
+        report(name, measure(reference, *args), measure(function, *args))
+
+    # Extrude every third face of the plane, both versions get mesh in their own format
+    report('extrude {} faces'.format(len(every_third_face)),
+           measure(geo_reference.extrude_faces, *grid, every_third_face, 0.3),
+           measure(extrude, geo.plane(size, size), every_third_face, 0.3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Measure project import and export (core/database/transfer.py) with 100k shots, compare bulk insert with adding
+shots one row and one commit at a time (database_reference.py). Run from Eve/tools folder:
+    python tests/benchmark_transfer.py
+    python tests/benchmark_transfer.py --size 200000 --reference-size 2000
+"""
+
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+tools_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(tools_root)
+
+import database_reference
+from core.database import entities
+from core.database import eve_data
+from core.database import transfer
+
+
+def measure(function, *args):
+    """
+    Run function once, return result and time in seconds
+    """
+
+    start = time.perf_counter()
+    result = function(*args)
+
+    return result, time.perf_counter() - start
+
+
+def report(name, rows, seconds):
+
+    print('>> {0:<28} {1:>10} {2:>10.3f} {3:>10.0f}'.format(name, rows, seconds, rows / seconds))
+
+
+def build_project_data(size):
+    """
+    Project data in JSON layout: size shots in sequences of 1000 shots, each shot linked to 2 of size / 100 assets
+    """
+
+    asset_names = ['ASSET_{:05d}'.format(index) for index in range(max(size // 100, 2))]
+
+    sequences = []
+    for sequence_index in range(0, size, 1000):
+        shots = []
+        for index in range(sequence_index, min(sequence_index + 1000, size)):
+            shots.append({'name': 'SHOT_{:06d}'.format(index),
+                          'start_frame': 1001,
+                          'end_frame': 1100,
+                          'width': 1920,
+                          'height': 1080,
+                          'description': '',
+                          'assets': [asset_names[index % len(asset_names)],
+                                     asset_names[(index + 1) % len(asset_names)]]})
+
+        sequences.append({'name': 'SEQ_{:04d}'.format(sequence_index // 1000), 'description': '', 'shots': shots})
+
+    return {'project': {'name': 'Benchmark', 'houdini_build': '19.5.368', 'width': 1920, 'height': 1080,
+                        'description': ''},
+            'assets': [{'name': name, 'type': 'prop', 'description': ''} for name in asset_names],
+            'sequences': sequences}
+
+
+def open_database(folder):
+
+    sql_file_path = '{0}/eve.db'.format(folder)
+    database_reference.create_database(sql_file_path)
+
+    return eve_data.EveData(sql_file_path)
+
+
+def add_shots_by_row(sql_file_path, shots):
+
+    for shot in shots:
+        database_reference.add_shot(sql_file_path, shot, shot.sequence)
+
+
+def build_shots(sequence_id, size):
+
+    return [entities.Shot('SHOT_{:06d}'.format(index), sequence_id) for index in range(size)]
+
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description='Benchmark project import and export')
+    parser.add_argument('--size', type=int, default=100000, help='Number of shots in project')
+    parser.add_argument('--reference-size', type=int, default=1000,
+                        help='Number of shots added one row at a time (one commit per row)')
+    arguments = parser.parse_args(arguments)
+
+    size = arguments.size
+    project_data = build_project_data(size)
+    links = sum(len(shot['assets']) for sequence in project_data['sequences'] for shot in sequence['shots'])
+    rows = len(project_data['assets']) + len(project_data['sequences']) + size + links
+
+    with tempfile.TemporaryDirectory() as folder:
+        data = open_database(folder)
+
+        print('>> {0:<28} {1:>10} {2:>10} {3:>10}'.format('', 'rows', 'seconds', 'rows/s'))
+        project, seconds = measure(transfer.import_project, data, project_data)
+        report('import', rows, seconds)
+
+        # Second import finds all entities by name and adds nothing
+        report('import again', rows, measure(transfer.import_project, data, project_data)[1])
+
+        exported_data, seconds = measure(transfer.export_project, data, project.name)
+        report('export', rows, seconds)
+
+        for extension in ('json', 'csv'):
+            file_path = '{0}/project.{1}'.format(folder, extension)
+            report('write {}'.format(extension), rows, measure(transfer.write_project, exported_data, file_path)[1])
+            report('read {}'.format(extension), rows, measure(transfer.read_project, file_path)[1])
+
+        # Shots of a new sequence, one transaction vs one commit per row
+        reference_size = arguments.reference_size
+        sequence = entities.Sequence('SEQ_REFERENCE', project.id)
+        data.add_sequence(sequence, project.id)
+        report('add shots one by one', reference_size,
+               measure(add_shots_by_row, data.SQL_FILE_PATH, build_shots(sequence.id, reference_size))[1])
+        report('bulk add shots', reference_size,
+               measure(data.bulk_add_shots, build_shots(sequence.id, reference_size))[1])
+
+        data.database.close_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""
+Shared fixtures for Eve tools tests. Run from Eve/tools folder:
+    python -m pytest tests
+"""
+
+
+import os
+import sys
+
+import pytest
+
+
+tools_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (tools_root, '{0}/pm'.format(tools_root), '{0}/usd'.format(tools_root)):
+    if path not in sys.path:
+        sys.path.append(path)
+
+import database_reference
+
+
+@pytest.fixture
+def sql_file_path(tmp_path):
+    """
+    Path to new eve.db with base tables and one project, not upgraded by migrations yet
+    """
+
+    sql_file_path = str(tmp_path / 'eve.db')
+
+    database_reference.create_database(sql_file_path)
+
+    return sql_file_path
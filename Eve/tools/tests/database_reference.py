@@ -0,0 +1,140 @@
+"""
+Database access before the shared connection manager (new connection and commit on every call), reference for
+benchmarks. Base tables are the ones created by ProjectManager.init_database, before migrations.
+"""
+
+
+import sqlite3
+
+
+# Tables created by ProjectManager.init_database, before migrations
+SCHEMA = [
+    "CREATE TABLE projects (id integer primary key autoincrement, name text, houdini_build text, width integer, "
+    "height integer, description text)",
+    "CREATE TABLE assets (id integer primary key autoincrement, name text, project integer, type integer, "
+    "description text, FOREIGN KEY(project) REFERENCES projects(id) FOREIGN KEY(type) REFERENCES asset_types(id))",
+    "CREATE TABLE sequences (id integer primary key autoincrement, name text, project integer, description text, "
+    "FOREIGN KEY(project) REFERENCES projects(id))",
+    "CREATE TABLE shots (id integer primary key autoincrement, name text, sequence integer, start_frame integer, "
+    "end_frame integer, width integer, height integer, description text, FOREIGN KEY(sequence) REFERENCES sequences(id))",
+    "CREATE TABLE shot_assets (id integer primary key autoincrement, shot_id integer, asset_id integer, "
+    "FOREIGN KEY(shot_id) REFERENCES shots(id) FOREIGN KEY(asset_id) REFERENCES assets(id))"]
+
+
+def create_database(sql_file_path):
+    """
+    Create eve.db with base tables and one project
+    """
+
+    connection = sqlite3.connect(sql_file_path)
+    for statement in SCHEMA:
+        connection.execute(statement)
+    connection.execute("INSERT INTO projects VALUES (null, 'eve_example', '19.5.368', 1920, 1080, '')")
+    connection.commit()
+    connection.close()
+
+
+# Shot CRUD
+def add_shot(sql_file_path, shot, sequence_id):
+
+    connection = sqlite3.connect(sql_file_path)
+    cursor = connection.cursor()
+
+    cursor.execute("INSERT INTO shots VALUES (:id, :name, :sequence, :start_frame, :end_frame, :width, :height, "
+                   ":description)",
+
+                   {'id': None,
+                    'name': shot.name,
+                    'sequence': sequence_id,
+                    'start_frame': shot.start_frame,
+                    'end_frame': shot.end_frame,
+                    'width': shot.width,
+                    'height': shot.height,
+                    'description': shot.description})
+
+    connection.commit()
+    shot.id = cursor.lastrowid
+    connection.close()
+
+
+def get_shot(sql_file_path, shot_id):
+
+    connection = sqlite3.connect(sql_file_path)
+    cursor = connection.cursor()
+
+    cursor.execute("SELECT * FROM shots WHERE id=:id",
+                   {'id': shot_id})
+
+    shot_tuple = cursor.fetchone()
+
+    connection.close()
+
+    if shot_tuple:
+        return convert_to_shot([shot_tuple])[0]
+
+
+def update_shot(sql_file_path, shot):
+
+    connection = sqlite3.connect(sql_file_path)
+    cursor = connection.cursor()
+
+    cursor.execute("UPDATE shots SET sequence=:sequence, start_frame=:start_frame, end_frame=:end_frame, "
+                   "width=:width, height=:height, description=:description WHERE id=:id",
+
+                   {'id': shot.id,
+                    'sequence': shot.sequence,
+                    'start_frame': shot.start_frame,
+                    'end_frame': shot.end_frame,
+                    'width': shot.width,
+                    'height': shot.height,
+                    'description': shot.description})
+
+    connection.commit()
+    connection.close()
+
+    return shot
+
+
+def del_shot(sql_file_path, shot_id):
+
+    connection = sqlite3.connect(sql_file_path)
+    cursor = connection.cursor()
+
+    cursor.execute("DELETE FROM shots WHERE id=:id",
+                   {'id': shot_id})
+
+    connection.commit()
+    connection.close()
+
+
+# Entities with instance __dict__ (before __slots__)
+class Shot:
+    def __init__(self, shot_name, sequence_id):
+        self.id = None
+        self.name = shot_name
+        self.sequence = sequence_id
+        self.start_frame = ''
+        self.end_frame = ''
+        self.width = ''
+        self.height = ''
+        self.description = ''
+
+
+def convert_to_shot(shot_tuples):
+    """
+    Convert list of shot tuples to list of Shot objects
+    :param shot_tuples:  [(id, name, sequence, start_frame, end_frame, width, height, description)]
+    """
+
+    shots = []
+    for shot_tuple in shot_tuples:
+        shot = Shot(shot_tuple[1], shot_tuple[2])
+        shot.id = shot_tuple[0]
+        shot.start_frame = shot_tuple[3]
+        shot.end_frame = shot_tuple[4]
+        shot.width = shot_tuple[5]
+        shot.height = shot_tuple[6]
+        shot.description = shot_tuple[7]
+        shots.append(shot)
+
+    return shots
@@ -0,0 +1,165 @@
+"""
+Loop versions of procedural shapes and extrusion (before array operations), reference for parity tests and benchmark.
+Sphere and cone use math.pi instead of 3.14, the cone closes its last side triangle and its bottom face is wound as
+side faces, as the array versions do.
+"""
+
+
+import math
+
+
+def get_cartesian_position(h_angle, v_angle):
+
+    return math.sin(v_angle) * math.cos(h_angle), math.cos(v_angle), math.sin(v_angle) * math.sin(h_angle)
+
+
+def plane(row_points, column_points):
+
+    points, face_vertex_counts, face_vertex_indices = [], [], []
+
+    row_spacing = 1 / (row_points - 1)
+    col_spacing = 1 / (column_points - 1)
+
+    for row_point in range(row_points):
+        for column_point in range(column_points):
+            points.append((column_point * col_spacing - 0.5, 0, row_point * row_spacing - 0.5))
+
+    for row_point in range(row_points - 1):
+        for column_point in range(column_points - 1):
+            top_left = row_point * column_points + column_point
+            top_right = top_left + 1
+            bottom_left = top_left + column_points
+            bottom_right = bottom_left + 1
+            face_vertex_counts.append(4)
+            face_vertex_indices.extend([top_left, top_right, bottom_right, bottom_left])
+
+    return points, face_vertex_counts, face_vertex_indices
+
+
+def sphere(h_points, v_points):
+
+    points, face_vertex_counts, face_vertex_indices = [], [], []
+
+    points.append(get_cartesian_position(0, 0))
+    for v_point in range(1, v_points - 1):
+        v_angle = v_point * math.pi / (v_points - 1)
+        for h_point in range(h_points):
+            points.append(get_cartesian_position(2 * h_point * math.pi / h_points, v_angle))
+    points.append(get_cartesian_position(0, math.pi))
+
+    for h_point in range(h_points):
+        next_point = (h_point + 1) % h_points
+        face_vertex_counts.append(3)
+        face_vertex_indices.extend([0, 1 + h_point, 1 + next_point])
+
+    for v_point in range(1, v_points - 2):
+        row_start = 1 + (v_point - 1) * h_points
+        next_row_start = row_start + h_points
+        for h_point in range(h_points):
+            next_point = (h_point + 1) % h_points
+            face_vertex_counts.append(4)
+            face_vertex_indices.extend([next_row_start + h_point, next_row_start + next_point,
+                                        row_start + next_point, row_start + h_point])
+
+    bottom_pole_index = len(points) - 1
+    last_row_start = 1 + (v_points - 3) * h_points
+    for h_point in range(h_points):
+        next_point = (h_point + 1) % h_points
+        face_vertex_counts.append(3)
+        face_vertex_indices.extend([bottom_pole_index, last_row_start + next_point, last_row_start + h_point])
+
+    return points, face_vertex_counts, face_vertex_indices
+
+
+def torus(h_points, v_points, radius, thickness):
+
+    points, face_vertex_counts, face_vertex_indices = [], [], []
+
+    for h_point in range(h_points):
+        for v_point in range(v_points):
+            u = (v_point * 2 * math.pi) / v_points
+            v = (h_point * 2 * math.pi) / h_points
+            points.append(((radius + thickness * math.cos(v)) * math.cos(u),
+                           (radius + thickness * math.cos(v)) * math.sin(u),
+                           thickness * math.sin(v)))
+
+    for h_point in range(h_points):
+        h_next = (h_point + 1) % h_points
+        for v_point in range(v_points):
+            v_next = (v_point + 1) % v_points
+            face_vertex_counts.append(4)
+            face_vertex_indices.extend([h_point * v_points + v_point, h_point * v_points + v_next,
+                                        h_next * v_points + v_next, h_next * v_points + v_point])
+
+    return points, face_vertex_counts, face_vertex_indices
+
+
+def cone(resolution):
+
+    points, face_vertex_counts, face_vertex_indices = [], [], []
+
+    for point in range(resolution):
+        angle = 2.0 * math.pi * point / resolution
+        points.append((math.cos(angle), 0, math.sin(angle)))
+    points.append((0, 2, 0))
+
+    for point in range(resolution):
+        face_vertex_counts.append(3)
+        face_vertex_indices.extend([point, (point + 1) % resolution, resolution])
+
+    face_vertex_counts.append(resolution)
+    face_vertex_indices.extend(reversed(range(resolution)))
+
+    return points, face_vertex_counts, face_vertex_indices
+
+
+def get_newell_normal(face_points):
+
+    normal = [0.0, 0.0, 0.0]
+    for index, (x, y, z) in enumerate(face_points):
+        x_next, y_next, z_next = face_points[(index + 1) % len(face_points)]
+        normal[0] += (y - y_next) * (z + z_next)
+        normal[1] += (z - z_next) * (x + x_next)
+        normal[2] += (x - x_next) * (y + y_next)
+
+    length = math.sqrt(sum(axis * axis for axis in normal))
+
+    return [axis / length for axis in normal] if length else normal
+
+
+def extrude_faces(points, face_vertex_counts, face_vertex_indices, face_numbers, extrude_distance):
+    """
+    Extrude faces one by one: new points, side quads and top face of each face, then delete source faces
+    """
+
+    points = list(points)
+    face_starts = [0]
+    for count in face_vertex_counts:
+        face_starts.append(face_starts[-1] + count)
+
+    added_counts, added_indices = [], []
+    for face_number in face_numbers:
+        indices = face_vertex_indices[face_starts[face_number]:face_starts[face_number + 1]]
+        normal = get_newell_normal([points[index] for index in indices])
+        number_of_points_source = len(points)
+
+        for index in indices:
+            points.append(tuple(points[index][axis] + normal[axis] * extrude_distance for axis in range(3)))
+
+        for index in range(len(indices)):
+            next_index = (index + 1) % len(indices)
+            added_counts.append(4)
+            added_indices.extend([indices[index], indices[next_index],
+                                  number_of_points_source + next_index, number_of_points_source + index])
+
+        added_counts.append(len(indices))
+        added_indices.extend(range(number_of_points_source, number_of_points_source + len(indices)))
+
+    deleted_faces = set(face_numbers)
+    counts, indices = [], []
+    for face_number, count in enumerate(face_vertex_counts):
+        if face_number not in deleted_faces:
+            counts.append(count)
+            indices.extend(face_vertex_indices[face_starts[face_number]:face_starts[face_number + 1]])
+
+    return points, counts + added_counts, indices + added_indices
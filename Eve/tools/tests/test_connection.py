@@ -0,0 +1,59 @@
+"""
+Connections of pool threads are closed after DataService tasks
+"""
+
+
+import os
+import sqlite3
+import threading
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PySide6 import QtCore
+
+from core import data_service
+from core.database import connection
+from core.database import eve_data
+
+
+@pytest.fixture
+def database(sql_file_path):
+
+    data = eve_data.EveData(sql_file_path)
+
+    yield data
+
+    data.database.close_all()
+
+
+def test_task_connections_are_closed(database):
+
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    service = data_service.DataService(database)
+    project_id = database.projects[0].id
+
+    futures = [service.submit('fetch_project_sequences', project_id) for _ in range(50)]
+    assert service.wait(10000)
+    application.processEvents()
+
+    assert all(future.result() == [] for future in futures)
+    # Only connection of the main thread is open
+    assert list(database.database._connections) == [threading.get_ident()]
+
+
+def test_orphan_connection_of_same_thread_is_closed(sql_file_path):
+
+    manager = connection.get_manager(sql_file_path)
+    first = manager.connect()
+
+    # New thread state of the same thread (pool thread running next task) does not see first connection
+    manager._local = threading.local()
+    second = manager.connect()
+
+    assert second is not first
+    assert list(manager._connections.values()) == [second]
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute('SELECT 1')
+
+    manager.close_all()
@@ -0,0 +1,161 @@
+"""
+DataService and list models without database and UI: stub EveData, offscreen Qt application
+"""
+
+
+import os
+import time
+import threading
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PySide6 import QtCore
+
+from core import models
+from core import data_service
+
+
+class Sequence:
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+
+class StubData:
+    """
+    EveData methods used by Project Manager models, fetch blocks until release() is called
+    """
+
+    def __init__(self, sequences):
+        self.sequences = list(sequences)
+        self.project_sequences = []
+        self.fetched = threading.Event()
+        self.released = threading.Event()
+
+    def fetch_project_sequences(self, project_id):
+
+        sequences = list(self.sequences)
+        self.fetched.set()
+        self.released.wait(5)
+
+        return sequences
+
+    def add_sequence(self, sequence, project_id):
+
+        self.sequences.append(sequence)
+        self.project_sequences.append(sequence)
+
+    def release(self):
+        self.released.set()
+
+
+@pytest.fixture(scope='module')
+def application():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def process_events_until(application, condition, timeout=5):
+    """
+    Deliver DataService callbacks until condition() is True
+    """
+
+    end_time = time.time() + timeout
+    while not condition():
+        assert time.time() < end_time, 'DataService callback was not called'
+        application.processEvents()
+        time.sleep(0.01)
+
+
+def get_ids(model):
+    return [model.index(row, 0).data(QtCore.Qt.UserRole + 1) for row in range(model.rowCount(QtCore.QModelIndex()))]
+
+
+def test_callback_gets_result(application):
+
+    stub = StubData([Sequence(1, 'SEQ010')])
+    service = data_service.DataService(stub)
+    results = []
+
+    stub.release()
+    future = service.submit('fetch_project_sequences', 1, callback=results.append)
+    process_events_until(application, lambda: results)
+
+    assert [sequence.id for sequence in results[0]] == [1]
+    assert [sequence.id for sequence in future.result()] == [1]
+
+
+def test_error_callback_gets_exception(application):
+
+    service = data_service.DataService(StubData([]))
+    errors = []
+
+    def fail():
+        raise ValueError('no database')
+
+    service.submit(fail, error_callback=errors.append)
+    process_events_until(application, lambda: errors)
+
+    assert isinstance(errors[0], ValueError)
+
+
+@pytest.mark.parametrize('fetch_sees_new_sequence', [False, True])
+def test_sequence_added_while_loading(application, fetch_sees_new_sequence):
+    """
+    Sequence added by user before background fetch returned is shown once, whether or not fetch result contains it
+    """
+
+    stub = StubData([Sequence(1, 'SEQ010')])
+    service = data_service.DataService(stub)
+    model = models.ListModel([])
+    results = []
+
+    def fill_model(items):
+        model.merge_items(items)
+        results.append(items)
+
+    new_sequence = Sequence(2, 'SEQ020')
+    if fetch_sees_new_sequence:
+        stub.add_sequence(new_sequence, 1)
+        model.append_items([new_sequence])
+
+    service.submit('fetch_project_sequences', 1, callback=fill_model)
+    assert stub.fetched.wait(5)
+
+    if not fetch_sees_new_sequence:
+        stub.add_sequence(new_sequence, 1)
+        model.append_items([new_sequence])
+
+    stub.release()
+    process_events_until(application, lambda: results)
+
+    assert sorted(get_ids(model)) == [1, 2]
+    # Model does not share the list with data source
+    assert [sequence.id for sequence in stub.project_sequences] == [2]
+
+
+def test_merge_adds_missing_rows():
+
+    model = models.ListModel([Sequence(1, 'SEQ010'), Sequence(2, 'SEQ020')])
+    selection = QtCore.QItemSelectionModel(model)
+    selection.setCurrentIndex(model.index(1, 0), QtCore.QItemSelectionModel.ClearAndSelect)
+
+    model.merge_items([Sequence(2, 'SEQ020'), Sequence(3, 'SEQ030')])
+
+    assert get_ids(model) == [1, 2, 3]
+    # Selected row is not reset (search result selected while sequences were loading)
+    assert selection.currentIndex().row() == 1
+
+    model.remove_items([Sequence(1, 'SEQ010')])
+    assert get_ids(model) == [2, 3]
+    assert not model.index_of(1).isValid()
+    assert model.index_of(3).row() == 1
+
+
+def test_get_items_of_selected_rows():
+
+    sequences = [Sequence(1, 'SEQ010'), Sequence(2, 'SEQ020'), Sequence(3, 'SEQ030')]
+    model = models.ListModel(list(sequences))
+
+    assert model.get_items([model.index(2, 0), model.index(0, 0), QtCore.QModelIndex()]) == [sequences[2],
+                                                                                              sequences[0]]
@@ -0,0 +1,53 @@
+"""
+EditMesh edits recorded against source mesh
+"""
+
+
+import numpy as np
+
+import geo
+
+
+def get_face_points(mesh, face_number):
+
+    return mesh.points[mesh.get_face_indices(face_number)]
+
+
+def test_extrude_face_numbers_refer_to_modified_mesh():
+
+    source_mesh = geo.plane(4, 4)
+    source_points = source_mesh.points.copy()
+    edit_mesh = geo.EditMesh(source_mesh)
+
+    for step in range(3):
+        face_points = get_face_points(edit_mesh.modified_mesh, 0)
+        number_of_faces = len(edit_mesh.modified_mesh.face_vertex_counts)
+
+        mesh = edit_mesh.extrude_face(0, 1.0)
+
+        # Face 0 is deleted, 4 side quads and top face are added, top face is face 0 shifted along its normal
+        assert len(mesh.face_vertex_counts) == number_of_faces + 4
+        top_points = get_face_points(mesh, len(mesh.face_vertex_counts) - 1)
+        assert np.allclose(top_points, face_points + [0, -1, 0])
+
+    # Each step extruded the next source face: faces 0, 1, 2 of the first row
+    assert np.allclose(mesh.points[-4:, 0], [1/6, 1/2, 1/2, 1/6])
+
+    assert np.array_equal(source_mesh.points, source_points)
+    assert len(source_mesh.face_vertex_counts) == 9
+
+
+def test_batched_and_chained_extrusion_match():
+
+    batched = geo.EditMesh(geo.plane(4, 4))
+    batched.extrude_faces([0, 4, 8], 0.5)
+    batched_mesh = batched.modified_mesh
+
+    # Face numbers shift down after each deleted face
+    chained = geo.EditMesh(geo.plane(4, 4))
+    for face_number in (0, 3, 6):
+        chained.extrude_face(face_number, 0.5)
+    chained_mesh = chained.modified_mesh
+
+    assert np.allclose(batched_mesh.points, chained_mesh.points)
+    assert np.array_equal(np.sort(batched_mesh.face_vertex_counts), np.sort(chained_mesh.face_vertex_counts))
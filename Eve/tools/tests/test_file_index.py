@@ -0,0 +1,109 @@
+"""
+File index refresh on a temporary project folder
+"""
+
+
+import sqlite3
+import threading
+
+import pytest
+
+from core.database import connection
+from core.database import file_index
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    """
+    Project with two asset scene versions and a render sequence with pre-roll frames -2..4
+    """
+
+    root = tmp_path / 'Avatar'
+    asset_folder = root / 'PROD' / '3D' / 'scenes' / 'ASSETS' / 'props' / 'ROCK'
+    render_folder = root / 'PROD' / '3D' / 'images' / 'SH010' / '001'
+    asset_folder.mkdir(parents=True)
+    render_folder.mkdir(parents=True)
+
+    for version in (1, 2):
+        (asset_folder / 'AST_ROCK_{:03d}.hip'.format(version)).touch()
+    for frame in range(-2, 5):
+        (render_folder / 'RND_SH010_001.{:04d}.exr'.format(frame)).touch()
+
+    return str(root).replace('\\', '/')
+
+
+@pytest.fixture
+def index_path(tmp_path):
+
+    index_path = str(tmp_path / 'file_index.db')
+
+    yield index_path
+
+    connection.get_manager(index_path).close_all()
+
+
+def test_negative_frames_are_indexed(project_root, index_path):
+
+    index = file_index.FileIndex(index_path)
+    index.refresh(project_root)
+
+    sequences = index.find_files(project_root, prefix='RND')
+
+    assert [(indexed_file.code, indexed_file.frames) for indexed_file in sequences] == [('RND_SH010', '-2-4')]
+
+
+def test_refresh_is_incremental(project_root, index_path):
+
+    index = file_index.FileIndex(index_path)
+    first = index.refresh(project_root)
+    second = index.refresh(project_root, full=True)
+
+    assert first['listed'] == second['listed'] == second['folders']
+    assert [indexed_file.version for indexed_file in index.get_latest_versions(project_root, prefix='AST')] == [2]
+
+
+def test_walk_does_not_lock_database(project_root, index_path, monkeypatch):
+
+    index = file_index.FileIndex(index_path)
+    scan_folder = file_index.scan_folder
+
+    # Other process writes while folders are listed, without waiting for the lock
+    def scan_and_write(folder_path):
+        other_connection = sqlite3.connect(index_path, timeout=0)
+        other_connection.execute("INSERT INTO folders (path) VALUES (?)", ('X:/other' + folder_path,))
+        other_connection.commit()
+        other_connection.close()
+
+        return scan_folder(folder_path)
+
+    monkeypatch.setattr(file_index, 'scan_folder', scan_and_write)
+    stats = index.refresh(project_root)
+
+    assert stats['listed'] == stats['folders']
+    assert len(index.find_files(project_root)) == 3
+
+
+def test_concurrent_refreshes(project_root, index_path):
+
+    # Schema is created before threads start
+    file_index.FileIndex(index_path)
+    errors = []
+
+    def refresh():
+        try:
+            file_index.FileIndex(index_path).refresh(project_root, full=True)
+        except Exception as exception:
+            errors.append(exception)
+        finally:
+            connection.close_thread_connections()
+
+    threads = [threading.Thread(target=refresh) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert errors == []
+
+    index = file_index.FileIndex(index_path)
+    assert len(index.find_files(project_root)) == 3
@@ -0,0 +1,97 @@
+"""
+Version scanning of EveFilePath on a temporary project folder
+"""
+
+
+import os
+
+import pytest
+
+from core import file_path
+from core.database import entities
+
+
+@pytest.fixture
+def asset_file_path(tmp_path, monkeypatch):
+    """
+    EveFilePath of asset hip version 001 in empty asset folder
+    """
+
+    monkeypatch.setenv('EVE_PROJECT', str(tmp_path).replace('\\', '/'))
+    file_path.clear_listing_cache()
+
+    asset_file_path = file_path.EveFilePath()
+    asset_file_path.build_path_asset_hip(entities.EveFile.file_types['asset_hip'], 'prop', 'ROCK', '001')
+    os.makedirs(asset_file_path.location)
+
+    yield asset_file_path
+
+    file_path.clear_listing_cache()
+
+
+def save_versions(asset_file_path, versions):
+
+    for version in versions:
+        name = asset_file_path.file_name_template.format(asset_file_path.prefix, asset_file_path.base,
+                                                         '{0:03d}'.format(version), asset_file_path.extension)
+        open('{0}/{1}'.format(asset_file_path.location, name), 'w').close()
+
+    file_path.clear_listing_cache(asset_file_path.location)
+
+
+def test_latest_version_of_empty_location(asset_file_path):
+
+    assert asset_file_path.calculate_last_version() == 0
+
+    asset_file_path.build_latest_file_version()
+    assert asset_file_path.file_version == '001'
+
+
+def test_last_version_of_empty_location_is_not_changed(asset_file_path):
+
+    asset_file_path.build_last_file_version()
+    assert asset_file_path.file_version == '001'
+
+
+def test_latest_version(asset_file_path):
+
+    save_versions(asset_file_path, [1, 3])
+
+    asset_file_path.build_latest_file_version()
+    assert asset_file_path.file_version == '004'
+
+    asset_file_path.build_last_file_version()
+    assert asset_file_path.file_version == '003'
+
+
+def test_listing_cache_is_limited(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(file_path, 'LISTING_CACHE_SIZE', 3)
+    file_path.clear_listing_cache()
+
+    locations = []
+    for name in 'abcde':
+        location = str(tmp_path / name)
+        os.makedirs(location)
+        file_path.list_directory(location)
+        locations.append(location)
+
+    # Listing checked again becomes the most recent one
+    file_path.clear_listing_cache(locations[2])
+    file_path.list_directory(locations[2])
+
+    assert list(file_path._listings) == [locations[3], locations[4], locations[2]]
+
+    file_path.clear_listing_cache()
+    assert not file_path._listings
+
+
+def test_existing_version_without_ui(asset_file_path):
+
+    save_versions(asset_file_path, [1, 2])
+
+    scene_path = asset_file_path.version_control(interactive=False)
+
+    assert asset_file_path.file_version == '003'
+    assert scene_path == asset_file_path.path
+    assert not os.path.exists(scene_path)
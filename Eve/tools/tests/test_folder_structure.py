@@ -0,0 +1,70 @@
+"""
+Folder template flattening and creation of missing folders in a temporary folder
+"""
+
+
+import os
+
+from core import folder_structure
+
+
+SHOTS = [['SEQ010', [['SHOT_010', []], ['SHOT_020', []]]]]
+TEMPLATE = [['PROD', [['2D', [['COMP', SHOTS],
+                              ['RENDER', SHOTS]]],
+                      ['3D', [['render', SHOTS]]]]],
+            ['EDIT', []],
+            ['EDIT', [['OUT', []]]]]
+
+
+def test_flatten_template():
+
+    folders = folder_structure.flatten_template('P:/Avatar', TEMPLATE)
+
+    # Unique paths, duplicated EDIT is merged
+    assert len(folders) == len(set(folders))
+    assert folders[:4] == ['P:/Avatar', 'P:/Avatar/EDIT', 'P:/Avatar/PROD', 'P:/Avatar/EDIT/OUT']
+    assert 'P:/Avatar/PROD/2D/COMP/SEQ010/SHOT_020' in folders
+    assert 'P:/Avatar/PROD/3D/render/SEQ010/SHOT_010' in folders
+    assert len(folders) == 18
+
+    # Parents first
+    for index, path in enumerate(folders[1:], 1):
+        assert os.path.dirname(path) in folders[:index]
+
+
+def test_flatten_empty_template():
+
+    assert folder_structure.flatten_template('P:/Avatar', []) == ['P:/Avatar']
+
+
+def test_dry_run_creates_nothing(tmp_path):
+
+    root = '{0}/Avatar'.format(tmp_path.as_posix())
+    folders = folder_structure.flatten_template(root, TEMPLATE)
+
+    assert folder_structure.create_folders(folders, dry_run=True) == folders
+    assert not os.path.exists(root)
+
+    # Only folders missing on disk are reported
+    os.makedirs('{0}/PROD/2D/COMP'.format(root))
+    missing = folder_structure.create_folders(folders, max_workers=2, dry_run=True)
+
+    assert missing == [path for path in folders if not os.path.isdir(path)]
+    assert '{0}/PROD/2D/COMP/SEQ010'.format(root) in missing
+    assert '{0}/PROD/2D'.format(root) not in missing
+    assert not os.path.exists('{0}/PROD/2D/COMP/SEQ010'.format(root))
+
+
+def test_create_folders(tmp_path):
+
+    # Parent of the root does not exist yet
+    root = '{0}/projects/Avatar'.format(tmp_path.as_posix())
+    folders = folder_structure.flatten_template(root, TEMPLATE)
+    os.makedirs('{0}/PROD/3D'.format(root))
+
+    created = folder_structure.create_folders(folders, max_workers=2)
+
+    assert '{0}/PROD/3D'.format(root) not in created
+    assert all(os.path.isdir(path) for path in folders)
+    assert folder_structure.create_folders(folders, dry_run=True) == []
+    assert folder_structure.create_folders(folders) == []
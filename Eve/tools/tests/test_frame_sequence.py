@@ -0,0 +1,50 @@
+"""
+Frame sequence listing and frame ranges
+"""
+
+
+import pytest
+
+from core import file_path
+from core import frame_sequence
+
+
+@pytest.fixture
+def sequence_path(tmp_path):
+    """
+    Render sequence path in temporary folder with frames -2..2 and 5, plus files of other sequences
+    """
+
+    location = tmp_path / 'RENDER' / '001'
+    location.mkdir(parents=True)
+
+    for frame in (-2, -1, 0, 1, 2, 5):
+        (location / 'RND_SH010_001.{0:04d}.exr'.format(frame)).touch()
+    (location / 'RND_SH010_002.0003.exr').touch()
+    (location / 'RND_SH010_001.0004.jpg').touch()
+    (location / 'RND_SH010_001.0006.exr').mkdir()
+
+    file_path.clear_listing_cache()
+    yield '{0}/RND_SH010_001.%04d.exr'.format(str(location).replace('\\', '/'))
+    file_path.clear_listing_cache()
+
+
+def test_list_frames(sequence_path):
+
+    assert frame_sequence.list_frames(sequence_path) == [-2, -1, 0, 1, 2, 5]
+
+
+def test_missing_frames(sequence_path):
+
+    frames = frame_sequence.list_frames(sequence_path)
+
+    assert frame_sequence.find_missing_frames(frames, -3, 6) == [-3, 3, 4, 6]
+
+
+@pytest.mark.parametrize('frames, frame_ranges', [([1, 2, 3, 5, 7, 8], '1-3,5,7-8'),
+                                                  ([-5, -4, -3, 0, 1], '-5--3,0-1'),
+                                                  ([], '')])
+def test_frame_ranges(frames, frame_ranges):
+
+    assert frame_sequence.collapse_frames(frames) == frame_ranges
+    assert frame_sequence.expand_frames(frame_ranges) == frames
@@ -0,0 +1,83 @@
+"""
+Newell face normals, vertex normals and USD normals of procedural shapes
+"""
+
+
+import numpy as np
+import pytest
+
+import geo
+import geo_reference
+
+
+def get_face_centers(mesh):
+
+    return np.array([mesh.points[mesh.get_face_indices(face)].mean(axis=0)
+                     for face in range(len(mesh.face_vertex_counts))])
+
+
+def test_face_normals_match_loop_version():
+
+    mesh = geo.EditMesh(geo.sphere(12, 6))
+    mesh.extrude_faces([0, 20, 40], 0.3)
+    mesh = mesh.modified_mesh
+
+    reference = [geo_reference.get_newell_normal(mesh.points[mesh.get_face_indices(face)].tolist())
+                 for face in range(len(mesh.face_vertex_counts))]
+
+    assert np.allclose(mesh.get_face_normals(), reference, atol=1e-6)
+
+
+def test_concave_polygon_normal():
+
+    # L shaped polygon: normal of the first three points points the other way
+    mesh = geo.polygon([(0, 0, 0), (2, 0, 0), (2, 0, 1), (1, 0, 1), (1, 0, 2), (0, 0, 2)])
+
+    assert np.allclose(mesh.get_face_normals(), [(0, -1, 0)])
+    assert np.allclose(mesh.get_face_normals(area_weighted=True), [(0, -3, 0)])
+
+
+def get_torus_tube_centers(points):
+
+    angles = np.arctan2(points[:, 1], points[:, 0])
+
+    return np.stack((np.cos(angles) * 2, np.sin(angles) * 2, np.zeros(len(angles))), axis=1)
+
+
+@pytest.mark.parametrize('mesh, orientation, get_inner_points', [
+    (geo.sphere(12, 6), 'leftHanded', np.zeros_like),
+    (geo.cone(12), 'leftHanded', lambda points: np.full_like(points, (0, 0.5, 0))),
+    (geo.torus(12, 36, 2, 0.5), 'rightHanded', get_torus_tube_centers)])
+def test_normals_point_outward_for_shape_orientation(mesh, orientation, get_inner_points):
+
+    normals = mesh.get_normals('uniform', orientation=orientation)
+    centers = get_face_centers(mesh)
+
+    assert (np.einsum('ij,ij->i', normals, centers - get_inner_points(centers)) > 0).all()
+
+
+def test_left_handed_normals_are_flipped():
+
+    mesh = geo.plane(3, 3)
+
+    assert np.allclose(mesh.get_normals('uniform'), (0, -1, 0))
+    assert np.allclose(mesh.get_normals('uniform', orientation='leftHanded'), (0, 1, 0))
+
+    with pytest.raises(ValueError):
+        mesh.get_normals('uniform', orientation='up')
+
+
+def test_normals_interpolation():
+
+    mesh = geo.sphere(36, 18)
+
+    assert mesh.get_normals('uniform').shape == (len(mesh.face_vertex_counts), 3)
+    assert mesh.get_normals('faceVarying').shape == (len(mesh.face_vertex_indices), 3)
+
+    # Smooth sphere normals are close to point positions
+    vertex_normals = mesh.get_normals('vertex', orientation='leftHanded')
+    assert vertex_normals.shape == mesh.points.shape
+    assert np.allclose(vertex_normals, mesh.points, atol=0.01)
+
+    with pytest.raises(ValueError):
+        mesh.get_normals('varying')
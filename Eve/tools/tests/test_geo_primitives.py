@@ -0,0 +1,71 @@
+"""
+Procedural shapes and extrusion built with array operations match loop versions (geo_reference)
+"""
+
+
+import numpy as np
+import pytest
+
+import geo
+import geo_reference
+
+
+def assert_same_mesh(mesh, reference):
+
+    points, face_vertex_counts, face_vertex_indices = reference
+
+    assert mesh.points.dtype == np.float32
+    assert np.allclose(mesh.points, points, atol=1e-6)
+    assert mesh.face_vertex_counts.tolist() == face_vertex_counts
+    assert mesh.face_vertex_indices.tolist() == face_vertex_indices
+
+
+@pytest.mark.parametrize('row_points, column_points', [(2, 2), (4, 4), (3, 7)])
+def test_plane(row_points, column_points):
+
+    assert_same_mesh(geo.plane(row_points, column_points), geo_reference.plane(row_points, column_points))
+
+
+@pytest.mark.parametrize('h_points, v_points', [(3, 3), (12, 6), (36, 18)])
+def test_sphere(h_points, v_points):
+
+    assert_same_mesh(geo.sphere(h_points, v_points), geo_reference.sphere(h_points, v_points))
+
+
+@pytest.mark.parametrize('h_points, v_points', [(3, 3), (12, 36)])
+def test_torus(h_points, v_points):
+
+    assert_same_mesh(geo.torus(h_points, v_points, 2, 0.5), geo_reference.torus(h_points, v_points, 2, 0.5))
+
+
+@pytest.mark.parametrize('resolution', [3, 12])
+def test_cone(resolution):
+
+    mesh = geo.cone(resolution)
+    assert_same_mesh(mesh, geo_reference.cone(resolution))
+
+    # Last side triangle is closed, loop version had degenerate [resolution - 1, resolution, resolution]
+    last_triangle = mesh.face_vertex_indices[(resolution - 1) * 3:resolution * 3].tolist()
+    assert last_triangle == [resolution - 1, 0, resolution]
+
+    # Bottom face is wound as side faces
+    assert mesh.face_vertex_indices[-resolution:].tolist() == list(range(resolution - 1, -1, -1))
+
+
+def test_polygon():
+
+    points = [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+
+    assert_same_mesh(geo.polygon(points), (points, [3], [0, 1, 2]))
+    assert geo.polygon().face_vertex_counts.tolist() == [4]
+
+
+@pytest.mark.parametrize('shape, face_numbers', [(geo_reference.plane(5, 5), [0, 5, 15]),
+                                                 (geo_reference.sphere(12, 6), list(range(0, 60, 3))),
+                                                 (geo_reference.cone(8), [8, 2])])
+def test_extrude_faces(shape, face_numbers):
+
+    edit_mesh = geo.EditMesh(geo.MeshData(*shape))
+    edit_mesh.extrude_faces(face_numbers, 0.3)
+
+    assert_same_mesh(edit_mesh.modified_mesh, geo_reference.extrude_faces(*shape, face_numbers, 0.3))
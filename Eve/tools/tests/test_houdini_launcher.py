@@ -0,0 +1,92 @@
+"""
+Background HDA folders scan of Houdini launcher
+"""
+
+
+import os
+import time
+
+import pytest
+
+import houdini_launcher
+
+
+@pytest.fixture
+def projects(tmp_path, monkeypatch):
+    """
+    3D roots of two projects with HDA subfolders, refresher scans every 0.08 seconds
+    """
+
+    monkeypatch.setattr(houdini_launcher, 'HDA_SCAN_INTERVAL', 0.1)
+
+    roots = []
+    for project_name in ('Avatar', 'Matrix'):
+        root_3d = tmp_path / project_name / 'PROD' / '3D'
+        (root_3d / 'hda' / 'FX').mkdir(parents=True)
+        roots.append(str(root_3d).replace('\\', '/'))
+
+    yield roots
+
+    for refresher in houdini_launcher.stop_hda_refreshers():
+        refresher.join(5)
+
+
+def test_refresher_finds_new_folders(projects):
+
+    houdini_launcher.start_hda_refresher(projects[0])
+    hda_root = '{0}/hda'.format(projects[0])
+
+    os.makedirs('{0}/LIGHTS'.format(hda_root))
+    time.sleep(0.5)
+
+    assert sorted(houdini_launcher.get_hda_folders(hda_root)) == [hda_root, hda_root + '/FX', hda_root + '/LIGHTS']
+
+
+def test_refresher_of_previous_project_is_stopped(projects):
+
+    houdini_launcher.start_hda_refresher(projects[0])
+    houdini_launcher.start_hda_refresher(projects[0])  # Already running
+    assert len(houdini_launcher._hda_refreshers) == 1
+
+    # Select another project
+    stopped = houdini_launcher.stop_hda_refreshers(keep_root_3d=projects[1])
+    houdini_launcher.start_hda_refresher(projects[1])
+
+    assert len(stopped) == 1
+    stopped[0].join(5)
+    assert not stopped[0].is_alive()
+    assert list(houdini_launcher._hda_refreshers) == ['{0}/hda'.format(projects[1])]
+
+    # Same project selected again
+    assert houdini_launcher.stop_hda_refreshers(keep_root_3d=projects[1]) == []
+
+
+def test_new_folder_in_root_is_found_before_interval(projects, monkeypatch):
+
+    monkeypatch.setattr(houdini_launcher, 'HDA_SCAN_INTERVAL', 30)
+    hda_root = '{0}/hda'.format(projects[0])
+
+    # Scan taken more than 2 seconds after last modification is trusted without listing
+    past = time.time() - 10
+    os.utime(hda_root, (past, past))
+    houdini_launcher.scan_hda_folders(hda_root)
+    assert houdini_launcher.get_hda_folders(hda_root) == [hda_root, hda_root + '/FX']
+
+    os.makedirs('{0}/LIGHTS'.format(hda_root))
+
+    assert houdini_launcher.get_hda_folders(hda_root) == [hda_root, hda_root + '/FX', hda_root + '/LIGHTS']
+
+
+def test_environment_follows_launcher_environment(projects, monkeypatch):
+
+    projects_root, project_name = os.path.dirname(os.path.dirname(projects[0])).rsplit('/', 1)
+    build_environment = lambda: houdini_launcher.build_environment('E:/Eve', projects_root, project_name, '19.5.368')
+
+    monkeypatch.setenv('EVE_TEST_LICENSE', 'first')
+    environment = build_environment()
+    assert environment['EVE_TEST_LICENSE'] == 'first'
+    assert environment['JOB'] == projects[0]
+
+    monkeypatch.setenv('EVE_TEST_LICENSE', 'second')
+    assert build_environment()['EVE_TEST_LICENSE'] == 'second'
+    assert build_environment()['EVE_PROJECT_NAME'] == project_name
@@ -0,0 +1,84 @@
+"""
+Identity map shared by EveData instances of one database file
+"""
+
+
+import os
+import sqlite3
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PySide6 import QtCore
+
+from core import data_service
+from core.database import entities
+from core.database import eve_data
+
+
+@pytest.fixture
+def database(sql_file_path):
+    """
+    EveData with 500 assets in project
+    """
+
+    data = eve_data.EveData(sql_file_path)
+    project_id = data.projects[0].id
+
+    assets = []
+    for index in range(500):
+        asset = entities.Asset('ASSET_{:03d}'.format(index), project_id)
+        asset.type = 1
+        assets.append(asset)
+    data.bulk_add_assets(assets, project_id)
+
+    yield data
+
+    data.database.close_all()
+
+
+def test_background_task_keeps_cache(database):
+
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    project_id = database.projects[0].id
+
+    database.fetch_project_assets(project_id)
+    size = database.get_cache_stats()['size']
+    assert size >= 500
+
+    service = data_service.DataService(database)
+    future = service.submit('fetch_project_assets', project_id)
+    assert service.wait(10000)
+    application.processEvents()
+
+    assert len(future.result()) == 500
+    assert database.get_cache_stats()['size'] == size
+
+    # Objects loaded in background are the cached ones
+    assert future.result()[0] is database.get_asset(future.result()[0].id)
+
+
+def test_instances_share_cache(database):
+
+    other_data = eve_data.EveData(database.SQL_FILE_PATH)
+    asset_id = database.project_assets[0].id
+    assert other_data.get_asset(asset_id).description == ''
+
+    asset = database.get_asset(asset_id)
+    asset.description = 'Hero rock'
+    database.update_asset(asset)
+
+    assert other_data.get_asset(asset_id).description == 'Hero rock'
+
+
+def test_commit_of_other_process_clears_cache(database):
+
+    asset_id = database.project_assets[0].id
+    assert database.get_asset(asset_id).description == ''
+
+    other_connection = sqlite3.connect(database.SQL_FILE_PATH)
+    other_connection.execute("UPDATE assets SET description='Moss' WHERE id=?", (asset_id,))
+    other_connection.commit()
+    other_connection.close()
+
+    assert database.get_asset(asset_id).description == 'Moss'
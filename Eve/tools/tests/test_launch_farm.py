@@ -0,0 +1,115 @@
+"""
+Farm jobs run with python and a fake script instead of hython
+"""
+
+
+import os
+import sys
+
+import pytest
+
+import launch_farm
+
+
+# Fake job: prints its arguments, exits with code from argument, 'sleep' runs until killed
+FAKE_SCRIPT = '''
+import sys
+import time
+
+print('job', sys.argv[1])
+if sys.argv[1] == 'sleep':
+    time.sleep(60)
+sys.exit(int(sys.argv[1]))
+'''
+
+
+def build_jobs(tmp_path, arguments):
+
+    script = tmp_path / 'fake_job.py'
+    script.write_text(FAKE_SCRIPT)
+
+    return [launch_farm.Job('job_{}'.format(index), str(script), (argument,))
+            for index, argument in enumerate(arguments)]
+
+
+def read_log(result):
+
+    with open(result.log_path) as log:
+        return log.read()
+
+
+def test_build_script_jobs():
+
+    jobs = launch_farm.build_script_jobs('E:/Eve/tools/houdini/create_asset.py', [3, 12])
+
+    assert [job.name for job in jobs] == ['create_asset_3', 'create_asset_12']
+    assert jobs[1].arguments == ('12',)
+
+
+def test_repeated_ids_get_one_job():
+
+    jobs = launch_farm.build_script_jobs('E:/Eve/tools/houdini/create_asset.py', [3, 12, 3])
+
+    assert [job.name for job in jobs] == ['create_asset_3', 'create_asset_12']
+
+
+def test_duplicate_job_names_are_rejected(tmp_path):
+
+    jobs = build_jobs(tmp_path, ['0'])
+
+    with pytest.raises(ValueError):
+        launch_farm.run_jobs(sys.executable, jobs * 2, str(tmp_path / 'logs'))
+
+
+def test_exit_codes(tmp_path):
+
+    jobs = build_jobs(tmp_path, ['0', '3', '0', '1', '0'])
+    log_folder = str(tmp_path / 'logs')
+
+    results = launch_farm.run_jobs(sys.executable, jobs, log_folder, max_processes=2)
+
+    # Results are in jobs order whatever order jobs finish in
+    assert [result.job for result in results] == jobs
+    assert [result.return_code for result in results] == [0, 3, 0, 1, 0]
+    assert read_log(results[1]).strip() == 'job 3'
+    assert launch_farm.report(results) == [results[1], results[3]]
+
+
+def test_environment_is_passed(tmp_path):
+
+    script = tmp_path / 'env_job.py'
+    script.write_text("import os, sys\nsys.exit(0 if os.environ.get('EVE_PROJECT_NAME') == sys.argv[1] else 1)\n")
+    job = launch_farm.Job('env_job', str(script), ('Avatar',))
+
+    env = dict(os.environ, EVE_PROJECT_NAME='Avatar')
+    result = launch_farm.run_job(sys.executable, job, str(tmp_path), env=env)
+
+    assert result.return_code == 0
+
+
+def test_timeout_kills_job(tmp_path):
+
+    jobs = build_jobs(tmp_path, ['sleep', '0'])
+
+    results = launch_farm.run_jobs(sys.executable, jobs, str(tmp_path / 'logs'), timeout=2)
+
+    assert results[0].return_code is None
+    assert results[0].duration < 30
+    assert 'killed after 2 sec timeout' in read_log(results[0])
+    assert results[1].return_code == 0
+    assert launch_farm.report(results) == [results[0]]
+
+
+def test_executable_fails_to_start(tmp_path):
+
+    jobs = build_jobs(tmp_path, ['0'])
+
+    results = launch_farm.run_jobs(str(tmp_path / 'missing_hython'), jobs, str(tmp_path / 'logs'))
+
+    assert results[0].return_code is None
+    assert 'failed to start' in read_log(results[0])
+
+
+def test_report_without_jobs():
+
+    assert launch_farm.report([]) == []
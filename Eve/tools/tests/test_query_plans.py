@@ -0,0 +1,66 @@
+"""
+Hot lookups of EveData must use indexes added by migrations, not full table scans
+"""
+
+
+import sqlite3
+
+import pytest
+
+from core.database import connection
+from core.database import eve_data
+from core.database import migrations
+
+
+# (query, parameters, expected index)
+LOOKUPS = [
+    ("SELECT * FROM assets WHERE project=:project", {'project': 1}, 'assets_project_name'),
+    ("SELECT * FROM sequences WHERE project=:project", {'project': 1}, 'sequences_project_name'),
+    ("SELECT * FROM shots WHERE sequence=:sequence", {'sequence': 1}, 'shots_sequence_name'),
+    ("SELECT assets.* FROM shot_assets JOIN assets ON assets.id = shot_assets.asset_id "
+     "WHERE shot_assets.shot_id=:shot_id ORDER BY shot_assets.id", {'shot_id': 1}, 'shot_assets_shot_asset'),
+    ("SELECT shot_id FROM shot_assets WHERE asset_id=:asset_id", {'asset_id': 1}, 'shot_assets_asset'),
+    ("SELECT id FROM shot_assets WHERE shot_id=:shot_id AND asset_id=:asset_id", {'shot_id': 1, 'asset_id': 1},
+     'shot_assets_shot_asset'),
+    ("SELECT * FROM projects WHERE name=:name", {'name': 'eve_example'}, 'projects_name'),
+]
+
+
+def get_query_plan(cursor, query, parameters):
+
+    cursor.execute('EXPLAIN QUERY PLAN {0}'.format(query), parameters)
+
+    return [row[-1] for row in cursor.fetchall()]
+
+
+@pytest.fixture
+def database(sql_file_path):
+
+    eve_data.EveData(sql_file_path)
+    database = connection.get_manager(sql_file_path)
+    yield database
+    database.close_all()
+
+
+@pytest.mark.parametrize('query, parameters, index', LOOKUPS)
+def test_lookup_uses_index(database, query, parameters, index):
+
+    plan = get_query_plan(database.cursor(), query, parameters)
+
+    assert any('USING' in step and index in step for step in plan), plan
+    assert not any(step.startswith('SCAN') and 'USING' not in step for step in plan), plan
+
+
+def test_existing_database_is_upgraded(database):
+
+    assert migrations.get_version(database.cursor()) == migrations.MIGRATIONS[-1][0]
+
+
+def test_shot_asset_link_is_unique(database):
+
+    with database.transaction() as cursor:
+        cursor.execute("INSERT INTO shot_assets (shot_id, asset_id) VALUES (1, 1)")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        with database.transaction() as cursor:
+            cursor.execute("INSERT INTO shot_assets (shot_id, asset_id) VALUES (1, 1)")
@@ -0,0 +1,77 @@
+"""
+Project import and export round trip through JSON and CSV files
+"""
+
+
+import pytest
+
+from core.database import eve_data
+from core.database import transfer
+
+
+# Entities in export order: by name, linked assets in link order
+PROJECT_DATA = {
+    'project': {'name': 'Avatar', 'houdini_build': '19.5.368', 'width': 2048, 'height': 858, 'description': 'Film'},
+    'assets': [{'name': 'forest', 'type': 'environment', 'description': ''},
+               {'name': 'rock', 'type': 'static', 'description': ''},
+               {'name': 'roma', 'type': 'character', 'description': 'Hero'}],
+    'sequences': [{'name': 'SEQ010', 'description': 'Intro',
+                   'shots': [{'name': 'SHOT_010', 'start_frame': 1001, 'end_frame': 1050, 'width': 2048,
+                              'height': 858, 'description': '', 'assets': ['roma', 'forest']},
+                             {'name': 'SHOT_020', 'start_frame': 1001, 'end_frame': 1100, 'width': 2048,
+                              'height': 858, 'description': 'Close up', 'assets': ['roma']}]},
+                  {'name': 'SEQ020', 'description': '',
+                   'shots': [{'name': 'SHOT_010', 'start_frame': 1001, 'end_frame': 1200, 'width': 2048,
+                              'height': 858, 'description': '', 'assets': []}]}]}
+
+
+@pytest.fixture
+def database(sql_file_path):
+
+    data = eve_data.EveData(sql_file_path)
+    yield data
+    data.database.close_all()
+
+
+@pytest.mark.parametrize('file_name', ['avatar.json', 'avatar.csv'])
+def test_round_trip(database, tmp_path, file_name):
+
+    transfer.import_project(database, PROJECT_DATA)
+    assert transfer.export_project(database, 'Avatar') == PROJECT_DATA
+
+    # Export to file and import as a new project
+    file_path = str(tmp_path / file_name)
+    transfer.write_project(transfer.export_project(database, 'Avatar'), file_path)
+    project = transfer.import_project(database, transfer.read_project(file_path), 'Avatar_copy')
+
+    project_data = transfer.export_project(database, project.name)
+    assert project_data['project']['name'] == 'Avatar_copy'
+    assert project_data['assets'] == PROJECT_DATA['assets']
+    assert project_data['sequences'] == PROJECT_DATA['sequences']
+
+
+def test_import_twice_adds_nothing(database):
+
+    transfer.import_project(database, PROJECT_DATA)
+    transfer.import_project(database, PROJECT_DATA)
+
+    assert transfer.export_project(database, 'Avatar') == PROJECT_DATA
+
+
+def test_unknown_linked_asset_is_skipped(database):
+
+    project_data = {'project': {'name': 'Avatar'},
+                    'sequences': [{'name': 'SEQ010',
+                                   'shots': [{'name': 'SHOT_010', 'assets': ['roma']}]}]}
+
+    transfer.import_project(database, project_data)
+
+    shot = transfer.export_project(database, 'Avatar')['sequences'][0]['shots'][0]
+    assert shot['name'] == 'SHOT_010'
+    assert shot['assets'] == []
+
+
+def test_export_missing_project(database):
+
+    with pytest.raises(ValueError):
+        transfer.export_project(database, 'Missing')
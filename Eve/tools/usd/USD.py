@@ -52,19 +52,21 @@ def crate_geometry():
     mesh_data = geo.torus(12, 36, 2, 0.5)
     edit_mesh = geo.EditMesh(mesh_data)
 
-    for i in reversed(range(36*12)):
-        if not i % 3:
-            edit_mesh.extrude_face(i, 0.3)
-
+    edit_mesh.extrude_faces(range(0, 36*12, 3), 0.3)
     mesh_data = edit_mesh.modified_mesh
 
-    # Set mesh attributes
+    # Torus faces are wound for right-handed orientation, plane, sphere and cone faces for left-handed
+    orientation = UsdGeom.Tokens.rightHanded
+
+    # Set mesh attributes, normals follow the same orientation as faces
     mesh.GetPointsAttr().Set(mesh_data.points)
     mesh.GetFaceVertexCountsAttr().Set(mesh_data.face_vertex_counts)
     mesh.GetFaceVertexIndicesAttr().Set(mesh_data.face_vertex_indices)
+    mesh.CreateNormalsAttr().Set(mesh_data.get_normals(UsdGeom.Tokens.faceVarying, orientation=orientation))
+    mesh.SetNormalsInterpolation(UsdGeom.Tokens.faceVarying)
 
     # Set orientation and subdivisionScheme
-    mesh.CreateOrientationAttr().Set(UsdGeom.Tokens.leftHanded)
+    mesh.CreateOrientationAttr().Set(orientation)
     mesh.CreateSubdivisionSchemeAttr().Set("none")
 
     stage.GetRootLayer().Save()
@@ -9,7 +9,6 @@ point3f[] points =        [(-5, 0, -5), (5, 0, -5), (5, 0, 5), (-5, 0, 5)]
 
 
 import math
-import copy
 import numpy as np
 
 
@@ -18,78 +17,277 @@ class MeshData:
     """
     Geometry container: define points, polygons etc
 
-    self.points: List of point positions
-    self.face_vertex_counts: List of vertex count per face (each element is a face)
-    self.face_vertex_indices: List of vertex indices
+    self.points: float32 array of point positions, shape (number of points, 3)
+    self.face_vertex_counts: int32 array of vertex count per face (each element is a face)
+    self.face_vertex_indices: int32 array of vertex indices
+    self.face_offsets: int64 array, start of each face in face_vertex_indices, last element is number of indices
+
+    Arrays are passed to UsdGeom.Mesh attributes as is. Points and faces added one by one (add_point, add_face) are
+    collected in lists and merged into arrays on next access. Arrays are replaced, not edited in place:
+    face_vertex_counts is read-only, because face_offsets are calculated from it.
     """
 
-    def __init__(self):
+    def __init__(self, points=None, face_vertex_counts=None, face_vertex_indices=None):
+
+        self.points = [] if points is None else points
+        self.set_faces([] if face_vertex_counts is None else face_vertex_counts,
+                       [] if face_vertex_indices is None else face_vertex_indices)
+
+    @property
+    def points(self):
+
+        if self._added_points:
+            added_points = np.array(self._added_points, dtype=np.float32).reshape(-1, 3)
+            self._points = np.concatenate((self._points, added_points))
+            self._added_points = []
+
+        return self._points
+
+    @points.setter
+    def points(self, points):
+
+        self._points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+        self._added_points = []
+
+    @property
+    def face_vertex_counts(self):
+
+        self.merge_faces()
+        return self._face_vertex_counts
+
+    @property
+    def face_vertex_indices(self):
+
+        self.merge_faces()
+        return self._face_vertex_indices
+
+    @property
+    def face_offsets(self):
+
+        self.merge_faces()
+        if self._face_offsets is None:
+            face_offsets = np.zeros(len(self._face_vertex_counts) + 1, dtype=np.int64)
+            np.cumsum(self._face_vertex_counts, out=face_offsets[1:])
+            face_offsets.setflags(write=False)
+            self._face_offsets = face_offsets
+
+        return self._face_offsets
+
+    def set_faces(self, face_vertex_counts, face_vertex_indices):
+        """
+        Replace all faces of the mesh
+        """
+
+        # Arrays are not copied, read-only flag is set on a view
+        self._face_vertex_counts = np.ascontiguousarray(face_vertex_counts, dtype=np.int32).reshape(-1).view()
+        self._face_vertex_counts.setflags(write=False)
+        self._face_vertex_indices = np.ascontiguousarray(face_vertex_indices, dtype=np.int32).reshape(-1)
+        self._face_offsets = None
+        self._added_counts = []
+        self._added_indices = []
+
+    def merge_faces(self):
+        """
+        Move faces added with add_face to arrays
+        """
 
-        self.points = []
-        self.face_vertex_counts = []
-        self.face_vertex_indices = []
+        if not self._added_counts:
+            return
+
+        self._face_vertex_counts = np.concatenate((self._face_vertex_counts,
+                                                   np.array(self._added_counts, dtype=np.int32)))
+        self._face_vertex_counts.setflags(write=False)
+        self._face_vertex_indices = np.concatenate((self._face_vertex_indices,
+                                                    np.array(self._added_indices, dtype=np.int32)))
+        self._face_offsets = None
+        self._added_counts = []
+        self._added_indices = []
 
     def add_point(self, point):
         """
         Add a single point to the mesh.
         """
-        self.points.append(point)
+        self._added_points.append(point)
 
     def add_face(self, face_vertex_counts, face_vertex_indices):
         """
         Add a single face to the mesh.
         """
 
-        self.face_vertex_counts.append(face_vertex_counts)
-        self.face_vertex_indices.extend(face_vertex_indices)
+        self._added_counts.append(face_vertex_counts)
+        self._added_indices.extend(face_vertex_indices)
 
-    def get_face(self, face_number):
+    def get_face_indices(self, face_number):
         """
-        Get and return data for current face
+        Get vertex indices of the face (array view, no copy)
         """
 
-        face_data = MeshData()
+        face_offsets = self.face_offsets
 
-        # Get the indices of the vertices that make up the face
-        start = sum(self.face_vertex_counts[:face_number])
-        end = start + self.face_vertex_counts[face_number]
-        vertex_indices = self.face_vertex_indices[start:end]
+        return self._face_vertex_indices[face_offsets[face_number]:face_offsets[face_number + 1]]
 
-        # Get point positions
-        for index in vertex_indices:
-            face_data.add_point(self.points[index])
+    def get_face(self, face_number):
+        """
+        Get and return data for current face
+        """
 
-        # Record face data
-        face_data.add_face(len(vertex_indices), vertex_indices)
+        # Get the indices of the vertices that make up the face and their positions
+        vertex_indices = self.get_face_indices(face_number)
 
-        return face_data
+        return MeshData(self.points[vertex_indices], [len(vertex_indices)], vertex_indices)
 
     def get_normal(self, face_data):
         """
         Calculate normal of a face
         """
 
-        # Get first 3 points from face
-        point_1 = np.array(face_data.points[0])
-        point_2 = np.array(face_data.points[1])
-        point_3 = np.array(face_data.points[2])
-
-        # Calculate the normalized normal as a list
-        normal = np.cross(point_2 - point_1, point_3 - point_1)
-        normal = normal / np.linalg.norm(normal)
-        normal = normal.tolist()
+        # Face data points are in face vertex order
+        number_of_points = len(face_data.points)
+        normal = get_newell_normals(face_data.points, [number_of_points], np.arange(number_of_points))
+        normal = normalize(normal)[0].tolist()
 
         return normal
 
+    def get_face_normals(self, area_weighted=False):
+        """
+        Calculate normals of all faces with Newell's method, concave and non-planar polygons are supported
+
+        :param area_weighted: bool, length of normal is face area, unit length otherwise
+        :return: float32 array (number of faces, 3)
+        """
+
+        normals = get_newell_normals(self.points, self.face_vertex_counts, self.face_vertex_indices)
+        if area_weighted:
+            normals *= 0.5
+        else:
+            normals = normalize(normals)
+
+        return normals.astype(np.float32)
+
+    def get_vertex_normals(self, area_weighted=False):
+        """
+        Calculate point normals: average of normals of faces which share the point
+
+        :param area_weighted: bool, bigger faces have more influence on point normal
+        :return: float32 array (number of points, 3)
+        """
+
+        face_normals = get_newell_normals(self.points, self.face_vertex_counts, self.face_vertex_indices)
+        if not area_weighted:
+            face_normals = normalize(face_normals)
+
+        # Sum normals of face vertices per point
+        face_vertex_normals = np.repeat(face_normals, self.face_vertex_counts, axis=0)
+        vertex_normals = np.empty((len(self.points), 3))
+        for axis in range(3):
+            vertex_normals[:, axis] = np.bincount(self.face_vertex_indices, weights=face_vertex_normals[:, axis],
+                                                  minlength=len(self.points))
+
+        return normalize(vertex_normals).astype(np.float32)
+
+    def get_normals(self, interpolation='faceVarying', area_weighted=False, orientation='rightHanded'):
+        """
+        Calculate normals for UsdGeom.Mesh normals attribute, without per face Python loop
+
+        :param interpolation: string, USD normals interpolation:
+            'uniform' - one normal per face
+            'faceVarying' - one normal per face vertex, normal of the face (flat shading)
+            'vertex' - one normal per point, average of face normals (smooth shading)
+        :param area_weighted: bool, weight face normals by face area
+        :param orientation: string, USD mesh orientation: normals follow right-hand rule for face vertex order for
+            'rightHanded', left-hand rule (flipped) for 'leftHanded'
+        :return: float32 array (number of normals, 3)
+        """
+
+        if orientation not in ('rightHanded', 'leftHanded'):
+            raise ValueError('Unsupported mesh orientation: {}'.format(orientation))
+
+        if interpolation == 'vertex':
+            normals = self.get_vertex_normals(area_weighted)
+        elif interpolation == 'uniform':
+            normals = self.get_face_normals()
+        elif interpolation == 'faceVarying':
+            normals = np.repeat(self.get_face_normals(), self.face_vertex_counts, axis=0)
+        else:
+            raise ValueError('Unsupported normals interpolation: {}'.format(interpolation))
+
+        if orientation == 'leftHanded':
+            np.negative(normals, out=normals)
+
+        return normals
+
 
 class EditMesh:
     """
     Geometry manipulation: edit geometry container data
+
+    Source mesh is not copied: edits are recorded as a delta (deleted faces, added points and faces) against the base
+    mesh and applied when modified_mesh is requested. Arrays without changes are shared with the source as read-only
+    views, so editing a big mesh does not duplicate it.
     """
 
     def __init__(self, mesh_data):
         self.source_mesh = mesh_data
-        self.modified_mesh = copy.deepcopy(mesh_data)
+        self.base_mesh = mesh_data  # Mesh the delta is recorded against, source or last committed mesh
+        self.clear_delta()
+
+    def clear_delta(self):
+
+        self.deleted_faces = []  # Arrays of deleted base mesh face numbers
+        self.first_deleted_face = len(self.base_mesh.face_vertex_counts)
+        self.added_points = []  # float32 arrays
+        self.added_face_vertex_counts = []  # int32 arrays
+        self.added_face_vertex_indices = []  # int32 arrays
+        self.number_of_points = len(self.base_mesh.points)
+
+    @property
+    def modified_mesh(self):
+
+        return self.commit()
+
+    def commit(self):
+        """
+        Apply recorded edits to the base mesh
+
+        :return: MeshData, arrays without changes are shared with base mesh
+        """
+
+        base_mesh = self.base_mesh
+        if base_mesh is not self.source_mesh and not self.deleted_faces and not self.added_face_vertex_counts:
+            return base_mesh
+
+        points = get_read_only(base_mesh.points)
+        if self.added_points:
+            points = np.concatenate([points] + self.added_points)
+
+        face_vertex_counts = base_mesh.face_vertex_counts
+        face_vertex_indices = get_read_only(base_mesh.face_vertex_indices)
+        if self.deleted_faces:
+            keep_faces = np.ones(len(face_vertex_counts), dtype=bool)
+            keep_faces[np.concatenate(self.deleted_faces)] = False
+            face_vertex_indices = face_vertex_indices[np.repeat(keep_faces, face_vertex_counts)]
+            face_vertex_counts = face_vertex_counts[keep_faces]
+
+        if self.added_face_vertex_counts:
+            face_vertex_counts = np.concatenate([face_vertex_counts] + self.added_face_vertex_counts)
+            face_vertex_indices = np.concatenate([face_vertex_indices] + self.added_face_vertex_indices)
+
+        self.base_mesh = MeshData(points, face_vertex_counts, face_vertex_indices)
+        self.clear_delta()
+
+        return self.base_mesh
+
+    def get_base_faces(self, face_numbers):
+        """
+        Convert modified mesh face numbers to base mesh face numbers. Faces before the first deleted face keep their
+        numbers, for other faces recorded edits are committed first.
+        """
+
+        face_numbers = np.asarray(face_numbers, dtype=np.int64).reshape(-1)
+        if len(face_numbers) and face_numbers.max() >= self.first_deleted_face:
+            self.commit()
+
+        return face_numbers
 
     def shift_point(self, point, vector, length):
         """
@@ -108,66 +306,189 @@ class EditMesh:
         Delete face
         """
 
-        # Calculate face index range
-        start = sum(self.modified_mesh.face_vertex_counts[:face_number])
-        end = start + self.modified_mesh.face_vertex_counts[face_number]
+        self.delete_faces([face_number])
 
-        # Remove faces
-        del self.modified_mesh.face_vertex_counts[face_number]
-        del self.modified_mesh.face_vertex_indices[start:end]
+    def delete_faces(self, face_numbers):
+        """
+        Delete faces
+        """
+
+        face_numbers = self.get_base_faces(face_numbers)
+        if not len(face_numbers):
+            return
+
+        self.deleted_faces.append(face_numbers)
+        self.first_deleted_face = min(self.first_deleted_face, int(face_numbers.min()))
 
     def extrude_face(self, face_number, extrude_distance):
         """
-        Extrude polygon along normal
+        Extrude polygon along normal.
+        Face number refers to the modified mesh (result of previous edits) both for extruded geometry and for deleted
+        face, so chained calls extrude the face which is currently face_number.
+        """
+
+        self.extrude_faces([face_number], extrude_distance)
+
+        return self.modified_mesh
+
+    def extrude_faces(self, face_numbers, extrude_distance):
         """
+        Extrude polygons along their normals, all faces are processed at once with array operations.
+        Extruded points, side quads and top face of each polygon are added in face_numbers order, source faces are
+        deleted. Edits are recorded, modified_mesh applies them.
 
-        # Get selected face data
-        face_data = self.source_mesh.get_face(face_number)
-        face_normal = face_data.get_normal(face_data)
-        number_of_points_source = len(self.modified_mesh.points)
-        polygon_points_number = len(face_data.points)
+        :param face_numbers: list or array of unique face numbers
+        :param extrude_distance: float, distance along normal
+        """
 
-        # Loop face points and extend points with new extruded points
-        for point in face_data.points:
-            extruded_point = self.shift_point(point, face_normal, extrude_distance)
-            self.modified_mesh.add_point(extruded_point)
+        face_numbers = self.get_base_faces(face_numbers)
+
+        # Extruded faces and their points are in base mesh
+        mesh = self.base_mesh
+        points = mesh.points
+        face_vertex_indices = mesh.face_vertex_indices
+        face_offsets = mesh.face_offsets
+        number_of_points_source = self.number_of_points
+
+        counts = mesh.face_vertex_counts[face_numbers].astype(np.int64)
+        starts = face_offsets[face_numbers]
+
+        # Position of each extruded vertex in its polygon and position of the next vertex of the polygon
+        ring_starts = np.zeros(len(counts), dtype=np.int64)
+        np.cumsum(counts[:-1], out=ring_starts[1:])
+        local_indices = get_local_indices(counts)
+        next_positions = np.repeat(ring_starts, counts) + (local_indices + 1) % np.repeat(counts, counts)
+        vertex_indices = face_vertex_indices[np.repeat(starts, counts) + local_indices]
+
+        # Face normals, new points are shifted along them
+        normals = normalize(get_newell_normals(points, counts, vertex_indices))
+        extruded_points = points[vertex_indices] + np.repeat(normals, counts, axis=0) * extrude_distance
+
+        # Each polygon adds a block of faces: one quad per edge, then top face
+        block_starts = ring_starts + np.arange(len(counts))
+        added_counts = np.full(len(vertex_indices) + len(counts), 4, dtype=np.int32)
+        added_counts[block_starts + counts] = counts
+
+        new_point_indices = number_of_points_source + np.arange(len(vertex_indices))
+        quads = np.stack((vertex_indices,
+                          vertex_indices[next_positions],
+                          new_point_indices[next_positions],
+                          new_point_indices), axis=1)
+
+        block_index_starts = ring_starts * 5
+        quad_positions = np.repeat(block_index_starts, counts) + local_indices * 4
+        added_indices = np.empty(len(vertex_indices) * 5, dtype=np.int32)
+        added_indices[quad_positions[:, np.newaxis] + np.arange(4)] = quads
+        added_indices[np.repeat(block_index_starts + counts * 4, counts) + local_indices] = new_point_indices
+
+        # Record edits: delete source faces and add new ones
+        if len(face_numbers):
+            self.deleted_faces.append(face_numbers)
+            self.first_deleted_face = min(self.first_deleted_face, int(face_numbers.min()))
+        self.added_points.append(extruded_points.astype(np.float32))
+        self.added_face_vertex_counts.append(added_counts)
+        self.added_face_vertex_indices.append(added_indices)
+        self.number_of_points += len(extruded_points)
+
+
+def get_newell_normals(points, face_vertex_counts, face_vertex_indices):
+    """
+    Calculate face normals with Newell's method: normal.x = sum((y - y_next) * (z + z_next)) over face edges, same for
+    y and z. All edges of the face are used, so result is correct for concave and non-planar polygons.
+    Normal follows right-hand rule for face vertex order, as the normal used by extrusion.
 
-        # Add face for each pair of old/new points (edges)
-        for index in range(polygon_points_number):
-            global_index = face_data.face_vertex_indices[index]
-            next_global_index = face_data.face_vertex_indices[(index + 1) % polygon_points_number]
+    :return: float64 array (number of faces, 3), length of normal is double face area
+    """
 
-            lower_left = global_index
-            lower_right = next_global_index
-            upper_left = number_of_points_source + index
-            upper_right = number_of_points_source + (index + 1) % polygon_points_number
+    face_vertex_counts = np.asarray(face_vertex_counts, dtype=np.int64)
+    normals = np.zeros((len(face_vertex_counts), 3))
+    if not len(face_vertex_counts):
+        return normals
 
-            quad = [lower_left, lower_right, upper_right, upper_left]
-            self.modified_mesh.add_face(4, quad)
+    face_starts = np.cumsum(face_vertex_counts) - face_vertex_counts
+    face_ends = face_starts + face_vertex_counts - 1
+    points = np.asarray(points, dtype=np.float64)
 
-        # Add top face to close the extrusion
-        top_face_indices = []
-        for i in range(number_of_points_source, number_of_points_source + polygon_points_number):
-            top_face_indices.append(i)
+    # Coordinates of face vertices and of the next vertex of the same face, per axis (all six arrays are kept)
+    coordinates = []
+    for axis in range(3):
+        current = points[:, axis][face_vertex_indices]
+        following = np.empty_like(current)
+        following[:-1] = current[1:]
+        following[face_ends] = current[face_starts]
+        coordinates.append((current, following))
 
-        self.modified_mesh.add_face(polygon_points_number, top_face_indices)
+    for axis in range(3):
+        (y, y_next), (z, z_next) = coordinates[(axis + 1) % 3], coordinates[(axis + 2) % 3]
+        edge_terms = y - y_next
+        edge_terms *= z + z_next
+        normals[:, axis] = np.add.reduceat(edge_terms, face_starts)
 
-        self.delete_face(face_number)
+    return normals
 
-        return self.modified_mesh
+
+def normalize(vectors):
+    """
+    Scale vectors to unit length, zero vectors (degenerate faces) stay zero
+    """
+
+    lengths = np.linalg.norm(vectors, axis=1)[:, np.newaxis]
+
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors, dtype=np.float64), where=lengths > 0)
+
+
+def get_read_only(array):
+    """
+    Get read-only view of array, to share it between meshes
+    """
+
+    array = array.view()
+    array.setflags(write=False)
+
+    return array
+
+
+def get_local_indices(face_vertex_counts):
+    """
+    Get position of each vertex in its face: counts [3, 4] > [0, 1, 2, 0, 1, 2, 3]
+    """
+
+    face_vertex_counts = np.asarray(face_vertex_counts, dtype=np.int64)
+    face_starts = np.cumsum(face_vertex_counts) - face_vertex_counts
+
+    return np.arange(face_vertex_counts.sum()) - np.repeat(face_starts, face_vertex_counts)
 
 
 # Math
 def get_cartesian_position(h_angle, v_angle):
     """
-    Convert polar to cartesian coordinates
+    Convert polar to cartesian coordinates, angles can be numbers or arrays
     """
 
-    position = (math.sin(v_angle) * math.cos(h_angle), math.cos(v_angle), math.sin(v_angle) * math.sin(h_angle))
+    position = (np.sin(v_angle) * np.cos(h_angle), np.cos(v_angle), np.sin(v_angle) * np.sin(h_angle))
 
     return position
 
 
+def get_grid_quads(rows, columns, row_step, wrap_columns=False):
+    """
+    Get point indices of grid cells (rows x columns cells), cells of the last column are connected to the first column
+    if wrap_columns is True
+
+    :param row_step: integer, number of points in one grid row
+    :return: tuple of 4 arrays (rows, columns): (left, right, next row left, next row right) corner indices
+    """
+
+    row_starts = np.arange(rows, dtype=np.int32)[:, np.newaxis] * row_step
+    column_indices = np.arange(columns, dtype=np.int32)
+    next_column_indices = (column_indices + 1) % row_step if wrap_columns else column_indices + 1
+
+    left = row_starts + column_indices
+    right = row_starts + next_column_indices
+
+    return left, right, left + row_step, right + row_step
+
+
 # Procedural shapes
 def polygon(points=None):
     """
@@ -178,25 +499,14 @@ def polygon(points=None):
     if points is None:
         points = [(-1, 0, 1), (1, 0, 1), (1, 0, -1), (-1, 0, -1)]
 
-    mesh_data = MeshData()
-
-    # Add points
-    for point in points:
-        mesh_data.add_point(point)
-
-    # Add faces
-    mesh_data.add_face(len(points), [i for i in range(len(points))])
-
-    return mesh_data
+    return MeshData(points, [len(points)], np.arange(len(points)))
 
 
 def plane(row_points, column_points):
     """
-    Create polygonal grid
+    Create polygonal grid, faces are wound for left-handed orientation (left-hand normals point up)
     """
 
-    mesh_data = MeshData()
-
     # Spacing between points
     width = 1
     height = 1
@@ -204,137 +514,113 @@ def plane(row_points, column_points):
     col_spacing = width / (column_points - 1)
 
     # Generate points for the grid
-    for row_point in range(row_points):
-        for column_point in range(column_points):
-            x = column_point * col_spacing - width / 2
-            z = row_point * row_spacing - height / 2
-            mesh_data.add_point((x, 0, z))
+    points = np.zeros((row_points, column_points, 3), dtype=np.float32)
+    points[:, :, 0] = np.arange(column_points) * col_spacing - width / 2
+    points[:, :, 2] = (np.arange(row_points) * row_spacing - height / 2)[:, np.newaxis]
 
-    # Define faces using the indices of the grid points
-    for row_point in range(row_points - 1):
-        for column_point in range(column_points - 1):
-            # Calculate the indices of the corners of the cell
-            top_left = row_point * column_points + column_point
-            top_right = top_left + 1
-            bottom_left = top_left + column_points
-            bottom_right = bottom_left + 1
+    # Define faces using the indices of the 4 corners of each cell
+    top_left, top_right, bottom_left, bottom_right = get_grid_quads(row_points - 1, column_points - 1, column_points)
+    face_vertex_indices = np.stack((top_left, top_right, bottom_right, bottom_left), axis=-1)
 
-            # Define the face using the indices of the 4 corners
-            mesh_data.add_face(4, [top_left, top_right, bottom_right, bottom_left])
+    face_vertex_counts = np.full((row_points - 1) * (column_points - 1), 4, dtype=np.int32)
 
-    return mesh_data
+    return MeshData(points, face_vertex_counts, face_vertex_indices)
 
 
 def sphere(h_points, v_points):
     """
-    Create polygonal sphere
+    Create polygonal sphere, faces are wound for left-handed orientation (left-hand normals point outward)
     """
 
-    mesh_data = MeshData()
+    # Crate sphere points: top pole, rows (range excludes poles), bottom pole
+    v_angles = np.arange(1, v_points - 1) * math.pi / (v_points - 1)
+    h_angles = 2 * np.arange(h_points) * math.pi / h_points
 
-    # Crate sphere points
-    # Top pole
-    top_pole_position = get_cartesian_position(0, 0)
-    mesh_data.add_point(top_pole_position)
+    points = np.empty(((v_points - 2) * h_points + 2, 3), dtype=np.float32)
+    points[0] = get_cartesian_position(0, 0)
+    rows = points[1:-1].reshape(v_points - 2, h_points, 3)
+    for axis, position in enumerate(get_cartesian_position(h_angles, v_angles[:, np.newaxis])):
+        rows[:, :, axis] = position
+    points[-1] = get_cartesian_position(0, math.pi)
 
-    for v_point in range(1, v_points - 1):  # Range excludes poles
-        v_angle = v_point * 3.14 / (v_points - 1)
+    # Create sphere faces: top pole triangles, main body quads, bottom pole triangles
+    face_vertex_counts = np.full(h_points * (v_points - 1), 4, dtype=np.int32)
+    face_vertex_counts[:h_points] = 3
+    face_vertex_counts[-h_points:] = 3
 
-        for h_point in range(h_points):
-            h_angle = 2 * h_point * 3.14 / h_points
+    face_vertex_indices = np.empty(h_points * 6 + h_points * (v_points - 3) * 4, dtype=np.int32)
+    top_faces = face_vertex_indices[:h_points * 3].reshape(h_points, 3)
+    body_faces = face_vertex_indices[h_points * 3:-h_points * 3].reshape(v_points - 3, h_points, 4)
+    bottom_faces = face_vertex_indices[-h_points * 3:].reshape(h_points, 3)
 
-            position = get_cartesian_position(h_angle, v_angle)
-            mesh_data.add_point(position)
+    h_indices = np.arange(h_points, dtype=np.int32)
+    next_h_indices = (h_indices + 1) % h_points
 
-    # Bottom pole
-    bottom_pole_position = get_cartesian_position(0, 3.142)
-    mesh_data.add_point(bottom_pole_position)
-
-    # Create sphere faces
     # Top pole faces
     top_pole_index = 0
     first_row_start = 1
-    for h_point in range(h_points):
-        next_point = (h_point + 1) % h_points
-        mesh_data.add_face(3, [top_pole_index, first_row_start + h_point, first_row_start + next_point])
+    top_faces[:, 0] = top_pole_index
+    top_faces[:, 1] = first_row_start + h_indices
+    top_faces[:, 2] = first_row_start + next_h_indices
 
     # Main body faces (quads)
-    for v_point in range(1, v_points - 2):
-        row_start = 1 + (v_point - 1) * h_points
-        next_row_start = row_start + h_points
-        for h_point in range(h_points):
-            next_point = (h_point + 1) % h_points
-            mesh_data.add_face(4, [next_row_start + h_point, next_row_start + next_point, row_start + next_point, row_start + h_point])
+    row_start, row_next, next_row_start, next_row_next = get_grid_quads(v_points - 3, h_points, h_points, True)
+    for corner, indices in enumerate((next_row_start, next_row_next, row_next, row_start)):
+        body_faces[:, :, corner] = indices + first_row_start
 
     # Bottom pole faces
-    bottom_pole_index = len(mesh_data.points) - 1
+    bottom_pole_index = len(points) - 1
     last_row_start = 1 + (v_points - 3) * h_points
-    for h_point in range(h_points):
-        next_point = (h_point + 1) % h_points
-        mesh_data.add_face(3, [bottom_pole_index, last_row_start + next_point, last_row_start + h_point])
+    bottom_faces[:, 0] = bottom_pole_index
+    bottom_faces[:, 1] = last_row_start + next_h_indices
+    bottom_faces[:, 2] = last_row_start + h_indices
 
-    return mesh_data
+    return MeshData(points, face_vertex_counts, face_vertex_indices)
 
 
 def torus(h_points, v_points, radius, thickness):
     """
-    Create poly donut
+    Create poly donut, faces are wound for right-handed orientation (right-hand normals point outward),
+    unlike other shapes
     """
 
-    mesh_data = MeshData()
-
     # Create torus points
-    for h_point in range(h_points):
-        for v_point in range(v_points):
-            u = (v_point * 2 * math.pi) / v_points  # Angle around the ring
-            v = (h_point * 2 * math.pi) / h_points  # Angle around the tube
-
-            x = (radius + thickness * math.cos(v)) * math.cos(u)
-            y = (radius + thickness * math.cos(v)) * math.sin(u)
-            z = thickness * math.sin(v)
-
-            position = (x, y, z)
-            mesh_data.add_point(position)
+    u = (np.arange(v_points) * 2 * math.pi) / v_points  # Angle around the ring
+    v = (np.arange(h_points)[:, np.newaxis] * 2 * math.pi) / h_points  # Angle around the tube
 
-    # Create torus faces
-    for h_point in range(h_points):
-        h_next = (h_point + 1) % h_points
-        for v_point in range(v_points):
-            v_next = (v_point + 1) % v_points
+    points = np.empty((h_points, v_points, 3), dtype=np.float32)
+    points[:, :, 0] = (radius + thickness * np.cos(v)) * np.cos(u)
+    points[:, :, 1] = (radius + thickness * np.cos(v)) * np.sin(u)
+    points[:, :, 2] = thickness * np.sin(v)
 
-            top_left = h_point * v_points + v_point
-            top_right = h_point * v_points + v_next
-            bottom_left = h_next * v_points + v_next
-            bottom_right = h_next * v_points + v_point
+    # Create torus faces, last row of faces is connected to the first row of points
+    top_left, top_right, bottom_right, bottom_left = get_grid_quads(h_points, v_points, v_points, True)
+    face_vertex_indices = np.stack((top_left, top_right, bottom_left, bottom_right), axis=-1)
+    face_vertex_indices[-1] %= h_points * v_points
 
-            mesh_data.add_face(4, [top_left, top_right, bottom_left, bottom_right])
-
-    return mesh_data
+    return MeshData(points, np.full(h_points * v_points, 4, dtype=np.int32), face_vertex_indices)
 
 
 def cone(resolution):
     """
-    Create poly cone
+    Create poly cone, faces are wound for left-handed orientation (left-hand normals point outward).
+    Last side triangle connects last base point to the first one, loop version of the cone had
+    degenerate last triangle [resolution - 1, resolution, resolution] and a hole in the side. Bottom face goes through
+    base points in reverse order, loop version had it wound opposite to side faces (normal pointed into the cone).
     """
 
-    mesh_data = MeshData()
-
-    # Create cone points
-    for point in range(resolution):
-        angle = 2.0 * 3.14 * point / resolution
-        x = math.cos(angle)
-        z = math.sin(angle)
-        mesh_data.add_point((x, 0, z))
-
-    # Add tip
-    mesh_data.add_point((0, 2, 0))
+    # Create cone points and tip
+    angles = 2.0 * math.pi * np.arange(resolution) / resolution
+    points = np.zeros((resolution + 1, 3), dtype=np.float32)
+    points[:-1, 0] = np.cos(angles)
+    points[:-1, 2] = np.sin(angles)
+    points[-1] = (0, 2, 0)
 
-    # Crete cone faces
-    for point in range(resolution):
-        triangle = [point, point + 1, resolution]
-        mesh_data.add_face(3, triangle)
+    # Crete cone faces: side triangles and bottom face
+    base_indices = np.arange(resolution)
+    triangles = np.stack((base_indices, (base_indices + 1) % resolution, np.full(resolution, resolution)), axis=-1)
 
-    # Bottom face
-    mesh_data.add_face(resolution, [i for i in range(resolution)])
+    face_vertex_counts = np.append(np.full(resolution, 3), resolution)
+    face_vertex_indices = np.concatenate((triangles.reshape(-1), base_indices[::-1]))
 
-    return mesh_data
+    return MeshData(points, face_vertex_counts, face_vertex_indices)
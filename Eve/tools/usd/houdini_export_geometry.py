@@ -62,18 +62,23 @@ def get_material_path(geometry):
         return material_path
 
 
-def setup_mesh(mesh, points, normals, face_vertex_counts, face_vertex_indices):
+def setup_mesh(mesh, points, normals, face_vertex_counts, face_vertex_indices,
+               interpolation=UsdGeom.Tokens.faceVarying):
     """
     Setup mesh attributes in USD file
+
+    :param normals: list or array of normals, empty or None to skip normals
+    :param interpolation: normals interpolation, UsdGeom.Tokens.faceVarying (per face vertex) or UsdGeom.Tokens.vertex
     """
 
     mesh.GetPointsAttr().Set(points)
     mesh.GetFaceVertexCountsAttr().Set(face_vertex_counts)
     mesh.GetFaceVertexIndicesAttr().Set(face_vertex_indices)
 
-    if normals:
+    # len() instead of truth test, normals can be a numpy array
+    if normals is not None and len(normals):
         mesh.CreateNormalsAttr().Set(normals)
-        mesh.SetNormalsInterpolation(UsdGeom.Tokens.faceVarying)
+        mesh.SetNormalsInterpolation(interpolation)
 
     # Set orientation and subdivisionScheme
     mesh.CreateOrientationAttr().Set(UsdGeom.Tokens.leftHanded)